@@ -2,6 +2,7 @@ import {
     WorkerMessageType,
     WorkerMessage,
     CallbackRequestMessage,
+    BackgroundSubscribeMessage,
     GetPropsResponseMessage,
     SetPropsMessage,
     GetPropsRequestMessage,
@@ -57,6 +58,10 @@ export class MessageRouter {
                 this.forwardGetPropsResponse(rendererId, message as GetPropsResponseMessage);
                 break;
 
+            case WorkerMessageType.BACKGROUND_SUBSCRIBE:
+                this.forwardBackgroundSubscribe(rendererId, message as BackgroundSubscribeMessage);
+                break;
+
             default:
                 console.warn(`Unknown message type from renderer: ${message.type}`);
         }
@@ -82,6 +87,10 @@ export class MessageRouter {
                 this.forwardToRenderer(rendererId, msg as CallbackResponseMessage);
                 break;
 
+            case WorkerMessageType.BACKGROUND_DONE:
+                this.forwardToRenderer(rendererId, msg);
+                break;
+
             case WorkerMessageType.SET_PROPS:
                 this.forwardSetProps(rendererId, msg as SetPropsMessage);
                 break;
@@ -238,6 +247,20 @@ export class MessageRouter {
         }
     }
 
+    private forwardBackgroundSubscribe(
+        rendererId: string,
+        message: BackgroundSubscribeMessage
+    ): void {
+        if (this.sendToServer) {
+            this.sendToServer({
+                type: WorkerMessageType.BACKGROUND_SUBSCRIBE,
+                rendererId,
+                requestId: message.requestId,
+                payload: message.payload
+            });
+        }
+    }
+
     private forwardGetPropsResponse(rendererId: string, message: GetPropsResponseMessage): void {
         if (this.sendToServer) {
             this.sendToServer({
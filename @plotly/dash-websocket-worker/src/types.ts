@@ -8,6 +8,7 @@ export enum WorkerMessageType {
     CALLBACK_REQUEST = 'callback_request',
     GET_PROPS_RESPONSE = 'get_props_response',
     TAB_VISIBLE = 'tab_visible',
+    BACKGROUND_SUBSCRIBE = 'background_subscribe',
 
     // Worker -> Renderer
     CONNECTED = 'connected',
@@ -16,6 +17,7 @@ export enum WorkerMessageType {
     SET_PROPS = 'set_props',
     SET_PROPS_BATCH = 'set_props_batch',
     GET_PROPS_REQUEST = 'get_props_request',
+    BACKGROUND_DONE = 'background_done',
     ERROR = 'error',
 
     // Server -> Worker (not forwarded to renderer)
@@ -83,6 +85,26 @@ export interface CallbackResponseMessage extends WorkerMessage {
     };
 }
 
+/**
+ * Message from renderer to worker asking the server to push the progress,
+ * set_props and completion of a background callback job.
+ */
+export interface BackgroundSubscribeMessage extends WorkerMessage {
+    type: WorkerMessageType.BACKGROUND_SUBSCRIBE;
+    payload: {
+        output: string;
+        cacheKey: string;
+        job: string;
+    };
+}
+
+/**
+ * Message from worker to renderer when a watched background job is done.
+ */
+export interface BackgroundDoneMessage extends WorkerMessage {
+    type: WorkerMessageType.BACKGROUND_DONE;
+}
+
 /**
  * Message from worker to renderer to set component props.
  */
@@ -161,6 +183,8 @@ export type AnyWorkerMessage =
     | DisconnectMessage
     | CallbackRequestMessage
     | CallbackResponseMessage
+    | BackgroundSubscribeMessage
+    | BackgroundDoneMessage
     | SetPropsMessage
     | SetPropsBatchMessage
     | GetPropsRequestMessage
@@ -28,8 +28,10 @@ from ._get_paths import (  # noqa: F401,E402
 )
 from ._no_update import NoUpdate  # noqa: F401,E402
 from .background_callback import (  # noqa: F401,E402
+    AsyncioManager,
     CeleryManager,
     DiskcacheManager,
+    JobQueue,
 )
 from ._utils import stringify_id  # noqa: F401,E402
 
@@ -41,6 +43,13 @@ from .dash import (  # noqa: F401,E402
     page_container,
 )
 from ._patch import Patch  # noqa: F401,E402
+from ._static import static  # noqa: F401,E402
+from ._memoize import (  # noqa: F401,E402
+    LRUMemoizeStore,
+    DiskcacheMemoizeStore,
+    RedisMemoizeStore,
+)
+from ._auto_patch import AutoPatchStore  # noqa: F401,E402
 from ._jupyter import jupyter_dash  # noqa: F401,E402
 
 from ._hooks import hooks  # noqa: F401,E402
@@ -81,8 +90,10 @@ __all__ = [
     "get_asset_url",
     "get_relative_path",
     "strip_relative_path",
+    "AsyncioManager",
     "CeleryManager",
     "DiskcacheManager",
+    "JobQueue",
     "register_page",
     "page_registry",
     "Dash",
@@ -90,6 +101,11 @@ __all__ = [
     "NoUpdate",
     "page_container",
     "Patch",
+    "static",
+    "LRUMemoizeStore",
+    "DiskcacheMemoizeStore",
+    "RedisMemoizeStore",
+    "AutoPatchStore",
     "jupyter_dash",
     "ctx",
     "hooks",
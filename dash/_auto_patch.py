@@ -0,0 +1,217 @@
+"""
+Automatic patches of the callback outputs, ``callback(auto_patch=True)``.
+
+The value sent for each output is kept on the server under a random token
+returned with the response (``patchBases``). While the output still holds that
+value, the renderer sends the token back with the next request of the
+callback: the new value is diffed against the kept one and sent as the
+``Patch`` operations when they are smaller than the value. The renderer
+applies them only if the output still holds that value when the response
+arrives, else it requests the full value.
+
+The decoded values are kept in the memory of the process, the last value of
+each output per page (the session sent with the request generation), see
+``AutoPatchStore`` for the limits. A request without a known token (first
+call, value changed by another callback or by the user, page dropped from the
+store, request served by another process...) gets the full value.
+"""
+import collections
+import json
+import threading
+import uuid
+from typing import Optional
+
+from ._patch import _operation
+from ._typed_arrays import _is_spec
+from ._utils import to_json
+
+# Pages whose values are kept, and the total size of their JSON, per callback.
+MAX_SESSIONS = 1024
+MAX_BYTES = 256 * 1024 * 1024
+
+
+class AutoPatchStore:
+    """
+    The last values sent for the outputs of a callback, per page, with
+    ``callback(auto_patch=AutoPatchStore(...))`` to change the limits.
+
+    :param max_sessions: Pages whose values are kept, the pages least
+        recently updated are dropped first.
+    :param max_bytes: Total size of the JSON of the values kept, the pages
+        least recently updated are dropped first.
+    """
+
+    def __init__(self, max_sessions=MAX_SESSIONS, max_bytes=MAX_BYTES):
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        # {prop_id: (token, decoded value, size of its JSON)} by session.
+        self._sessions = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, session, prop_id, value, size):
+        """
+        Keep ``value`` as the last value of ``prop_id`` for ``session``,
+        None if its JSON is larger than the store.
+        """
+        if size > self.max_bytes:
+            return None
+        token = uuid.uuid4().hex
+        with self._lock:
+            values = self._sessions.pop(session, {})
+            self._sessions[session] = values
+            _, _, previous = values.get(prop_id, (None, None, 0))
+            values[prop_id] = (token, value, size)
+            self.nbytes += size - previous
+            while (
+                len(self._sessions) > self.max_sessions or self.nbytes > self.max_bytes
+            ):
+                _, dropped = self._sessions.popitem(last=False)
+                self.nbytes -= sum(entry[2] for entry in dropped.values())
+        return token
+
+    def pop(self, session, prop_id, token):
+        """The last value of ``prop_id`` for ``session`` if it has ``token``."""
+        # A value is the base of one response, the renderer then holds the
+        # value of that response.
+        with self._lock:
+            values = self._sessions.get(session, {})
+            entry = values.get(prop_id)
+            if entry is None or entry[0] != token:
+                return None
+            del values[prop_id]
+            self.nbytes -= entry[2]
+            return entry[1]
+
+
+def get_auto_patch_store(auto_patch) -> Optional[AutoPatchStore]:
+    if auto_patch is None or auto_patch is False:
+        return None
+    if auto_patch is True:
+        return AutoPatchStore()
+    if isinstance(auto_patch, AutoPatchStore):
+        return auto_patch
+    raise TypeError(
+        f"auto_patch must be a bool or an AutoPatchStore, got {auto_patch!r}"
+    )
+
+
+def _is_patch(value):
+    return isinstance(value, dict) and "__dash_patch_update" in value
+
+
+def _is_object(value):
+    # Typed array specs are replaced by typed arrays in the renderer.
+    return isinstance(value, dict) and not ("bdata" in value and _is_spec(value))
+
+
+def _same(old, new):
+    return type(old) is type(new) and old == new
+
+
+def _diff(old, new, location, operations):
+    if _is_object(old) and _is_object(new):
+        for key in old:
+            if key not in new:
+                operations.append(_operation("Delete", location + [key]))
+        for key, value in new.items():
+            if key not in old:
+                operations.append(_operation("Assign", location + [key], value=value))
+            elif not _same(old[key], value):
+                _diff(old[key], value, location + [key], operations)
+    elif isinstance(old, list) and isinstance(new, list):
+        _diff_list(old, new, location, operations)
+    else:
+        operations.append(_operation("Assign", location, value=new))
+
+
+def _diff_list(old, new, location, operations):
+    if len(old) == len(new):
+        changed = [
+            index
+            for index, (old_item, new_item) in enumerate(zip(old, new))
+            if not _same(old_item, new_item)
+        ]
+        # Lists of values mostly changed may be a shifted window.
+        if len(changed) * 2 <= len(new) or any(
+            isinstance(new[index], (dict, list)) for index in changed
+        ):
+            for index in changed:
+                _diff(old[index], new[index], location + [index], operations)
+            return
+
+    shift = _find_shift(old, new)
+    kept = 0 if shift is None else min(len(old) - shift, len(new))
+    removed = len(old) - kept
+    if shift is None or removed > kept:
+        operations.append(_operation("Assign", location, value=new))
+        return
+    # Items removed at the start (sliding window) or at the end,
+    # then added at the end.
+    operations.extend(_operation("Delete", location + [0]) for _ in range(shift))
+    operations.extend(
+        _operation("Delete", location + [kept]) for _ in range(removed - shift)
+    )
+    if len(new) > kept:
+        operations.append(_operation("Extend", location, value=new[kept:]))
+
+
+def _find_shift(old, new):
+    """The items removed from the start of ``old`` so it begins like ``new``."""
+    shifts = [0]
+    if new:
+        first = next(
+            (index for index in range(1, len(old)) if _same(old[index], new[0])),
+            None,
+        )
+        if first is not None:
+            shifts.append(first)
+    for shift in shifts:
+        kept = min(len(old) - shift, len(new))
+        if all(_same(a, b) for a, b in zip(old[shift : shift + kept], new)):
+            return shift
+    return None
+
+
+def diff(old, new):
+    """
+    The patch turning the JSON value ``old`` into ``new``, None if they can't
+    be patched (different types, scalars).
+    """
+    if not (
+        (_is_object(old) and _is_object(new))
+        or (isinstance(old, list) and isinstance(new, list))
+    ):
+        return None
+    operations = []
+    _diff(old, new, [], operations)
+    return {"__dash_patch_update": "__dash_patch_update", "operations": operations}
+
+
+def patch_response(response, callback_ctx, bases, typed_arrays=False):
+    """
+    Replace the output values of a callback response by the patches of the
+    values the renderer holds, and keep the values sent for the next request.
+    """
+    received = callback_ctx.get("patch_bases") or {}
+    session = callback_ctx.get("page_session")
+    sent = {}
+    for component_id, props in response.get("response", {}).items():
+        for prop, value in props.items():
+            if _is_patch(value):
+                continue
+            prop_id = f"{component_id}.{prop}"
+            encoded = to_json(value, typed_arrays=typed_arrays)
+            props[prop] = new = json.loads(encoded)
+
+            token = received.get(prop_id)
+            old = bases.pop(session, prop_id, token)
+            if old is not None:
+                patch = diff(old, new)
+                if patch is not None and len(to_json(patch)) < len(encoded):
+                    props[prop] = patch
+            token = bases.add(session, prop_id, new, len(encoded))
+            if token is not None:
+                sent[prop_id] = token
+    if sent:
+        response["patchBases"] = sent
@@ -1,7 +1,11 @@
+import asyncio
 import collections
+import concurrent.futures
 import hashlib
 import inspect
+import threading
 import warnings
+from contextvars import copy_context
 from functools import wraps
 from typing import Callable, Optional, Any, List, Tuple, Union, Dict, TypeVar, cast
 
@@ -38,11 +42,17 @@ from ._utils import (
     clean_property_name,
 )
 
-from .background_callback.managers import BaseBackgroundCallbackManager
-from ._callback_context import context_value
+from .background_callback.managers import BaseBackgroundCallbackManager, JobQueue
+from ._callback_context import LazyContext, context_value
 from .types import CallbackExecutionResponse
 from ._no_update import NoUpdate
+from ._dispatch_plan import DispatchPlan
+from ._streaming import JSONStream
 from . import _validate
+from . import _coalesce
+from . import _auto_patch
+from . import _generation
+from . import _memoize
 
 
 async def _async_invoke_callback(
@@ -89,6 +99,13 @@ def callback(
     persistent: Optional[bool] = False,
     mcp_enabled: Optional[bool] = None,
     mcp_expose_docstring: Optional[bool] = None,
+    memoize: Union[bool, _memoize.BaseMemoizeStore] = False,
+    parallel: bool = False,
+    coalesce: Optional[bool] = None,
+    stream_response: bool = False,
+    auto_patch: Union[bool, _auto_patch.AutoPatchStore] = False,
+    executor: Optional[str] = None,
+    queue: Optional[JobQueue] = None,
     **_kwargs,
 ) -> Callable[[Callable[Params, ReturnVar]], Callable[Params, ReturnVar]]:
     """
@@ -115,7 +132,7 @@ def callback(
             or timing out.
         :param manager:
             A background callback manager instance. Currently, an instance of one of
-            `DiskcacheManager` or `CeleryManager`.
+            `DiskcacheManager`, `CeleryManager` or `AsyncioManager`.
             Defaults to the `background_callback_manager` instance provided to the
             `dash.Dash constructor`.
             - A diskcache manager (`DiskcacheManager`) that runs callback
@@ -125,6 +142,9 @@ def callback(
             - A Celery manager (`CeleryManager`) that runs callback logic
               in a celery worker and returns results to the Dash app through a Celery
               broker like RabbitMQ or Redis.
+            - An asyncio manager (`AsyncioManager`) that runs callback logic
+              as tasks on an event loop of the server process and keeps the
+              results in memory, for callbacks awaiting I/O.
         :param running:
             A list of 3-element tuples. The first element of each tuple should be
             an `Output` dependency object referencing a property of a component in
@@ -187,6 +207,67 @@ def callback(
             If True, this callback will not show the "Updating..." title while
             running. Useful for persistent WebSocket callbacks that stay active
             for long periods without requiring a loading indicator.
+        :param memoize:
+            Reuse the result of a previous call with the same input and state
+            values instead of running the function again. `True` keeps the
+            results in memory (`LRUMemoizeStore()`), or give a store instance:
+            `LRUMemoizeStore(maxsize, ttl)`, `DiskcacheMemoizeStore(cache, expire)`
+            or `RedisMemoizeStore(client, expire)`. The function must only
+            depend on its arguments, `set_props` calls are replayed with the
+            result. This parameter does not apply to background callbacks,
+            use the manager `cache_by` instead.
+        :param parallel:
+            Compute the outputs concurrently. The function returns, in place
+            of the value of an output (or of an output group), a function
+            without arguments computing it. These functions are run on a
+            thread pool, async ones are gathered on the event loop, and their
+            results make up the callback output. They see the same callback
+            context, e.g. for `set_props`. Not supported for background
+            callbacks.
+        :param coalesce:
+            Make the identical calls (same input and state values) arriving
+            while one is running wait for its result instead of running the
+            function again. Defaults to the `coalesce_callbacks` argument of
+            `dash.Dash`. Calls reading the request cookies, headers... or
+            setting the response through the callback context are never
+            shared, set `coalesce=False` if the function reads the request
+            another way. Not supported for background callbacks.
+        :param stream_response:
+            Encode the response while it is sent, by chunks, instead of
+            building the whole JSON string in memory first. Meant for very
+            large outputs (e.g. table exports), it lowers the peak memory and
+            the first bytes are sent earlier. The values are checked before
+            sending, a value that can't be encoded gets an error response.
+            The response is streamed by the HTTP callback endpoint of the
+            Flask, FastAPI and Quart backends.
+        :param auto_patch:
+            Send the changes of the outputs instead of their full value: the
+            value sent for each output is kept and the next value returned is
+            diffed against it, the renderer gets the `Patch` operations when
+            they are smaller than the value. Meant for large outputs where
+            little changes between calls (e.g. live-updating figures). The
+            last value of each output is kept per page, in the memory of the
+            server process, the full value is sent when the output was
+            changed in between (by another callback or the user), the page
+            was dropped from the store or the request is served by another
+            process. `True` keeps the values of up to 1024 pages and 256 MB
+            of JSON, pass an `AutoPatchStore(max_sessions, max_bytes)` to
+            change the limits. Not supported for background and WebSocket
+            callbacks.
+        :param executor:
+            Name of the thread pool running this callback when it is sync,
+            declared with the `callback_executors` argument of `dash.Dash`.
+            Used to separate CPU-heavy and I/O-bound callbacks. The pools are
+            used by the async backends (FastAPI, Quart), the batched requests
+            and the WebSocket transport. Not supported for background
+            callbacks.
+        :param queue:
+            A `JobQueue` limiting the number of jobs of the callback running
+            at once, per callback, per session and for the whole queue, and
+            setting their priority. Jobs over a limit wait for a running job
+            to end. Enforced by `DiskcacheManager` and `CeleryManager`. This
+            parameter only applies to background callbacks
+            (`background=True`).
     """
 
     background_spec: Any = None
@@ -197,6 +278,27 @@ def callback(
     callback_map = _kwargs.pop("callback_map", GLOBAL_CALLBACK_MAP)
     callback_list = _kwargs.pop("callback_list", GLOBAL_CALLBACK_LIST)
 
+    if background and memoize:
+        raise ValueError(
+            "memoize is not supported for background callbacks, "
+            "use the `cache_by` argument of the manager instead."
+        )
+
+    if background and parallel:
+        raise ValueError("parallel is not supported for background callbacks.")
+
+    if background and coalesce:
+        raise ValueError("coalesce is not supported for background callbacks.")
+
+    if background and auto_patch:
+        raise ValueError("auto_patch is not supported for background callbacks.")
+
+    if background and executor:
+        raise ValueError("executor is not supported for background callbacks.")
+
+    if queue is not None and not background:
+        raise ValueError("queue only applies to background callbacks.")
+
     if background:
         background_spec = {
             "interval": interval,
@@ -231,6 +333,9 @@ def callback(
 
         background_spec["cache_ignore_triggered"] = cache_ignore_triggered
 
+        if queue is not None:
+            background_spec["queue"] = queue
+
     raw = register_callback(
         callback_list,
         callback_map,
@@ -248,6 +353,12 @@ def callback(
         persistent=persistent,
         mcp_enabled=mcp_enabled,
         mcp_expose_docstring=mcp_expose_docstring,
+        memoize=memoize,
+        parallel=parallel,
+        coalesce=coalesce,
+        stream_response=stream_response,
+        auto_patch=auto_patch,
+        executor=executor,
     )
 
     return cast(
@@ -303,6 +414,7 @@ def insert_callback(
     persistent=False,
     mcp_enabled=None,
     mcp_expose_docstring=None,
+    executor=None,
 ) -> str:
     if prevent_initial_call is None:
         prevent_initial_call = config_prevent_initial_callbacks
@@ -342,18 +454,137 @@ def insert_callback(
         "background": background,
         "output": output,
         "raw_inputs": inputs,
+        "raw_state": state,
         "manager": manager,
         "allow_dynamic_callbacks": dynamic_creator,
         "no_output": no_output,
         "websocket": websocket,
         "mcp_enabled": mcp_enabled,
         "mcp_expose_docstring": mcp_expose_docstring,
+        "executor": executor,
+        "plan": DispatchPlan(inputs, state, inputs_state_indices, outputs_indices),
     }
     callback_list.append(callback_spec)
 
     return callback_id
 
 
+def _get_memoized(store, key, callback_ctx):
+    cached = store.get(key)
+    if cached is _memoize.MISSING:
+        return _memoize.MISSING
+    output_value, side_update = cached
+    # Replay the set_props of the memoized call.
+    for _id, props in side_update.items():
+        callback_ctx.updated_props[_id] = props
+    return output_value
+
+
+def _set_memoized(store, key, callback_ctx, output_value):
+    store.set(key, (output_value, dict(callback_ctx.updated_props)))
+
+
+_parallel_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_parallel_executor_lock = threading.Lock()
+
+
+def _get_parallel_executor():
+    # Not the backend callback executor: the callback waits for its output
+    # functions, running them on its own pool could exhaust it.
+    global _parallel_executor  # pylint: disable=global-statement
+    with _parallel_executor_lock:
+        if _parallel_executor is None:
+            _parallel_executor = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix="dash-parallel-"
+            )
+    return _parallel_executor
+
+
+def _map_output_functions(value, schema, fn, match=callable):
+    """
+    Replace the values matching `match` (the functions returned in place of
+    an output or an output group) by `fn(value)`, following the output schema.
+    """
+    if match(value):
+        return fn(value)
+    if isinstance(schema, (list, tuple)) and isinstance(value, (list, tuple)):
+        if len(value) != len(schema):
+            return value
+        return [
+            _map_output_functions(v, sch, fn, match) for v, sch in zip(value, schema)
+        ]
+    if isinstance(schema, dict) and isinstance(value, dict):
+        return {
+            k: _map_output_functions(v, schema.get(k), fn, match)
+            for k, v in value.items()
+        }
+    return value
+
+
+def _call_output_function(fn):
+    result = fn()
+    if inspect.iscoroutine(result):
+        return asyncio.run(result)
+    return result
+
+
+def _run_parallel(output_value, schema):
+    """Run the output functions of a `parallel=True` callback on a thread pool."""
+    executor = _get_parallel_executor()
+    futures = []
+
+    def submit(fn):
+        future = executor.submit(copy_context().run, _call_output_function, fn)
+        futures.append(future)
+        return future
+
+    output_value = _map_output_functions(output_value, schema, submit)
+    if not futures:
+        return output_value
+
+    concurrent.futures.wait(futures)
+    return _map_output_functions(
+        output_value,
+        schema,
+        lambda future: future.result(),
+        lambda v: isinstance(v, concurrent.futures.Future),
+    )
+
+
+async def _async_run_parallel(output_value, schema):
+    """
+    Run the output functions of a `parallel=True` callback, coroutine
+    functions are gathered on the event loop and the others run on a thread pool.
+    """
+    loop = asyncio.get_running_loop()
+    tasks = []
+
+    def schedule(fn):
+        if inspect.iscoroutinefunction(fn):
+            task = asyncio.ensure_future(fn())
+        else:
+            task = loop.run_in_executor(
+                _get_parallel_executor(),
+                copy_context().run,
+                _call_output_function,
+                fn,
+            )
+        tasks.append(task)
+        return task
+
+    output_value = _map_output_functions(output_value, schema, schedule)
+    if not tasks:
+        return output_value
+
+    await asyncio.wait(tasks)
+    return _map_output_functions(
+        output_value,
+        schema,
+        lambda task: task.result(),
+        lambda v: isinstance(v, asyncio.Future),
+    )
+
+
 def _set_side_update(ctx, response) -> bool:
     side_update = dict(ctx.updated_props)
     if len(side_update) > 0:
@@ -434,7 +665,11 @@ def _setup_background_callback(
         None if cache_ignore_triggered else callback_ctx.get("triggered_inputs", []),
     )
     job_fn = callback_manager.func_registry.get(background_key)
-    ctx_value = AttributeDict(**context_value.get())
+    current_ctx = context_value.get()
+    if isinstance(current_ctx, LazyContext):
+        # The job runs out of the request.
+        current_ctx.resolve()
+    ctx_value = AttributeDict(**current_ctx)
     ctx_value.ignore_register_page = True
     ctx_value.pop("background_callback_manager")
     ctx_value.pop("dash_response")
@@ -443,12 +678,15 @@ def _setup_background_callback(
     if args_value is not None and not isinstance(args_value, dict):
         ctx_value["args"] = dict(args_value)
 
-    job = callback_manager.call_job_fn(
-        cache_key,
-        job_fn,
-        func_args if func_args else func_kwargs,
-        ctx_value,
-    )
+    job_args = (cache_key, job_fn, func_args if func_args else func_kwargs, ctx_value)
+    queue = background.get("queue")
+    if queue is None:
+        job = callback_manager.call_job_fn(*job_args)
+    else:
+        session = queue.session() if queue.session else None
+        job = callback_manager.call_job_fn(
+            *job_args, queue=queue.spec(background_key, session)
+        )
 
     data = {
         "cacheKey": cache_key,
@@ -467,21 +705,12 @@ def _setup_background_callback(
     return to_json(data)
 
 
-def _progress_background_callback(
-    response, callback_manager, background, cache_key=None
-):
+def _progress_background_callback(response, background, progress):
     progress_outputs = background.get("progress")
-    if cache_key is None:
-        adapter = get_app().backend.request_adapter()
-        cache_key = adapter.args.get("cacheKey")
-
-    if progress_outputs:
-        # Get the progress before the result as it would be erased after the results.
-        progress = callback_manager.get_progress(cache_key)
-        if progress:
-            response["progress"] = {
-                str(x): progress[i] for i, x in enumerate(progress_outputs)
-            }
+    if progress_outputs and progress:
+        response["progress"] = {
+            str(x): progress[i] for i, x in enumerate(progress_outputs)
+        }
 
 
 def _update_background_callback(
@@ -502,41 +731,34 @@ def _update_background_callback(
         cache_key = cache_key or (adapter.args.get("cacheKey") if adapter else None)
         job_id = job_id or (adapter.args.get("job") if adapter else None)
 
-    _progress_background_callback(
-        response, callback_manager, background, cache_key=cache_key
-    )
+    # Progress, result, set_props and liveness in one read of the backend.
+    job_state = callback_manager.poll(cache_key, job_id)
 
-    output_value = callback_manager.get_result(cache_key, job_id)
+    _progress_background_callback(response, background, job_state.progress)
 
     return _handle_rest_background_callback(
-        output_value,
+        job_state,
         callback_manager,
         response,
         error_handler,
         callback_ctx,
         multi,
-        cache_key=cache_key,
         job_id=job_id,
     )
 
 
 def _handle_rest_background_callback(
-    output_value,
+    job_state,
     callback_manager,
     response,
     error_handler,
     callback_ctx,
     multi,
     has_update=False,
-    cache_key=None,
     job_id=None,
 ):
-    if cache_key is None or job_id is None:
-        adapter = get_app().backend.request_adapter()
-        cache_key = cache_key or (adapter.args.get("cacheKey") if adapter else None)
-        job_id = job_id or (adapter.args.get("job") if adapter else None)
-    # Must get job_running after get_result since get_results terminates it.
-    job_running = callback_manager.job_running(job_id)
+    output_value = job_state.result
+    job_running = job_state.running
     if not job_running and output_value is callback_manager.UNDEFINED:
         # Job canceled -> no output to close the loop.
         output_value = NoUpdate()
@@ -568,7 +790,7 @@ def _handle_rest_background_callback(
         output_value = [
             NoUpdate() if NoUpdate.is_no_update(r) else r for r in output_value
         ]
-    updated_props = callback_manager.get_updated_props(cache_key)
+    updated_props = job_state.updated_props
     if len(updated_props) > 0:
         response["sideUpdate"] = updated_props
         has_update = True
@@ -693,6 +915,10 @@ def register_callback(
             "runningOff": {str(r[0]): r[2] for r in running},
         }
     allow_dynamic_callbacks = _kwargs.get("_allow_dynamic_callbacks")
+    memoize_store = _memoize.get_memoize_store(_kwargs.get("memoize"))
+    parallel = _kwargs.get("parallel", False)
+    coalesce = _kwargs.get("coalesce")
+    stream_response = _kwargs.get("stream_response", False)
 
     output_indices = make_grouping_by_index(output, list(range(grouping_len(output))))
     callback_id = insert_callback(
@@ -716,6 +942,7 @@ def register_callback(
         persistent=_kwargs.get("persistent", False),
         mcp_enabled=_kwargs.get("mcp_enabled", None),
         mcp_expose_docstring=_kwargs.get("mcp_expose_docstring"),
+        executor=_kwargs.get("executor"),
     )
 
     # pylint: disable=too-many-locals
@@ -733,6 +960,62 @@ def register_callback(
                 callback_id,
             )
 
+        fingerprint = (
+            _memoize.function_fingerprint(func) if memoize_store is not None else None
+        )
+
+        def invoke(func_args, func_kwargs):
+            output_value = _invoke_callback(func, *func_args, **func_kwargs)
+            if parallel:
+                output_value = _run_parallel(output_value, output)
+            return output_value
+
+        async def async_invoke(func_args, func_kwargs):
+            output_value = await _async_invoke_callback(func, *func_args, **func_kwargs)
+            if parallel:
+                output_value = await _async_run_parallel(output_value, output)
+            return output_value
+
+        def run(func_args, func_kwargs, callback_ctx):
+            if memoize_store is None:
+                return invoke(func_args, func_kwargs)
+            memo_key = _memoize.memoize_key(
+                callback_id, fingerprint, func_args, func_kwargs
+            )
+            output_value = _get_memoized(memoize_store, memo_key, callback_ctx)
+            if output_value is _memoize.MISSING:
+                output_value = invoke(func_args, func_kwargs)
+                _set_memoized(memoize_store, memo_key, callback_ctx, output_value)
+            return output_value
+
+        async def async_run(func_args, func_kwargs, callback_ctx):
+            if memoize_store is None:
+                return await async_invoke(func_args, func_kwargs)
+            memo_key = _memoize.memoize_key(
+                callback_id, fingerprint, func_args, func_kwargs
+            )
+            output_value = _get_memoized(memoize_store, memo_key, callback_ctx)
+            if output_value is _memoize.MISSING:
+                output_value = await async_invoke(func_args, func_kwargs)
+                _set_memoized(memoize_store, memo_key, callback_ctx, output_value)
+            return output_value
+
+        flights = _coalesce.SingleFlight()
+        patch_bases = _auto_patch.get_auto_patch_store(_kwargs.get("auto_patch"))
+
+        def coalesced(app, callback_ctx):
+            enabled = (
+                coalesce
+                if coalesce is not None
+                else getattr(app, "_coalesce_callbacks", False)
+            )
+            # WebSocket contexts are bound to their connection.
+            return (
+                enabled
+                and not flights.request_dependent
+                and isinstance(callback_ctx, LazyContext)
+            )
+
         @wraps(func)
         def add_context(*args, **kwargs):
             """Handles synchronous callbacks with context management."""
@@ -771,8 +1054,16 @@ def register_callback(
                     )
                     if skip:
                         return output_value
+                elif coalesced(app, callback_ctx):
+                    output_value = flights.run(
+                        _coalesce.flight_key(
+                            callback_id, func_args, func_kwargs, callback_ctx
+                        ),
+                        callback_ctx,
+                        lambda: run(func_args, func_kwargs, callback_ctx),
+                    )
                 else:
-                    output_value = _invoke_callback(func, *func_args, **func_kwargs)  # type: ignore[reportArgumentType]
+                    output_value = run(func_args, func_kwargs, callback_ctx)
             except PreventUpdate:
                 raise
             except Exception as err:  # pylint: disable=broad-exception-caught
@@ -783,6 +1074,9 @@ def register_callback(
                 else:
                     raise err
 
+            # Don't serialize the result of a superseded request.
+            _generation.raise_if_superseded(callback_ctx)
+
             _prepare_response(
                 output_value,
                 output_spec,
@@ -798,8 +1092,15 @@ def register_callback(
                 callback_id,
                 allow_dynamic_callbacks,
             )
+            typed_arrays = getattr(app, "_binary_arrays", False)
             try:
-                jsonResponse = to_json(response)
+                if patch_bases is not None and "dash_websocket" not in callback_ctx:
+                    _auto_patch.patch_response(
+                        response, callback_ctx, patch_bases, typed_arrays
+                    )
+                if stream_response and callback_ctx.get("can_stream"):
+                    return JSONStream(response, typed_arrays=typed_arrays)
+                jsonResponse = to_json(response, typed_arrays=typed_arrays)
             except TypeError:
                 _validate.fail_callback_output(output_value, output)
 
@@ -842,10 +1143,16 @@ def register_callback(
                     )
                     if skip:
                         return output_value
-                else:
-                    output_value = await _async_invoke_callback(
-                        func, *func_args, **func_kwargs
+                elif coalesced(app, callback_ctx):
+                    output_value = await flights.async_run(
+                        _coalesce.flight_key(
+                            callback_id, func_args, func_kwargs, callback_ctx
+                        ),
+                        callback_ctx,
+                        lambda: async_run(func_args, func_kwargs, callback_ctx),
                     )
+                else:
+                    output_value = await async_run(func_args, func_kwargs, callback_ctx)
             except PreventUpdate:
                 raise
             except Exception as err:  # pylint: disable=broad-exception-caught
@@ -856,6 +1163,9 @@ def register_callback(
                 else:
                     raise err
 
+            # Don't serialize the result of a superseded request.
+            _generation.raise_if_superseded(callback_ctx)
+
             _prepare_response(
                 output_value,
                 output_spec,
@@ -871,8 +1181,15 @@ def register_callback(
                 callback_id,
                 allow_dynamic_callbacks,
             )
+            typed_arrays = getattr(app, "_binary_arrays", False)
             try:
-                jsonResponse = to_json(response)
+                if patch_bases is not None and "dash_websocket" not in callback_ctx:
+                    _auto_patch.patch_response(
+                        response, callback_ctx, patch_bases, typed_arrays
+                    )
+                if stream_response and callback_ctx.get("can_stream"):
+                    return JSONStream(response, typed_arrays=typed_arrays)
+                jsonResponse = to_json(response, typed_arrays=typed_arrays)
             except TypeError:
                 _validate.fail_callback_output(output_value, output)
 
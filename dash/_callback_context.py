@@ -36,6 +36,49 @@ def _get_from_context(key, default):
     return getattr(_get_context_value(), key, default)
 
 
+class LazyContext(AttributeDict):
+    """
+    Callback context whose values in ``loaders`` are computed on first access,
+    so the request cookies, headers... are only read by the callbacks using them.
+
+    ``resolve()`` computes all of them, before the context is copied out of
+    the request (e.g. for a background job).
+    """
+
+    def __init__(self, loaders, **values):
+        super().__init__(**values)
+        object.__setattr__(self, "_loaders", loaders)
+
+    def __missing__(self, key):
+        loader = self._loaders.get(key)
+        if loader is None:
+            raise KeyError(key)
+        value = self[key] = loader()
+        return value
+
+    def __contains__(self, key):
+        return super().__contains__(key) or key in self._loaders
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def set_loader(self, key, loader):
+        self._loaders[key] = loader
+
+    def loaded(self, key):
+        """Whether the value of ``key`` was set or read."""
+        return super().__contains__(key)
+
+    def resolve(self):
+        for key in self._loaders:
+            if not super().__contains__(key):
+                self[key] = self._loaders[key]()
+        return self
+
+
 class FalsyList(list):
     def __bool__(self):
         # for Python 3
@@ -319,6 +362,17 @@ class CallbackContext:
         """
         return _get_from_context("origin", "")
 
+    @property
+    @has_context
+    def cancelled(self):
+        """
+        True once the page sent a newer request for this callback, a long
+        running callback can check it to stop early: the result of the
+        superseded request is not used.
+        """
+        generation = _get_from_context("generation", None)
+        return generation is not None and generation.superseded
+
     @property
     @has_context
     def custom_data(self):
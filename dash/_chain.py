@@ -0,0 +1,327 @@
+"""
+Server-side callback chaining, used with ``Dash(chain_callbacks=True)``.
+
+After a callback ran, the server callbacks triggered by its outputs are run in
+the same request when all their input and state values are known, and their
+outputs are added to the response. The ids of the chained callbacks are
+returned in ``chained`` so the renderer doesn't request them again.
+
+The chain stops at clientside callbacks and at outputs rendering components,
+the callbacks it can't run (background, websocket, pattern-matching, missing
+values, waiting for another triggered callback...) are left to the renderer.
+
+The errors of the chained callbacks are returned in ``chainErrors`` by callback
+id, for the dev tools. The patches they return are applied by the renderer,
+the callbacks reading the patched props are left to it.
+"""
+import collections
+import inspect
+import json
+
+from .exceptions import PreventUpdate
+from ._utils import clean_property_name, stringify_id, to_json
+from .backends._utils import callback_error_message
+
+# Levels of callbacks run after the first one.
+MAX_DEPTH = 10
+
+_PREVENTED = object()
+# Sent back for a chained callback which raised, with the message of its error.
+_Failure = collections.namedtuple("_Failure", "message")
+
+
+def run_chain(app, func, partial_func, g):
+    """Run the callback then the callbacks it triggers, returns the response."""
+    result = partial_func()
+    if inspect.iscoroutine(result):
+        return _run_async(app, func, result, g)
+
+    steps = _chain_steps(app, func, result, g)
+    try:
+        step = next(steps)
+        while True:
+            step_result = None
+            try:
+                step_result = _call_step(app, step, g)
+                if inspect.iscoroutine(step_result):
+                    # Async callbacks can't be awaited from a sync callback.
+                    step_result.close()
+                    step_result = None
+            except PreventUpdate:
+                step_result = _PREVENTED
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                step_result = _step_failed(app, step, error)
+            step = steps.send(step_result)
+    except StopIteration as stop:
+        return stop.value
+
+
+async def _run_async(app, func, coroutine, g):
+    steps = _chain_steps(app, func, await coroutine, g)
+    try:
+        step = next(steps)
+        while True:
+            step_result = None
+            try:
+                step_result = _call_step(app, step, g)
+                if inspect.iscoroutine(step_result):
+                    step_result = await step_result
+            except PreventUpdate:
+                step_result = _PREVENTED
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                step_result = _step_failed(app, step, error)
+            step = steps.send(step_result)
+    except StopIteration as stop:
+        return stop.value
+
+
+def _step_failed(app, step, error):
+    # The callback ran, the renderer must not run it (and its side effects)
+    # again: it's chained without outputs like a failed request, its error is
+    # reported with the response.
+    app.logger.exception("Chained callback %s failed", step["output"])
+    return _Failure(callback_error_message(app, error))
+
+
+def _call_step(app, body, g):
+    # pylint: disable=protected-access
+    step_ctx = app._initialize_context(body)
+    # Cookies and headers set by the chained callbacks go in the same response.
+    step_ctx.set_loader("dash_response", lambda: g.dash_response)
+    func = app._prepare_callback(step_ctx, body)
+    args = app._inputs_to_vals(step_ctx.inputs_list + step_ctx.states_list)
+    return app._execute_callback(
+        func, args, step_ctx.outputs_list, step_ctx, chain=False
+    )()
+
+
+def _prop_ids(deps):
+    return [
+        f"{stringify_id(dep.component_id)}.{clean_property_name(dep.component_property)}"
+        for dep in deps
+    ]
+
+
+def _outputs(cb):
+    output = cb["output"]
+    if cb.get("no_output"):
+        return []
+    return output if isinstance(output, list) else [output]
+
+
+def get_graph(app):
+    """The server callbacks by input prop id, rebuilt when callbacks are added."""
+    # pylint: disable=protected-access
+    graph = app._chain_graph
+    if graph is not None and graph["size"] == len(app._callback_list):
+        return graph
+
+    by_input = {}
+    for spec in app._callback_list:
+        for dep in spec["inputs"]:
+            prop_id = f"{dep['id']}.{dep['property']}"
+            by_input.setdefault(prop_id, []).append(spec)
+
+    graph = app._chain_graph = {
+        "size": len(app._callback_list),
+        "by_input": by_input,
+        "by_func": {
+            cb.get("callback"): callback_id
+            for callback_id, cb in app.callback_map.items()
+            if cb.get("callback") is not None
+        },
+    }
+    return graph
+
+
+def _flat_values(items):
+    for item in items:
+        if isinstance(item, list):
+            yield from item
+        else:
+            yield item
+
+
+def _has_components(value):
+    if isinstance(value, dict):
+        if "namespace" in value and "type" in value and "props" in value:
+            return True
+        return any(_has_components(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_has_components(v) for v in value)
+    return False
+
+
+def _is_patch(value):
+    return isinstance(value, dict) and "__dash_patch_update" in value
+
+
+def _has_patch(props):
+    return any(
+        _is_patch(value) for component in props.values() for value in component.values()
+    )
+
+
+def _step_body(cb, callback_id, known, changed, produced):
+    """The request body of a triggered callback, None if it can't be chained."""
+    if (
+        cb is None
+        or cb.get("callback") is None
+        or cb.get("background")
+        or cb.get("websocket")
+    ):
+        return None
+
+    deps = [*cb["raw_inputs"], *cb["raw_state"]]
+    outputs = _outputs(cb)
+    if any(dep.has_wildcard() for dep in [*deps, *outputs]):
+        return None
+
+    input_ids = _prop_ids(cb["raw_inputs"])
+    state_ids = _prop_ids(cb["raw_state"])
+    if any(prop_id not in known for prop_id in input_ids + state_ids):
+        return None
+    if produced.intersection(_prop_ids(outputs)):
+        return None
+
+    def values(deps, prop_ids):
+        return [
+            {
+                "id": dep.component_id,
+                "property": dep.component_property,
+                "value": known[prop_id],
+            }
+            for dep, prop_id in zip(deps, prop_ids)
+        ]
+
+    outputs_list = [
+        {"id": out.component_id, "property": out.component_property} for out in outputs
+    ]
+    return {
+        "output": callback_id,
+        "outputs": outputs_list
+        if isinstance(cb["output"], list) or cb.get("no_output")
+        else outputs_list[0],
+        "inputs": values(cb["raw_inputs"], input_ids),
+        "state": values(cb["raw_state"], state_ids),
+        "changedPropIds": [prop_id for prop_id in input_ids if prop_id in changed],
+    }
+
+
+def _triggered(app, graph, changed, executed):
+    """
+    The callbacks triggered by the ``changed`` props, and the triggered
+    callbacks by the prop ids they output to.
+    """
+    triggered = {}
+    for prop_id in changed:
+        for spec in graph["by_input"].get(prop_id, []):
+            if spec["output"] not in executed:
+                triggered.setdefault(spec["output"], spec)
+
+    pending = {}
+    for spec in triggered.values():
+        cb = app.callback_map.get(spec["output"])
+        for prop_id in _prop_ids(_outputs(cb)) if cb else []:
+            pending.setdefault(prop_id, set()).add(spec["output"])
+    return list(triggered.values()), pending
+
+
+def _ready_step_body(app, spec, pending, known, changed, produced):
+    """The request body of a triggered callback if it can run now."""
+    callback_id = spec["output"]
+    cb = app.callback_map.get(callback_id)
+    if cb is None or spec.get("running"):
+        return None
+    # The renderer runs a callback after the other triggered callbacks
+    # outputting to its inputs.
+    if any(
+        pending.get(prop_id, set()) - {callback_id}
+        for prop_id in _prop_ids([*cb["raw_inputs"], *cb["raw_state"]])
+    ):
+        return None
+    return _step_body(cb, callback_id, known, changed, produced)
+
+
+def _merge_step(response, step_response, changed, patched):
+    """Add the outputs and set_props of a chained callback to the response."""
+    for component_id, component_props in step_response.get("response", {}).items():
+        response["response"].setdefault(component_id, {}).update(component_props)
+        for prop, value in component_props.items():
+            if _is_patch(value):
+                # Applied to the renderer value, unknown here.
+                patched.add(f"{component_id}.{prop}")
+            else:
+                changed[f"{component_id}.{prop}"] = value
+    side_update = step_response.get("sideUpdate")
+    if side_update:
+        merged = response.setdefault("sideUpdate", {})
+        for component_id, component_props in side_update.items():
+            merged.setdefault(component_id, {}).update(component_props)
+
+
+def _chain_steps(app, func, response_json, g):
+    """
+    Generator yielding the bodies of the callbacks to run, it receives their
+    JSON response (`_PREVENTED`, a `_Failure` or None if it couldn't run) and
+    returns the response of the chain.
+    """
+    # A streamed response is encoded to be merged with the chained ones.
+    response = json.loads(str(response_json))
+    if "response" not in response or _has_patch(response["response"]):
+        # Background job, no output or patches applied to the renderer values.
+        return response_json
+
+    graph = get_graph(app)
+    executed = {graph["by_func"].get(func)}
+    known = {
+        f"{stringify_id(item['id'])}.{item['property']}": item.get("value")
+        for item in _flat_values(g.inputs_list + g.states_list)
+    }
+    changed = {
+        f"{component_id}.{prop}": value
+        for component_id, props in response["response"].items()
+        for prop, value in props.items()
+    }
+    known.update(changed)
+    produced = set(changed)
+    chained = []
+    errors = {}
+
+    for _ in range(MAX_DEPTH):
+        if not changed or _has_components(list(changed.values())):
+            break
+
+        triggered, pending = _triggered(app, graph, changed, executed)
+        if any(spec.get("clientside_function") for spec in triggered):
+            break
+
+        next_changed = {}
+        patched = set()
+        for spec in triggered:
+            body = _ready_step_body(app, spec, pending, known, changed, produced)
+            if body is None:
+                continue
+
+            executed.add(spec["output"])
+            step_json = yield body
+            if step_json is None:
+                continue
+            chained.append(spec["output"])
+            if isinstance(step_json, _Failure):
+                errors[spec["output"]] = step_json.message
+            elif step_json is not _PREVENTED:
+                _merge_step(response, json.loads(step_json), next_changed, patched)
+
+        for prop_id in patched:
+            known.pop(prop_id, None)
+        known.update(next_changed)
+        produced.update(next_changed, patched)
+        changed = next_changed
+
+    if not chained:
+        return response_json
+    response["chained"] = chained
+    if errors:
+        response["chainErrors"] = errors
+    return to_json(response)
@@ -0,0 +1,133 @@
+"""
+Single-flight execution of identical callback calls, used with
+``Dash(coalesce_callbacks=True)`` or ``callback(coalesce=True)``.
+
+The first request for a callback and a set of input and state values runs the
+function, the identical requests arriving while it runs wait for its result
+(and its ``set_props``) instead of running the function again.
+
+A call reading the request (cookies, headers...) or setting the response
+can't be shared: the requests waiting for it run the function themselves and
+the callback is no longer coalesced.
+"""
+import asyncio
+import concurrent.futures
+import hashlib
+import threading
+
+from .background_callback.managers import _hash_value
+
+# Context values depending on the request, or writing the response.
+REQUEST_KEYS = (
+    "cookies",
+    "headers",
+    "args",
+    "path",
+    "remote",
+    "origin",
+    "dash_response",
+)
+
+
+def flight_key(callback_id, args, kwargs, callback_ctx) -> str:
+    hasher = hashlib.sha256()
+    _hash_value(
+        hasher,
+        [
+            callback_id,
+            args,
+            kwargs,
+            [t["prop_id"] for t in callback_ctx.triggered_inputs],
+            callback_ctx.outputs_list,
+        ],
+    )
+    return hasher.hexdigest()
+
+
+def reads_request(callback_ctx) -> bool:
+    return any(callback_ctx.loaded(key) for key in REQUEST_KEYS)
+
+
+class _Flight:  # pylint: disable=too-few-public-methods
+    __slots__ = ("future", "shared")
+
+    def __init__(self):
+        self.future = concurrent.futures.Future()
+        self.shared = True
+
+
+class SingleFlight:
+    """The calls in flight of a callback, by `flight_key`."""
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        # Set once a call read the request, its calls aren't coalesced anymore.
+        self.request_dependent = False
+
+    def _join(self, key):
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = self._flights[key] = _Flight()
+            return flight, True
+
+    def _land(self, key, flight, callback_ctx, value=None, error=None):
+        with self._lock:
+            del self._flights[key]
+
+        if error is not None and not isinstance(error, Exception):
+            # Cancelled or interrupted, the others run the function.
+            flight.shared = False
+        elif reads_request(callback_ctx):
+            flight.shared = False
+            self.request_dependent = True
+
+        if not flight.shared:
+            flight.future.set_result(None)
+        elif error is not None:
+            flight.future.set_exception(error)
+        else:
+            flight.future.set_result((value, dict(callback_ctx.updated_props)))
+
+    @staticmethod
+    def _replay(flight, callback_ctx):
+        value, side_update = flight.future.result()
+        for _id, props in side_update.items():
+            callback_ctx.updated_props[_id] = props
+        return value
+
+    def run(self, key, callback_ctx, fn):
+        """Call ``fn`` or wait for the identical call in flight."""
+        flight, leader = self._join(key)
+        if leader:
+            try:
+                value = fn()
+            except BaseException as err:
+                self._land(key, flight, callback_ctx, error=err)
+                raise
+            self._land(key, flight, callback_ctx, value=value)
+            return value
+
+        concurrent.futures.wait([flight.future])
+        if not flight.shared:
+            return fn()
+        return self._replay(flight, callback_ctx)
+
+    async def async_run(self, key, callback_ctx, fn):
+        """Await ``fn()`` or the identical call in flight."""
+        flight, leader = self._join(key)
+        if leader:
+            try:
+                value = await fn()
+            except BaseException as err:
+                self._land(key, flight, callback_ctx, error=err)
+                raise
+            self._land(key, flight, callback_ctx, value=value)
+            return value
+
+        await asyncio.wait([asyncio.wrap_future(flight.future)])
+        if not flight.shared:
+            return await fn()
+        return self._replay(flight, callback_ctx)
@@ -0,0 +1,75 @@
+from ._grouping import compile_grouping
+from ._utils import AttributeDict, stringify_id
+
+
+class DispatchPlan:
+    """
+    The request independent part of `Dash._prepare_callback`, compiled once per
+    callback by `insert_callback`: the groupings of the inputs/state and of the
+    outputs, and the string ids of the dependencies without wildcards.
+    """
+
+    __slots__ = ("_deps", "_args", "_using_args", "_outputs", "_using_outputs")
+
+    def __init__(self, inputs, state, inputs_state_indices, outputs_indices):
+        self._deps = [
+            None
+            if dep.has_wildcard()
+            else (
+                dep.component_id,
+                dep.component_id_str(),
+                f"{dep.component_id_str()}.{dep.component_property}",
+            )
+            for dep in [*inputs, *state]
+        ]
+        self._args, self._using_args = compile_grouping(inputs_state_indices)
+        self._outputs, self._using_outputs = compile_grouping(outputs_indices)
+
+    def args_grouping(self, inputs_state, changed_prop_ids):
+        """
+        The `args_grouping` of the request and whether it differs from the flat
+        list of the inputs and state.
+        """
+        if not inputs_state:
+            return [], False
+
+        triggered = set(changed_prop_ids)
+        deps = self._deps
+        flat = []
+        for i, item in enumerate(inputs_state):
+            if isinstance(item, list):
+                # Wildcard: list of inputs or state
+                flat.append([_arg(x, None, triggered) for x in item])
+            else:
+                flat.append(_arg(item, deps[i] if i < len(deps) else None, triggered))
+
+        return self._args(flat), self._using_args
+
+    def outputs_grouping(self, outputs_list):
+        """
+        The `outputs_grouping` of the request and whether it differs from the
+        flat list of the outputs.
+        """
+        if not isinstance(outputs_list, list):
+            outputs_list = [outputs_list]
+        if not outputs_list:
+            return [], False
+        return self._outputs(outputs_list), self._using_outputs
+
+
+def _arg(item, dep, triggered):
+    arg = AttributeDict(item)
+    component_id = item["id"]
+    if dep is not None and component_id == dep[0]:
+        str_id, prop_id = dep[1], dep[2]
+    else:
+        str_id = stringify_id(component_id)
+        prop_id = f"{str_id}.{item['property']}"
+
+    arg["value"] = item.get("value")
+    arg["str_id"] = str_id
+    arg["triggered"] = prop_id in triggered
+    arg["id"] = (
+        AttributeDict(component_id) if isinstance(component_id, dict) else component_id
+    )
+    return arg
@@ -0,0 +1,131 @@
+"""
+Request generations of the callback outputs, to drop the superseded requests.
+
+The renderer numbers the requests it sends for the outputs of a page
+(``generation`` in the callback payload: ``[session, number]``). When a newer
+request for the same outputs arrives while one is running in this process,
+the older one is superseded:
+
+- it is skipped if it didn't start yet (e.g. queued on a thread pool),
+- async callbacks are cancelled,
+- sync callbacks can stop early by checking ``callback_context.cancelled``,
+  their result isn't serialized.
+
+A superseded request returns no update, the renderer only uses the response
+of the newest request of its outputs. The requests are keyed by their resolved
+outputs, not the callback id: the instances of a pattern-matching callback
+(``MATCH``) share their callback id but don't supersede each other.
+"""
+import asyncio
+import inspect
+import threading
+
+from ._utils import stringify_id
+from .exceptions import PreventUpdate
+
+
+class Generation:
+    """A request of a callback, superseded by the next one of its page."""
+
+    __slots__ = ("key", "number", "superseded", "_registry", "_task")
+
+    def __init__(self, registry, key, number):
+        self.key = key
+        self.number = number
+        self.superseded = False
+        self._registry = registry
+        self._task = None
+
+    def supersede(self):
+        self.superseded = True
+        task = self._task
+        if task is not None:
+            task.get_loop().call_soon_threadsafe(task.cancel)
+
+    def attach(self, task):
+        """Cancel the task running the callback if superseded."""
+        self._task = task
+        if self.superseded:
+            task.cancel()
+
+    def end(self):
+        self._registry.end(self)
+
+
+def outputs_key(outputs_list, callback_id) -> str:
+    """The resolved outputs of a request, like a callback id of their ids."""
+    outputs = []
+    pending = [outputs_list]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, (list, tuple)):
+            pending.extend(reversed(item))
+        else:
+            outputs.append(f"{stringify_id(item['id'])}.{item['property']}")
+    if not outputs:
+        # No output callbacks.
+        return callback_id
+    if isinstance(outputs_list, dict):
+        return outputs[0]
+    return f"..{'...'.join(outputs)}.."
+
+
+class GenerationRegistry:
+    """The latest running request of each (session, resolved outputs)."""
+
+    def __init__(self):
+        self._latest = {}
+        self._lock = threading.Lock()
+
+    def begin(self, session, outputs, number) -> Generation:
+        key = (session, outputs)
+        generation = Generation(self, key, number)
+        with self._lock:
+            current = self._latest.get(key)
+            if current is not None and current.number > number:
+                # Arrived after a newer request.
+                generation.superseded = True
+                return generation
+            self._latest[key] = generation
+        if current is not None:
+            current.supersede()
+        return generation
+
+    def end(self, generation):
+        with self._lock:
+            if self._latest.get(generation.key) is generation:
+                del self._latest[generation.key]
+
+
+def raise_if_superseded(callback_ctx):
+    generation = callback_ctx.get("generation")
+    if generation is not None and generation.superseded:
+        raise PreventUpdate
+
+
+def run(func, callback_ctx):
+    """Call the callback unless superseded, end its generation when done."""
+    generation = callback_ctx.generation
+    try:
+        raise_if_superseded(callback_ctx)
+        result = func()
+    except BaseException:
+        generation.end()
+        raise
+    if inspect.iscoroutine(result):
+        return _run_async(result, generation)
+    generation.end()
+    return result
+
+
+async def _run_async(coroutine, generation):
+    task = asyncio.ensure_future(coroutine)
+    generation.attach(task)
+    try:
+        return await task
+    except asyncio.CancelledError:
+        if generation.superseded and task.cancelled():
+            raise PreventUpdate from None
+        raise
+    finally:
+        generation.end()
@@ -14,7 +14,7 @@ structure
 
 """
 from .exceptions import InvalidCallbackReturnValue
-from ._utils import AttributeDict, stringify_id
+from ._utils import AttributeDict
 
 
 def flatten_grouping(grouping, schema=None):
@@ -142,6 +142,26 @@ def map_grouping(fn, grouping):
     return fn(grouping)
 
 
+def compile_grouping(indices):
+    """
+    Compile the grouping of a flat list by a grouping of indices, the
+    ``map_grouping`` of ``flat_list[index]`` over ``indices``.
+
+    :param indices: A grouping of integer indices
+    :return: ``(build, using_grouping)``, ``build(flat_list)`` returns the grouping
+        and ``using_grouping`` is False when it is the flat list itself (or its
+        single item for a scalar index).
+    """
+    if isinstance(indices, int):
+        return (lambda flat: flat[indices]), False
+
+    size = grouping_len(indices)
+    if indices == list(range(size)):
+        return (lambda flat: flat[:size]), False
+
+    return (lambda flat: map_grouping(flat.__getitem__, indices)), True
+
+
 def make_grouping_by_key(schema, source, default=None):
     """
     Create a grouping from a schema by using the schema's scalar values to look up
@@ -234,17 +254,3 @@ def validate_grouping(grouping, schema, full_schema=None, path=()):
             )
     else:
         pass
-
-
-def update_args_group(g, triggered):
-    if isinstance(g, dict):
-        str_id = stringify_id(g["id"])
-        prop_id = f"{str_id}.{g['property']}"
-
-        new_values = {
-            "value": g.get("value"),
-            "str_id": str_id,
-            "triggered": prop_id in triggered,
-            "id": AttributeDict(g["id"]) if isinstance(g["id"], dict) else g["id"],
-        }
-        g.update(new_values)
@@ -0,0 +1,159 @@
+import collections
+import hashlib
+import inspect
+import pickle
+import threading
+import time
+from typing import Any, Optional
+
+from .background_callback.managers import _hash_value
+
+
+class _Missing:
+    def __repr__(self):
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+class BaseMemoizeStore:
+    """
+    Storage of the memoized callback results, `memoize=` on a callback.
+
+    Subclasses implement `get` returning `MISSING` when the key is not
+    stored (or expired) and `set`.
+    """
+
+    def get(self, key: str) -> Any:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any) -> None:
+        raise NotImplementedError
+
+
+class LRUMemoizeStore(BaseMemoizeStore):
+    """Keep the results in the process memory, the default store."""
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        """
+        :param maxsize:
+            Number of results to keep, the least recently used are dropped first.
+        :param ttl:
+            If provided, results are dropped ``ttl`` seconds after being stored.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "collections.OrderedDict[str, Any]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            expires, value = entry
+            if expires is not None and expires < time.monotonic():
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+class DiskcacheMemoizeStore(BaseMemoizeStore):
+    """Keep the results in a diskcache, shared by the processes of the host."""
+
+    def __init__(self, cache=None, expire: Optional[float] = None):
+        """
+        :param cache:
+            A diskcache.Cache or diskcache.FanoutCache instance. If not provided,
+            a diskcache.Cache instance will be created with default values.
+        :param expire:
+            If provided, results are removed ``expire`` seconds after being stored.
+        """
+        if cache is None:
+            try:
+                import diskcache  # type: ignore[import-not-found,import-untyped] # pylint: disable=import-outside-toplevel
+            except ImportError as missing_imports:
+                raise ImportError(
+                    """\
+DiskcacheMemoizeStore requires extra dependencies which can be installed doing
+
+    $ pip install "dash[diskcache]"\n"""
+                ) from missing_imports
+            cache = diskcache.Cache()
+
+        self.handle = cache
+        self.expire = expire
+
+    def get(self, key):
+        return self.handle.get(key, default=MISSING)
+
+    def set(self, key, value):
+        self.handle.set(key, value, expire=self.expire)
+
+
+class RedisMemoizeStore(BaseMemoizeStore):
+    """Keep the results in Redis, shared by all the app servers."""
+
+    def __init__(
+        self, client, expire: Optional[int] = None, prefix: str = "dash-memoize:"
+    ):
+        """
+        :param client:
+            A client speaking the Redis protocol, like ``redis.Redis``. Only its
+            ``get(name)`` and ``set(name, value, ex=None)`` methods are used.
+        :param expire:
+            If provided, results are removed ``expire`` seconds after being stored.
+        :param prefix:
+            Prefix of the Redis keys.
+        """
+        self.handle = client
+        self.expire = expire
+        self.prefix = prefix
+
+    def get(self, key):
+        data = self.handle.get(self.prefix + key)
+        if data is None:
+            return MISSING
+        return pickle.loads(data)
+
+    def set(self, key, value):
+        self.handle.set(self.prefix + key, pickle.dumps(value), ex=self.expire)
+
+
+def get_memoize_store(memoize) -> Optional[BaseMemoizeStore]:
+    if memoize is None or memoize is False:
+        return None
+    if memoize is True:
+        return LRUMemoizeStore()
+    if isinstance(memoize, BaseMemoizeStore):
+        return memoize
+    raise TypeError(
+        "memoize must be a bool or a memoize store (LRUMemoizeStore, "
+        f"DiskcacheMemoizeStore, RedisMemoizeStore), got {memoize!r}"
+    )
+
+
+def function_fingerprint(func) -> str:
+    """Hash of the function source, so changed code doesn't reuse results."""
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = getattr(func, "__qualname__", repr(func))
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def memoize_key(callback_id, fingerprint, args, kwargs) -> str:
+    hasher = hashlib.sha256()
+    # Arrays are hashed from their buffers, their repr elides the middle.
+    _hash_value(hasher, [callback_id, fingerprint, args, kwargs])
+    return hasher.hexdigest()
@@ -0,0 +1,90 @@
+import re
+import uuid
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+# Encoded static subtrees met by the `to_json` call in progress, by key.
+# None when no `to_json` call is running, `to_plotly_json` then returns the
+# regular dict so other serializers are not affected.
+_splices: ContextVar[Optional[Dict[str, str]]] = ContextVar(
+    "dash_static_splices", default=None
+)
+
+_MARKER_PREFIX = "__dash_static_"
+_MARKER_RE = re.compile(r'"__dash_static_([0-9a-f]{32})__"')
+
+
+class _StaticSubtree:  # pylint: disable=too-few-public-methods
+    __slots__ = ("key", "json")
+
+    def __init__(self):
+        self.key = uuid.uuid4().hex
+        self.json: Optional[str] = None
+
+
+def static(component):
+    """
+    Mark a component subtree as static, it is serialized once and the
+    resulting JSON is reused as is by every layout and callback response
+    that contains it.
+
+    The subtree is considered frozen: changes made to it after the first
+    serialization are not sent to the front end. Call `static` again on
+    the component to encode it anew.
+
+    Usage:
+    ```
+    footer = dash.static(html.Footer([...]))
+    app.layout = lambda: html.Div([page_content(), footer])
+    ```
+
+    :param component: The root component of the subtree.
+    :return: The same component.
+    """
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from .development.base_component import Component
+
+    if not isinstance(component, Component):
+        raise TypeError(
+            f"dash.static expects a component, got {type(component).__name__}."
+        )
+
+    # pylint: disable=protected-access
+    component._static = _StaticSubtree()
+    return component
+
+
+def encode_static(component) -> Optional[str]:
+    """
+    Return the placeholder of a static component for the running `to_json`
+    call, encoding the subtree the first time. None when not called from
+    `to_json`.
+    """
+    splices = _splices.get()
+    if splices is None:
+        return None
+
+    # pylint: disable=protected-access
+    subtree = component._static
+    if subtree.json is None:
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from ._utils import to_json
+
+        subtree.json = to_json(component._to_plotly_json())
+
+    splices[subtree.key] = subtree.json
+    return f"{_MARKER_PREFIX}{subtree.key}__"
+
+
+def splice_static(encode: Callable[[Any], str], value: Any) -> str:
+    """Encode `value` and replace the static placeholders by their JSON."""
+    token = _splices.set({})
+    try:
+        out = encode(value)
+        splices = _splices.get()
+    finally:
+        _splices.reset(token)
+
+    if splices:
+        out = _MARKER_RE.sub(lambda m: splices[m.group(1)], out)
+    return out
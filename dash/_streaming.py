@@ -0,0 +1,145 @@
+"""
+Incremental encoding of the callback responses, ``callback(stream_response=True)``.
+
+The response is encoded piece by piece while the backend sends it (Flask
+generator, Starlette ``StreamingResponse``, Quart iterable body) instead of
+building the whole JSON string first. Long lists and arrays are encoded by
+chunks of ``CHUNK_SIZE`` items with the regular json engine, so the peak
+memory is a chunk of JSON instead of the full response and its copies.
+
+The response is validated when the stream is created: the values the engine
+can't encode raise while the callback can still fail, before the response
+headers are sent.
+"""
+import sys
+
+from ._utils import to_json
+
+# Items of a long list encoded at once.
+CHUNK_SIZE = 1000
+# Encoded pieces are sent once they reach this size.
+BUFFER_SIZE = 1 << 16
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+class JSONStream:
+    """A callback response encoded when iterated, ``str()`` encodes it all."""
+
+    def __init__(self, value, typed_arrays=False):
+        self.value = value
+        self.typed_arrays = typed_arrays
+        # Encoded once the response is sent, too late for the callback to fail.
+        self.validate()
+
+    def _encode(self, value):
+        return to_json(value, typed_arrays=self.typed_arrays)
+
+    def __iter__(self):
+        buffer = []
+        size = 0
+        for piece in self._iter_value(self.value):
+            buffer.append(piece)
+            size += len(piece)
+            if size >= BUFFER_SIZE:
+                yield "".join(buffer)
+                buffer = []
+                size = 0
+        if buffer:
+            yield "".join(buffer)
+
+    def __str__(self):
+        return "".join(self)
+
+    def validate(self):
+        """
+        Raise the ``TypeError`` of the values the engine can't encode, without
+        encoding the containers and the numeric arrays.
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .development.base_component import Component
+
+        np = sys.modules.get("numpy")
+        pending = [self.value]
+        while pending:
+            value = pending.pop()
+            if isinstance(value, _SCALARS):
+                continue
+            if isinstance(value, dict):
+                for key, item in value.items():
+                    if not isinstance(key, _SCALARS):
+                        self._encode({key: None})
+                    pending.append(item)
+            elif isinstance(value, (list, tuple)):
+                pending.extend(value)
+            elif (
+                isinstance(value, Component)
+                and value._static is None  # pylint: disable=protected-access
+            ):
+                pending.append(value.to_plotly_json())
+            elif not (
+                np is not None
+                and isinstance(value, np.ndarray)
+                and not value.dtype.hasobject
+            ):
+                self._encode(value)
+
+    def _iter_value(self, value):
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .development.base_component import Component
+
+        if isinstance(value, Component):
+            if value._static is not None:  # pylint: disable=protected-access
+                yield self._encode(value)
+            else:
+                yield from self._iter_value(value.to_plotly_json())
+        elif isinstance(value, dict):
+            yield from self._iter_dict(value)
+        elif isinstance(value, (list, tuple)):
+            yield from self._iter_list(value)
+        elif self._is_sliceable_array(value):
+            yield from self._iter_chunks(value)
+        else:
+            yield self._encode(value)
+
+    def _iter_dict(self, value):
+        yield "{"
+        for index, (key, item) in enumerate(value.items()):
+            # Keys encoded like the engine does (non str keys, escaping).
+            encoded_key = self._encode({key: None})[1:-6]
+            yield f",{encoded_key}:" if index else f"{encoded_key}:"
+            yield from self._iter_value(item)
+        yield "}"
+
+    def _iter_list(self, value):
+        if len(value) > CHUNK_SIZE:
+            yield from self._iter_chunks(value)
+            return
+        # Few items, possibly large ones.
+        yield "["
+        for index, item in enumerate(value):
+            if index:
+                yield ","
+            yield from self._iter_value(item)
+        yield "]"
+
+    def _iter_chunks(self, value):
+        yield "["
+        for start in range(0, len(value), CHUNK_SIZE):
+            chunk = value[start : start + CHUNK_SIZE]
+            if isinstance(chunk, tuple):
+                chunk = list(chunk)
+            encoded = self._encode(chunk)[1:-1]
+            if start and encoded:
+                yield ","
+            yield encoded
+        yield "]"
+
+    def _is_sliceable_array(self, value):
+        np = sys.modules.get("numpy")
+        if np is None or not isinstance(value, np.ndarray) or value.ndim == 0:
+            return False
+        if len(value) <= CHUNK_SIZE:
+            return False
+        # Typed arrays are encoded in one piece.
+        return not (self.typed_arrays and value.dtype.kind in "iuf")
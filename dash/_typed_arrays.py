@@ -0,0 +1,90 @@
+"""
+Binary encoding of the numeric arrays of the callbacks, used with
+``Dash(binary_arrays=True)``.
+
+The numeric numpy arrays and pandas series of the callback responses are sent
+as plotly.js typed array specs, ``{"dtype": "f8", "bdata": <base64>}`` (plus
+``"shape": "2, 3"`` for multidimensional arrays), which the renderer decodes
+into typed arrays. The typed arrays sent back by the renderer are decoded into
+numpy arrays before calling the callbacks.
+"""
+import base64
+import sys
+
+# plotly.js typed array types.
+DTYPES = {
+    "i1": "int8",
+    "u1": "uint8",
+    "u1c": "uint8",
+    "i2": "int16",
+    "u2": "uint16",
+    "i4": "int32",
+    "u4": "uint32",
+    "f4": "float32",
+    "f8": "float64",
+}
+
+
+def encode_array(obj):
+    """The typed array spec of a numeric array or series, None otherwise."""
+    np = sys.modules.get("numpy")
+    if np is None:
+        return None
+
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(obj, (pd.Series, pd.Index)):
+        # Extension dtypes (nullable integers...) keep their list encoding.
+        if not isinstance(obj.dtype, np.dtype):
+            return None
+        obj = obj.to_numpy()
+
+    if not isinstance(obj, np.ndarray) or obj.dtype.kind not in "iuf":
+        return None
+
+    # pylint: disable=import-outside-toplevel
+    from _plotly_utils.utils import to_typed_array_spec
+
+    spec = to_typed_array_spec(obj)
+    # Empty arrays, float16 and 64 bits integers out of the int32 range.
+    return spec if isinstance(spec, dict) else None
+
+
+def _decode_array(spec):
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+
+    # Copied in a bytearray so the array is writable.
+    data = bytearray(base64.b64decode(spec["bdata"]))
+    array = np.frombuffer(data, dtype=DTYPES[spec["dtype"]])
+    shape = spec.get("shape")
+    if shape:
+        array = array.reshape([int(size) for size in str(shape).split(",")])
+    return array
+
+
+def _is_spec(value):
+    return (
+        isinstance(value.get("bdata"), str)
+        and value.get("dtype") in DTYPES
+        and len(value) <= 3
+    )
+
+
+def decode(value):
+    """Replace the typed array specs in a value sent by the renderer."""
+    if isinstance(value, dict):
+        if "bdata" in value and _is_spec(value):
+            return _decode_array(value)
+        return {key: decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        if not any(isinstance(item, (dict, list)) for item in value):
+            return value
+        return [decode(item) for item in value]
+    return value
+
+
+def decode_body(body):
+    """The callback request body with the typed arrays of its values decoded."""
+    return dict(
+        body, inputs=decode(body.get("inputs", [])), state=decode(body.get("state", []))
+    )
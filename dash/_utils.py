@@ -3,6 +3,7 @@ import shlex
 import sys
 import uuid
 import hashlib
+import decimal
 import importlib
 from collections import abc
 import subprocess
@@ -19,17 +20,182 @@ from html import escape
 from functools import wraps
 from typing import Union
 from .types import RendererHooks
+from ._static import splice_static
 
 logger = logging.getLogger()
 
 
-def to_json(value):
+# Characters escaped the same way as plotly so the output stays safe to
+# inline in a ``<script>`` tag.
+_JSON_UNSAFE_CHARS = (
+    ("<", "\\u003c"),
+    (">", "\\u003e"),
+    ("/", "\\u002f"),
+    ("\u2028", "\\u2028"),
+    ("\u2029", "\\u2029"),
+)
+
+# Serializer used by `to_json`, set with `set_json_engine`.
+# None means plotly's `to_json_plotly`.
+_json_engine = None
+
+
+def _plotly_to_json(value):
     # pylint: disable=import-outside-toplevel
     from plotly.io.json import to_json_plotly  # type: ignore[import-untyped]
 
     return to_json_plotly(value)
 
 
+# Returned by `_numpy_default` for the values that aren't numpy values.
+_NOT_NUMPY = object()
+
+
+def _numpy_default(obj):
+    np = sys.modules.get("numpy")
+    if np is None:
+        return _NOT_NUMPY
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind == "M":
+            return np.datetime_as_string(obj).tolist()
+        # object dtype or non contiguous arrays.
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if obj is np.ma.masked:
+        return None
+    return _NOT_NUMPY
+
+
+def _orjson_default(obj):
+    # Called by orjson for every value it cannot serialize natively,
+    # components and patches are the common case so they go first.
+    to_plotly_json = getattr(obj, "to_plotly_json", None)
+    if to_plotly_json is not None:
+        return to_plotly_json()
+
+    value = _numpy_default(obj)
+    if value is not _NOT_NUMPY:
+        return value
+
+    pd = sys.modules.get("pandas")
+    if pd is not None and (obj is pd.NaT or obj is getattr(pd, "NA", None)):
+        return None
+
+    if hasattr(obj, "isoformat"):
+        # pandas.Timestamp and other datetime subclasses.
+        return obj.isoformat()
+    if hasattr(obj, "tolist"):
+        # pandas.Series & pandas.Index
+        return obj.tolist()
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+
+    raise TypeError
+
+
+def _orjson_to_json(value):
+    # pylint: disable=import-outside-toplevel
+    import orjson  # type: ignore[import-not-found]
+
+    try:
+        out = orjson.dumps(
+            value,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode("utf8")
+    except TypeError:
+        # Unknown types (PIL images, sage numbers, ...) and the error
+        # message for values that cannot be serialized at all.
+        return _plotly_to_json(value)
+
+    for unsafe, safe in _JSON_UNSAFE_CHARS:
+        if unsafe in out:
+            out = out.replace(unsafe, safe)
+    return out
+
+
+def _typed_array_default(obj):
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from ._typed_arrays import encode_array
+
+    spec = encode_array(obj)
+    if spec is not None:
+        return spec
+    return _orjson_default(obj)
+
+
+def _typed_arrays_to_json(value):
+    try:
+        import orjson  # type: ignore[import-not-found] # pylint: disable=import-outside-toplevel
+    except ImportError:
+        orjson = None
+
+    try:
+        if orjson is not None:
+            # Without OPT_SERIALIZE_NUMPY the arrays go through the default.
+            out = orjson.dumps(
+                value, default=_typed_array_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode("utf8")
+        else:
+            out = json.dumps(
+                value,
+                default=_typed_array_default,
+                separators=(",", ":"),
+                allow_nan=False,
+            )
+    except (TypeError, ValueError):
+        # Unknown types or NaN outside of the arrays, encoded as usual.
+        return (_json_engine or _plotly_to_json)(value)
+
+    for unsafe, safe in _JSON_UNSAFE_CHARS:
+        if unsafe in out:
+            out = out.replace(unsafe, safe)
+    return out
+
+
+def set_json_engine(engine):
+    """
+    Set the serializer used for the layout, the dependencies and the
+    callback responses. This is process wide, like plotly's
+    `plotly.io.json.config.default_engine`.
+
+    :param engine: ``None`` for plotly's ``to_json_plotly``, ``"orjson"``
+        for a Dash aware orjson encoder or a function taking the value and
+        returning a JSON string.
+    """
+    # pylint: disable=global-statement
+    global _json_engine
+
+    if engine is None or callable(engine):
+        _json_engine = engine
+    elif engine == "orjson":
+        try:
+            import orjson  # type: ignore[import-not-found] # pylint: disable=import-outside-toplevel,unused-import # noqa: F401
+        except ImportError as missing_imports:
+            raise ImportError(
+                """\
+json_engine="orjson" requires orjson which can be installed doing
+
+    $ pip install orjson\n"""
+            ) from missing_imports
+        _json_engine = _orjson_to_json
+    else:
+        raise ValueError(
+            f'Invalid json_engine: {engine!r}, expected None, "orjson" or a function.'
+        )
+
+
+def to_json(value, typed_arrays=False):
+    """
+    Encode ``value`` with the json engine, ``typed_arrays`` encodes the
+    numeric arrays as typed array specs, see ``dash._typed_arrays``.
+    """
+    if typed_arrays:
+        return splice_static(_typed_arrays_to_json, value)
+    return splice_static(_json_engine or _plotly_to_json, value)
+
+
 def interpolate_str(template, **data):
     s = template
     for k, v in data.items():
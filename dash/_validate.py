@@ -564,6 +564,16 @@ def validate_background_callbacks(callback_map):
             )
 
 
+def validate_callback_executors(callback_map, callback_executors):
+    for callback_id, callback in callback_map.items():
+        name = callback.get("executor")
+        if name is not None and name not in callback_executors:
+            raise exceptions.UnknownCallbackExecutor(
+                f"The callback `{callback_id}` uses the executor '{name}', "
+                "declare it in the `callback_executors` argument to `Dash`."
+            )
+
+
 def validate_duplicate_output(
     output, prevent_initial_call, config_prevent_initial_call
 ):
@@ -0,0 +1,191 @@
+"""Dispatch of batched callback requests, the ``_dash-update-component-batch``
+route enabled with ``Dash(batch_callbacks=True)``.
+
+The request body is a JSON array of callback payloads, the same payloads the
+renderer posts one by one to ``_dash-update-component``. The response is an
+array with one entry per payload, in the same order:
+
+- ``{"status": 200, "data": <callback response>}``
+- ``{"status": 204}`` when the callback raised ``PreventUpdate``
+- ``{"status": 500, "message": <error>}`` when it raised any other error
+
+All the callback contexts share the response adapter of the batch request, so
+the cookies and headers set by any of the callbacks are sent back.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+from contextvars import copy_context
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+from dash._utils import to_json
+from dash.exceptions import PreventUpdate
+from ._utils import callback_error_message
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from dash import Dash
+    from .base_server import ResponseAdapter
+
+
+COROUTINE_ERROR = (
+    "You are trying to use a coroutine without dash[async]. "
+    "Please install the dependencies via `pip install dash[async]` and ensure "
+    "that `use_async=False` is not being passed to the app."
+)
+
+
+def _check_bodies(bodies: Any) -> list:
+    if not isinstance(bodies, list):
+        raise TypeError(
+            "The batched callback endpoint expects a JSON array of callback "
+            f"payloads, got {type(bodies).__name__}."
+        )
+    return bodies
+
+
+def _prepare_item(
+    dash_app: "Dash", body: Any, response_adapter: "ResponseAdapter"
+) -> Tuple[Callable[[], Any], bool]:
+    """Build the callback context in the request context.
+
+    Returns the partial ready to be invoked and whether the callback is async.
+    """
+    # pylint: disable=protected-access
+    cb_ctx = dash_app._initialize_context(body)
+    # Loaded on demand, reading it makes the callback request dependent.
+    cb_ctx.set_loader("dash_response", lambda: response_adapter)
+    func = dash_app._prepare_callback(cb_ctx, body)
+    args = dash_app._inputs_to_vals(cb_ctx.inputs_list + cb_ctx.states_list)
+    partial_func = dash_app._execute_callback(func, args, cb_ctx.outputs_list, cb_ctx)
+    return partial_func, inspect.iscoroutinefunction(func)
+
+
+def _run_sync(partial_func: Callable[[], Any]) -> Any:
+    response_data = partial_func()
+    if inspect.iscoroutine(response_data):
+        response_data.close()
+        raise Exception(COROUTINE_ERROR)  # pylint: disable=broad-exception-raised
+    return response_data
+
+
+def _ok(response_data: Any) -> str:
+    if not isinstance(response_data, str):
+        response_data = to_json(response_data)
+    return '{"status":200,"data":' + response_data + "}"
+
+
+def _error(dash_app: "Dash", error: BaseException) -> dict:
+    if isinstance(error, PreventUpdate):
+        return {"status": 204}
+    dash_app.logger.error("Exception in batched callback", exc_info=error)
+    return {"status": 500, "message": callback_error_message(dash_app, error)}
+
+
+def _encode(results: List[Any]) -> str:
+    return (
+        "["
+        + ",".join(
+            result if isinstance(result, str) else to_json(result) for result in results
+        )
+        + "]"
+    )
+
+
+def dispatch_batch(
+    dash_app: "Dash",
+    bodies: Any,
+    response_adapter: "ResponseAdapter",
+    executor: ThreadPoolExecutor,
+    executor_for: Optional[Callable[[str], ThreadPoolExecutor]] = None,
+) -> str:
+    """Run the callbacks of a batch concurrently on the executor, or on the
+    executor of each callback given by ``executor_for(callback_id)``."""
+    bodies = _check_bodies(bodies)
+    results: List[Any] = [None] * len(bodies)
+    pending = []
+    for index, body in enumerate(bodies):
+        try:
+            partial_func, _ = _prepare_item(dash_app, body, response_adapter)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            results[index] = _error(dash_app, error)
+            continue
+        # The copied context carries the request context into the worker.
+        pending.append(
+            (
+                index,
+                copy_context().run,
+                partial_func,
+                executor_for(body["output"]) if executor_for else executor,
+            )
+        )
+
+    if len(pending) == 1:
+        # Nothing to run concurrently, stay on the request thread.
+        calls = [
+            (index, functools.partial(run, _run_sync, partial_func))
+            for index, run, partial_func, _ in pending
+        ]
+    else:
+        calls = [
+            (index, item_executor.submit(run, _run_sync, partial_func).result)
+            for index, run, partial_func, item_executor in pending
+        ]
+
+    for index, call in calls:
+        try:
+            results[index] = _ok(call())
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            results[index] = _error(dash_app, error)
+
+    return _encode(results)
+
+
+async def dispatch_batch_async(
+    dash_app: "Dash",
+    bodies: Any,
+    response_adapter: "ResponseAdapter",
+    executor: ThreadPoolExecutor,
+    executor_for: Optional[Callable[[str], ThreadPoolExecutor]] = None,
+) -> str:
+    """Run the callbacks of a batch concurrently, async callbacks are gathered
+    on the event loop and sync callbacks run on the executor, or on the
+    executor of each callback given by ``executor_for(callback_id)``."""
+    bodies = _check_bodies(bodies)
+    loop = asyncio.get_running_loop()
+    results: List[Any] = [None] * len(bodies)
+    indices = []
+    awaitables = []
+    for index, body in enumerate(bodies):
+        try:
+            partial_func, is_async = _prepare_item(dash_app, body, response_adapter)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            results[index] = _error(dash_app, error)
+            continue
+        indices.append(index)
+        if is_async:
+            # gather wraps the coroutine in a task with a copy of the context.
+            awaitables.append(partial_func())
+        else:
+            awaitables.append(
+                loop.run_in_executor(
+                    executor_for(body["output"]) if executor_for else executor,
+                    copy_context().run,
+                    partial_func,
+                )
+            )
+
+    responses = await asyncio.gather(*awaitables, return_exceptions=True)
+    for index, response_data in zip(indices, responses):
+        try:
+            if isinstance(response_data, BaseException):
+                raise response_data
+            if inspect.iscoroutine(response_data):
+                response_data = await response_data
+            results[index] = _ok(response_data)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            results[index] = _error(dash_app, error)
+
+    return _encode(results)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from contextvars import copy_context, ContextVar
+from contextvars import ContextVar
 import asyncio
+import functools
 import concurrent.futures
 import json
 import queue
@@ -20,7 +21,7 @@ from urllib.parse import urlparse
 
 try:
     from fastapi import FastAPI, Request, Response, Body
-    from fastapi.responses import JSONResponse, RedirectResponse
+    from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
     from fastapi.staticfiles import StaticFiles
     from starlette.responses import Response as StarletteResponse
     from starlette.datastructures import MutableHeaders
@@ -37,6 +38,7 @@ import janus
 from dash.fingerprint import check_fingerprint
 from dash import _validate, get_app
 from dash.exceptions import PreventUpdate
+from dash._streaming import JSONStream
 from .base_server import (
     BaseDashServer,
     RequestAdapter,
@@ -49,7 +51,9 @@ from .ws import (
     run_callback_on_loop,
     make_callback_done_handler,
     shutdown_ws_connection,
+    start_background_watch,
 )
+from ._batch import dispatch_batch_async
 from ._utils import format_traceback_html
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
@@ -75,7 +79,10 @@ class FastAPIResponseAdapter(ResponseAdapter):
         Set the response data. This method provides compatibility with Flask's Response.set_data().
         """
         data = kwargs.get("data")
-        if isinstance(data, (str, bytes, bytearray)):
+        if isinstance(data, JSONStream):
+            # Sync iterators are consumed on the threadpool.
+            resp = StreamingResponse(iter(data), media_type="application/json")
+        elif isinstance(data, (str, bytes, bytearray)):
             resp = Response(content=data)
         else:
             resp = JSONResponse(content=data)
@@ -553,23 +560,38 @@ class FastAPIDashServer(BaseDashServer[FastAPI]):
             cb_ctx = dash_app._initialize_context(
                 body
             )  # pylint: disable=protected-access
+            cb_ctx.can_stream = True
             func = dash_app._prepare_callback(
                 cb_ctx, body
             )  # pylint: disable=protected-access
             args = dash_app._inputs_to_vals(
                 cb_ctx.inputs_list + cb_ctx.states_list
             )  # pylint: disable=protected-access
-            ctx = copy_context()
             partial_func = dash_app._execute_callback(
                 func, args, cb_ctx.outputs_list, cb_ctx
             )  # pylint: disable=protected-access
-            response_data = ctx.run(partial_func)
-            if inspect.iscoroutine(response_data):
-                response_data = await response_data
+            response_data = await self.run_callback_async(
+                dash_app, body["output"], func, partial_func
+            )
             return cb_ctx.dash_response.set_response(data=response_data)
 
         return _dispatch
 
+    def serve_callback_batch(self, dash_app: Dash):
+        async def _dispatch_batch(request: Request):  # pylint: disable=unused-argument
+            response_adapter = self.response_adapter()
+            response_data = await dispatch_batch_async(
+                dash_app,
+                self.request_adapter().get_json(),
+                response_adapter,
+                # pylint: disable=protected-access
+                self.get_callback_executor(dash_app._websocket_max_workers),
+                functools.partial(self.get_executor_for, dash_app),
+            )
+            return response_adapter.set_response(data=response_data)
+
+        return _dispatch_batch
+
     def register_timing_hooks(self, first_run: bool):
         if first_run:
             self._enable_timing = True
@@ -825,9 +847,9 @@ class FastAPIDashServer(BaseDashServer[FastAPI]):
                             task.add_done_callback(done_handler)
                             pending_callbacks[request_id] = task
                         else:
-                            # Submit callback to executor
+                            # Submit callback to its executor
                             future = run_callback_in_executor(
-                                executor,
+                                self.get_executor_for(dash_app, payload.get("output")),
                                 dash_app,
                                 payload,
                                 ws_cb,
@@ -848,6 +870,16 @@ class FastAPIDashServer(BaseDashServer[FastAPI]):
                         elif pending is not None:
                             pending.put_nowait(message.get("payload"))
 
+                    elif msg_type == "background_subscribe":
+                        start_background_watch(
+                            dash_app,
+                            message,
+                            outbound_queue,
+                            shutdown_event,
+                            executor,
+                            pending_callbacks,
+                        )
+
                     elif msg_type == "heartbeat":
                         outbound_queue.sync_q.put_nowait('{"type": "heartbeat_ack"}')
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import pkgutil
 import sys
 import mimetypes
@@ -22,6 +23,7 @@ from flask import (
     g as flask_g,
     has_request_context,
     redirect,
+    stream_with_context,
 )
 from werkzeug.debug import tbtools
 
@@ -30,6 +32,8 @@ from dash import _validate
 from dash.exceptions import PreventUpdate, InvalidResourceError
 from dash._callback import _invoke_callback, _async_invoke_callback
 from dash._utils import parse_version
+from dash._streaming import JSONStream
+from ._batch import dispatch_batch, dispatch_batch_async
 from .base_server import BaseDashServer, RequestAdapter, ResponseAdapter
 
 
@@ -61,7 +65,11 @@ class FlaskResponseAdapter(ResponseAdapter):
         self._flask_response.headers.set(key, value)
 
     def set_response(self, **kwargs):
-        self._flask_response.set_data(kwargs.get("data", ""))
+        data = kwargs.get("data", "")
+        if isinstance(data, JSONStream):
+            self._flask_response.response = stream_with_context(iter(data))
+            return self._flask_response
+        self._flask_response.set_data(data)
         return self._flask_response
 
 
@@ -255,6 +263,7 @@ class FlaskDashServer(BaseDashServer[Flask]):
             body = request.get_json()
             # pylint: disable=protected-access
             cb_ctx = dash_app._initialize_context(body)
+            cb_ctx.can_stream = True
             func = dash_app._prepare_callback(cb_ctx, body)
             args = dash_app._inputs_to_vals(cb_ctx.inputs_list + cb_ctx.states_list)
             ctx = copy_context()
@@ -274,6 +283,7 @@ class FlaskDashServer(BaseDashServer[Flask]):
             body = request.get_json()
             # pylint: disable=protected-access
             cb_ctx = dash_app._initialize_context(body)
+            cb_ctx.can_stream = True
             func = dash_app._prepare_callback(cb_ctx, body)
             args = dash_app._inputs_to_vals(cb_ctx.inputs_list + cb_ctx.states_list)
             ctx = copy_context()
@@ -289,6 +299,35 @@ class FlaskDashServer(BaseDashServer[Flask]):
             return _dispatch_async
         return _dispatch
 
+    def serve_callback_batch(self, dash_app: Dash):
+        def _dispatch_batch():
+            response_adapter = self.response_adapter()
+            response_data = dispatch_batch(
+                dash_app,
+                request.get_json(),
+                response_adapter,
+                # pylint: disable=protected-access
+                self.get_callback_executor(dash_app._websocket_max_workers),
+                functools.partial(self.get_executor_for, dash_app),
+            )
+            return response_adapter.set_response(data=response_data)
+
+        async def _dispatch_batch_async():
+            response_adapter = self.response_adapter()
+            response_data = await dispatch_batch_async(
+                dash_app,
+                request.get_json(),
+                response_adapter,
+                # pylint: disable=protected-access
+                self.get_callback_executor(dash_app._websocket_max_workers),
+                functools.partial(self.get_executor_for, dash_app),
+            )
+            return response_adapter.set_response(data=response_data)
+
+        if dash_app._use_async:  # pylint: disable=protected-access
+            return _dispatch_batch_async
+        return _dispatch_batch
+
     def register_timing_hooks(self, _first_run: bool):
         # Define timing hooks inside method scope and register them
         def _before_request() -> None:
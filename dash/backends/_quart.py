@@ -3,6 +3,7 @@ from __future__ import annotations
 import typing as _t
 import mimetypes
 import inspect
+import functools
 import pkgutil
 import time
 import sys
@@ -13,7 +14,6 @@ import threading
 from urllib.parse import urlparse
 
 from logging.config import dictConfig
-from contextvars import copy_context
 from typing import Any, Dict, TYPE_CHECKING
 
 from importlib_metadata import version as _get_distribution_version
@@ -41,6 +41,7 @@ import janus
 from dash.exceptions import PreventUpdate, InvalidResourceError
 from dash.fingerprint import check_fingerprint
 from dash._utils import parse_version
+from dash._streaming import JSONStream
 from dash import _validate
 from .base_server import (
     BaseDashServer,
@@ -54,7 +55,9 @@ from .ws import (
     run_callback_on_loop,
     make_callback_done_handler,
     shutdown_ws_connection,
+    start_background_watch,
 )
+from ._batch import dispatch_batch_async
 from ._utils import format_traceback_html
 
 if TYPE_CHECKING:
@@ -85,7 +88,14 @@ class QuartResponseAdapter(ResponseAdapter):
         self._quart_response.headers.set(key, value)
 
     def set_response(self, **kwargs):
-        self._quart_response.set_data(kwargs.get("data", ""))
+        data = kwargs.get("data", "")
+        if isinstance(data, JSONStream):
+            # Sync iterables are consumed on a thread by Quart.
+            self._quart_response.response = self._quart_response.iterable_body_class(
+                chunk.encode("utf-8") for chunk in data
+            )
+            return self._quart_response
+        self._quart_response.set_data(data)
         return self._quart_response
 
 
@@ -388,22 +398,37 @@ class QuartDashServer(BaseDashServer[Quart]):
             body = await adapter.get_json()
             # pylint: disable=protected-access
             cb_ctx = dash_app._initialize_context(body)
+            cb_ctx.can_stream = True
             # pylint: disable=protected-access
             func = dash_app._prepare_callback(cb_ctx, body)
             # pylint: disable=protected-access
             args = dash_app._inputs_to_vals(cb_ctx.inputs_list + cb_ctx.states_list)
-            ctx = copy_context()
             # pylint: disable=protected-access
             partial_func = dash_app._execute_callback(
                 func, args, cb_ctx.outputs_list, cb_ctx
             )
-            response_data = ctx.run(partial_func)
-            if inspect.iscoroutine(response_data):  # if user callback is async
-                response_data = await response_data
+            response_data = await self.run_callback_async(
+                dash_app, body["output"], func, partial_func
+            )
             return cb_ctx.dash_response.set_response(data=response_data)  # type: ignore[arg-type]
 
         return _dispatch
 
+    def serve_callback_batch(self, dash_app: Dash):  # type: ignore[override]  # Quart always async
+        async def _dispatch_batch():
+            response_adapter = self.response_adapter()
+            response_data = await dispatch_batch_async(
+                dash_app,
+                await QuartRequestAdapter().get_json(),
+                response_adapter,
+                # pylint: disable=protected-access
+                self.get_callback_executor(dash_app._websocket_max_workers),
+                functools.partial(self.get_executor_for, dash_app),
+            )
+            return response_adapter.set_response(data=response_data)  # type: ignore[arg-type]
+
+        return _dispatch_batch
+
     def register_callback_api_routes(
         self, callback_api_paths: _t.Dict[str, _t.Callable[..., _t.Any]]
     ):
@@ -656,9 +681,9 @@ class QuartDashServer(BaseDashServer[Quart]):
                             task.add_done_callback(done_handler)
                             pending_callbacks[request_id] = task
                         else:
-                            # Submit callback to executor
+                            # Submit callback to its executor
                             future = run_callback_in_executor(
-                                executor,
+                                self.get_executor_for(dash_app, payload.get("output")),
                                 dash_app,
                                 payload,
                                 ws_cb,
@@ -679,6 +704,16 @@ class QuartDashServer(BaseDashServer[Quart]):
                         elif pending is not None:
                             pending.put_nowait(message.get("payload"))
 
+                    elif msg_type == "background_subscribe":
+                        start_background_watch(
+                            dash_app,
+                            message,
+                            outbound_queue,
+                            connection_shutdown_event,
+                            executor,
+                            pending_callbacks,
+                        )
+
                     elif msg_type == "heartbeat":
                         outbound_queue.sync_q.put_nowait('{"type": "heartbeat_ack"}')
 
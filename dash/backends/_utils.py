@@ -2,6 +2,19 @@ import traceback
 import re
 
 
+def callback_error_message(dash_app, error):
+    """The message of a callback error: its traceback with the dev tools UI."""
+    # pylint: disable=protected-access
+    if dash_app._dev_tools.ui:
+        return format_traceback_html(
+            error,
+            "prune" if dash_app._dev_tools.prune_errors else "raise",
+            "Dash Debugger",
+            dash_app.backend.server_type,
+        )
+    return "Internal server error."
+
+
 def format_traceback_html(error, error_handling_mode, title, backend):
     tb = error.__traceback__
     errors = traceback.format_exception(type(error), error, tb)
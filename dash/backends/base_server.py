@@ -5,8 +5,11 @@ for different web server backends (Flask, Quart, FastAPI, etc.) to integrate wit
 """
 from __future__ import annotations
 
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from typing import (
     Any,
     Dict,
@@ -17,6 +20,8 @@ from typing import (
     TYPE_CHECKING,
 )
 
+from dash.exceptions import UnknownCallbackExecutor
+
 if TYPE_CHECKING:
     import dash
 
@@ -190,32 +195,97 @@ class BaseDashServer(ABC, Generic[ServerType]):
         super().__init__()
         self.server = server
         self._callback_executor: ThreadPoolExecutor | None = None
+        self._named_callback_executors: Dict[str, ThreadPoolExecutor] = {}
 
     def get_callback_executor(
-        self, max_workers: int | None = None
+        self, max_workers: int | None = None, name: str | None = None
     ) -> ThreadPoolExecutor:
         """Get or create the shared thread pool executor for sync callbacks.
 
-        A single executor is shared across all WebSocket connections. Only
-        *sync* callbacks run here -- async callbacks (including session-persistent
-        ones) run directly on the connection event loop -- so worker threads are
-        released promptly and a fixed-size shared pool bounds the total thread
-        count regardless of how many connections are open.
+        A single executor is shared across all WebSocket connections and the
+        callback requests of the async backends. Only *sync* callbacks run
+        here -- async callbacks (including session-persistent ones) run
+        directly on the event loop -- so worker threads are released promptly
+        and a fixed-size shared pool bounds the total thread count regardless
+        of how many connections are open.
 
         Args:
             max_workers: Maximum number of worker threads. If None, uses default.
+            name: Name of a separate pool, declared in the ``callback_executors``
+                argument to ``Dash`` and selected by the callback ``executor``.
 
         Returns:
             ThreadPoolExecutor instance for running callbacks.
         """
+        if name is not None:
+            executor = self._named_callback_executors.get(name)
+            if executor is None:
+                executor = self._named_callback_executors[name] = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix=f"dash-{name}-"
+                )
+            return executor
         if self._callback_executor is None:
             self._callback_executor = ThreadPoolExecutor(
                 max_workers=max_workers, thread_name_prefix="dash-callback-"
             )
         return self._callback_executor
 
+    def get_executor_for(
+        self, dash_app: "dash.Dash", callback_id: str
+    ) -> ThreadPoolExecutor:
+        """Get the executor running a sync callback: the pool named by its
+        ``executor`` argument, or the shared pool.
+
+        Args:
+            dash_app: The Dash app the callback belongs to.
+            callback_id: The id of the callback (its ``output``).
+
+        Returns:
+            ThreadPoolExecutor instance for running the callback.
+        """
+        # pylint: disable=protected-access
+        name = dash_app.callback_map.get(callback_id, {}).get("executor")
+        if name is None:
+            return self.get_callback_executor(dash_app._websocket_max_workers)
+        if name not in dash_app._callback_executors:
+            raise UnknownCallbackExecutor(
+                f"Unknown callback executor '{name}', declare it in the "
+                "`callback_executors` argument to `Dash`."
+            )
+        return self.get_callback_executor(dash_app._callback_executors[name], name=name)
+
+    async def run_callback_async(
+        self, dash_app: "dash.Dash", callback_id: str, func: Any, partial_func: Any
+    ) -> Any:
+        """Run a callback from an async request handler.
+
+        Async callbacks run on the event loop. Sync callbacks run on their
+        executor, see ``get_executor_for``, so a slow one doesn't block the
+        other requests served by the event loop.
+
+        Args:
+            dash_app: The Dash app the callback belongs to.
+            callback_id: The id of the callback (its ``output``).
+            func: The registered callback function.
+            partial_func: The callback call prepared by ``_execute_callback``.
+
+        Returns:
+            The callback response.
+        """
+        # The copied context carries the request context into the worker.
+        ctx = copy_context()
+        if inspect.iscoroutinefunction(func):
+            response_data = ctx.run(partial_func)
+        else:
+            response_data = await asyncio.get_running_loop().run_in_executor(
+                self.get_executor_for(dash_app, callback_id), ctx.run, partial_func
+            )
+        if inspect.iscoroutine(response_data):
+            response_data = await response_data
+        return response_data
+
     def shutdown_executor(self, wait: bool = True) -> None:
-        """Shutdown the shared callback executor.
+        """Shutdown the shared and the named callback executors.
 
         Args:
             wait: If True, wait for pending tasks to complete.
@@ -223,6 +293,9 @@ class BaseDashServer(ABC, Generic[ServerType]):
         if self._callback_executor is not None:
             self._callback_executor.shutdown(wait=wait)
             self._callback_executor = None
+        for executor in self._named_callback_executors.values():
+            executor.shutdown(wait=wait)
+        self._named_callback_executors = {}
 
     def __call__(self, *args, **kwargs) -> Any:
         """Make the server wrapper callable as a WSGI/ASGI application.
@@ -393,6 +466,19 @@ class BaseDashServer(ABC, Generic[ServerType]):
             dash_app: The Dash application instance
         """
 
+    def serve_callback_batch(self, dash_app: "dash.Dash"):
+        """Set up the batched callback endpoint, used with ``batch_callbacks=True``.
+
+        The view receives a JSON array of callback payloads and returns the
+        array of their responses, see ``dash.backends._batch``.
+
+        Args:
+            dash_app: The Dash application instance
+        """
+        raise NotImplementedError(
+            f"The {type(self).__name__} backend does not support batch_callbacks."
+        )
+
     @abstractmethod
     def setup_index(self, dash_app: "dash.Dash"):
         """Set up the index/root route for serving the main application.
@@ -21,7 +21,8 @@ import janus
 
 from dash.exceptions import PreventUpdate, WebsocketDisconnected
 from dash.types import CallbackExecutionBody
-from dash._utils import to_json
+from dash._utils import stringify_id, to_json
+from dash._typed_arrays import decode_body
 
 if TYPE_CHECKING:
     import dash
@@ -32,6 +33,10 @@ SHUTDOWN_SIGNAL = "__shutdown__"
 DISCONNECTED = "__disconnected__"
 FLUSH_SIGNAL = "__flush__"
 
+# Seconds between the checks of a background job that publishes notifications,
+# only to find out about a job that died without publishing its result.
+BACKGROUND_LIVENESS_INTERVAL = 5.0
+
 
 class DashWebsocketCallback:
     """WebSocket callback communication via queues.
@@ -516,6 +521,8 @@ def _prepare_ws_partial(
 
     Shared by the threadpool (sync) and event-loop (async) dispatch paths.
     """
+    if dash_app._binary_arrays:  # pylint: disable=protected-access
+        payload = decode_body(payload)
     cb_ctx = create_ws_context(payload, response_adapter, ws_callback)
     # pylint: disable=protected-access
     func = dash_app._prepare_callback(cb_ctx, payload)
@@ -621,3 +628,147 @@ async def run_callback_on_loop(
     except Exception as e:  # pylint: disable=broad-exception-caught
         traceback.print_exc()
         return {"status": "error", "message": str(e)}
+
+
+def _background_updates(background: dict, manager: Any, key: str, job: str):
+    """Read the progress and set_props published by a background job.
+
+    Returns the set_props payloads and whether the job is done.
+    """
+    updates = []
+    progress_outputs = background.get("progress")
+    if progress_outputs:
+        progress = manager.get_progress(key)
+        if progress:
+            for output, value in zip(progress_outputs, progress):
+                updates.append(
+                    {
+                        "componentId": stringify_id(output.component_id),
+                        "props": {output.component_property: value},
+                    }
+                )
+    for component_id, props in manager.get_updated_props(key).items():
+        updates.append({"componentId": component_id, "props": props})
+
+    done = manager.result_ready(key) or not manager.job_running(job)
+    return updates, done
+
+
+async def watch_background_job(
+    dash_app: "dash.Dash",
+    payload: dict,
+    renderer_id: str,
+    request_id: str,
+    outbound_queue: janus.Queue[str],
+    shutdown_event: threading.Event,
+    executor: ThreadPoolExecutor,
+) -> None:
+    """Push the progress and set_props of a background job to the renderer.
+
+    The renderer subscribes with the ``cacheKey`` and ``job`` returned by the
+    request that started the job, instead of polling them over HTTP. Updates are
+    sent as ``set_props`` messages, then ``background_done`` once the result is
+    ready (or the job is gone) and the renderer fetches it with a last request.
+
+    Managers that publish notifications (``subscribe``) wake the watcher up,
+    the others are checked at the ``interval`` of the callback.
+
+    Args:
+        dash_app: The Dash application instance
+        payload: ``output``, ``cacheKey`` and ``job`` of the background callback
+        renderer_id: The renderer ID for routing the messages
+        request_id: The request ID answered by ``background_done``
+        outbound_queue: janus.Queue for sending the messages
+        shutdown_event: Event signaling the websocket connection has closed.
+        executor: Executor running the (blocking) manager reads
+    """
+    loop = asyncio.get_running_loop()
+    key, job = payload.get("cacheKey"), payload.get("job")
+    cb = dash_app.callback_map.get(payload.get("output", ""), {})
+    background = cb.get("background")
+    # pylint: disable=protected-access
+    manager = cb.get("manager") or dash_app._background_manager
+
+    def send(msg: dict) -> None:
+        if not shutdown_event.is_set():
+            outbound_queue.sync_q.put_nowait(cast(str, to_json(msg)))
+
+    unsubscribe = None
+    try:
+        if background and manager and key:
+            wake = asyncio.Event()
+            unsubscribe = manager.subscribe(
+                key, lambda: loop.call_soon_threadsafe(wake.set)
+            )
+            interval = (
+                BACKGROUND_LIVENESS_INTERVAL
+                if unsubscribe
+                else background.get("interval", 1000) / 1000
+            )
+
+            while not shutdown_event.is_set():
+                wake.clear()
+                updates, done = await loop.run_in_executor(
+                    executor, _background_updates, background, manager, key, job
+                )
+                for update in updates:
+                    send(
+                        {
+                            "type": "set_props",
+                            "rendererId": renderer_id,
+                            "payload": update,
+                        }
+                    )
+                if done:
+                    break
+                if updates:
+                    outbound_queue.sync_q.put_nowait(FLUSH_SIGNAL)
+                try:
+                    await asyncio.wait_for(wake.wait(), interval)
+                except asyncio.TimeoutError:
+                    pass
+    except Exception:  # pylint: disable=broad-exception-caught
+        # The renderer fetches the job state over HTTP, where errors surface.
+        traceback.print_exc()
+    finally:
+        if unsubscribe:
+            unsubscribe()
+
+    send(
+        {
+            "type": "background_done",
+            "rendererId": renderer_id,
+            "requestId": request_id,
+        }
+    )
+    if not shutdown_event.is_set():
+        outbound_queue.sync_q.put_nowait(FLUSH_SIGNAL)
+
+
+def start_background_watch(
+    dash_app: "dash.Dash",
+    message: dict,
+    outbound_queue: janus.Queue[str],
+    shutdown_event: threading.Event,
+    executor: ThreadPoolExecutor,
+    pending_callbacks: dict,
+) -> None:
+    """Start pushing the updates of a background job started over HTTP.
+
+    Handles the ``background_subscribe`` messages, the watcher task is
+    tracked in ``pending_callbacks`` until it ends.
+    """
+    request_id = message.get("requestId")
+    task = asyncio.create_task(
+        watch_background_job(
+            dash_app,
+            message.get("payload", {}),
+            message.get("rendererId", ""),
+            request_id,
+            outbound_queue,
+            shutdown_event,
+            executor,
+        )
+    )
+    task.add_done_callback(lambda _: pending_callbacks.pop(request_id, None))
+    pending_callbacks[request_id] = task
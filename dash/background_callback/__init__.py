@@ -1,3 +1,7 @@
+from .managers import JobQueue  # noqa: F401,E402
+from .managers.asyncio_manager import (  # noqa: F401,E402
+    AsyncioManager,
+)
 from .managers.celery_manager import (  # noqa: F401,E402
     CeleryManager,
 )
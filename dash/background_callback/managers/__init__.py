@@ -1,7 +1,109 @@
 from abc import ABC
 import inspect
 import hashlib
-from typing import Any, List
+import json
+import sys
+from typing import Any, Dict, List, NamedTuple
+
+
+class JobState(NamedTuple):
+    """The state of a background job read by ``poll``."""
+
+    # Progress published since the last poll, None if none.
+    progress: Any
+    # Result of the job, ``UNDEFINED`` while it runs.
+    result: Any
+    # set_props calls since the last poll, by component id.
+    updated_props: Dict[str, Any]
+    # Whether the job is still running, after its result was read.
+    running: bool
+
+
+# Name of the jobs of the callbacks without a queue in the queue stats.
+DEFAULT_QUEUE = "default"
+
+
+def merge_updated_props(updates):
+    """Merge the set_props calls of a job, in order, by component and prop."""
+    merged = {}
+    for update in updates:
+        for component_id, props in update.items():
+            merged.setdefault(component_id, {}).update(props)
+    return merged
+
+
+class JobQueue:
+    """
+    Concurrency limits and priority of the background jobs of the callbacks
+    using it, ``callback(..., background=True, queue=JobQueue(...))``.
+
+    Jobs over a limit wait until a running job of the same scope ends, the
+    waiting jobs of the highest ``priority`` start first.
+    """
+
+    def __init__(
+        self,
+        name,
+        max_jobs=None,
+        max_jobs_per_callback=None,
+        max_jobs_per_session=None,
+        priority=0,
+        session=None,
+        celery_queue=None,
+    ):
+        """
+        :param name:
+            Name of the queue, the jobs of the queues sharing a name share
+            their limits. Used as key of ``manager.queue_stats()``.
+        :param max_jobs:
+            Maximum number of jobs of the queue running at once.
+        :param max_jobs_per_callback:
+            Maximum number of jobs of the queue running at once for each
+            callback.
+        :param max_jobs_per_session:
+            Maximum number of jobs of the queue running at once for each
+            session, see ``session``.
+        :param priority:
+            The waiting jobs of higher priority start first. ``CeleryManager``
+            passes it as the task ``priority``, ordered by the broker. A task
+            retried while its queue is full is sent again with its priority,
+            behind the tasks of the same priority sent in the meantime: the
+            order of arrival isn't kept across the retries.
+        :param session:
+            A zero-argument function returning the session of the request
+            starting a job, required with ``max_jobs_per_session``, e.g.
+            ``lambda: flask.session["user_id"]``. The remote address isn't
+            used as a default: the users behind a proxy or a NAT share it,
+            and would share the session limit.
+        :param celery_queue:
+            With ``CeleryManager``, name of the Celery queue the jobs are sent
+            to, for workers consuming it (``celery worker -Q <celery_queue>``).
+        """
+        if max_jobs_per_session is not None and session is None:
+            raise ValueError(
+                "max_jobs_per_session requires a `session` function returning "
+                "the session of the request."
+            )
+        self.name = name
+        self.max_jobs = max_jobs
+        self.max_jobs_per_callback = max_jobs_per_callback
+        self.max_jobs_per_session = max_jobs_per_session
+        self.priority = priority
+        self.session = session
+        self.celery_queue = celery_queue
+
+    def spec(self, callback, session):
+        """The limits of a job of ``callback`` started by ``session``, as a dict."""
+        return {
+            "name": self.name,
+            "max_jobs": self.max_jobs,
+            "max_jobs_per_callback": self.max_jobs_per_callback,
+            "max_jobs_per_session": self.max_jobs_per_session,
+            "priority": self.priority,
+            "celery_queue": self.celery_queue,
+            "callback": callback,
+            "session": session,
+        }
 
 
 class BaseBackgroundCallbackManager(ABC):
@@ -13,6 +115,9 @@ class BaseBackgroundCallbackManager(ABC):
     # Keep every function for late registering.
     functions: List[Any] = []
 
+    # Source hash of the functions, part of the cache keys.
+    fingerprints: Dict[Any, str] = {}
+
     def __init__(self, cache_by):
         if cache_by is not None and not isinstance(cache_by, list):
             cache_by = [cache_by]
@@ -40,7 +145,14 @@ class BaseBackgroundCallbackManager(ABC):
     def make_job_fn(self, fn, progress, key=None):
         raise NotImplementedError
 
-    def call_job_fn(self, key, job_fn, args, context):
+    def call_job_fn(self, key, job_fn, args, context, queue=None):
+        raise NotImplementedError
+
+    def queue_stats(self):
+        """
+        The number of jobs waiting and running by queue name, as
+        ``{"waiting": {name: count}, "running": {name: count}}``.
+        """
         raise NotImplementedError
 
     def get_progress(self, key):
@@ -55,13 +167,34 @@ class BaseBackgroundCallbackManager(ABC):
     def get_updated_props(self, key):
         raise NotImplementedError
 
-    def build_cache_key(self, fn, args, cache_args_to_ignore, triggered):
-        try:
-            fn_source = inspect.getsource(fn)
-            fn_str = fn_source
-        except OSError:  # pylint: disable=too-broad-exception
-            fn_str = getattr(fn, "__name__", "")
+    def poll(self, key, job):
+        """
+        Read the progress, the result, the set_props and the liveness of a job
+        at once, as a ``JobState``. Like the individual methods, the progress
+        and the set_props are consumed, and the job is released once its
+        result is read.
+
+        Managers override it to read the backend in one round trip, the
+        default calls the individual methods.
+        """
+        progress = self.get_progress(key)
+        result = self.get_result(key, job)
+        # After get_result, which terminates the job.
+        running = bool(self.job_running(job))
+        return JobState(progress, result, self.get_updated_props(key), running)
 
+    def subscribe(self, key, notify):
+        """
+        Call ``notify()``, from any thread, when the job writing to ``key``
+        publishes progress, set_props or its result.
+
+        Returns a function to unsubscribe, or None if the manager has no
+        notifications and the job must be polled.
+        """
+        # pylint: disable=unused-argument
+        return None
+
+    def build_cache_key(self, fn, args, cache_args_to_ignore, triggered):
         if not isinstance(cache_args_to_ignore, (list, tuple)):
             cache_args_to_ignore = [cache_args_to_ignore]
 
@@ -73,22 +206,35 @@ class BaseBackgroundCallbackManager(ABC):
                     arg for i, arg in enumerate(args) if i not in cache_args_to_ignore
                 ]
 
-        hash_dict = dict(args=args, fn_source=fn_str, triggered=triggered)
+        hasher = hashlib.sha256()
+        hasher.update(self.fingerprint(fn).encode("utf-8"))
+        _hash_value(hasher, args)
+        _hash_value(hasher, triggered)
 
         if self.cache_by is not None:
             # Caching enabled
-            for i, cache_item in enumerate(self.cache_by):
+            for cache_item in self.cache_by:
                 # Call cache function
-                hash_dict[f"cache_key_{i}"] = cache_item()
+                _hash_value(hasher, cache_item())
 
-        return hashlib.sha256(str(hash_dict).encode("utf-8")).hexdigest()
+        return hasher.hexdigest()
 
     def register(self, key, fn, progress):
         self.func_registry[key] = self.make_job_fn(fn, progress, key)
 
+    @staticmethod
+    def fingerprint(fn):
+        """Hash of the function source, computed once per function."""
+        fingerprint = BaseBackgroundCallbackManager.fingerprints.get(fn)
+        if fingerprint is None:
+            fingerprint = BaseBackgroundCallbackManager.hash_function(fn)
+            BaseBackgroundCallbackManager.fingerprints[fn] = fingerprint
+        return fingerprint
+
     @staticmethod
     def register_func(fn, progress, callback_id):
         key = BaseBackgroundCallbackManager.hash_function(fn, callback_id)
+        BaseBackgroundCallbackManager.fingerprint(fn)
         BaseBackgroundCallbackManager.functions.append(
             (
                 key,
@@ -110,6 +256,39 @@ class BaseBackgroundCallbackManager(ABC):
     def _make_set_props_key(key):
         return f"{key}-set_props"
 
+    @staticmethod
+    def _job_admitted(queue, running):
+        """Whether a job of ``queue`` can start next to the ``running`` jobs' queues."""
+        if queue is None:
+            return True
+        same_queue = [
+            spec for spec in running if spec and spec["name"] == queue["name"]
+        ]
+        limits = (
+            ("max_jobs", same_queue),
+            (
+                "max_jobs_per_callback",
+                [spec for spec in same_queue if spec["callback"] == queue["callback"]],
+            ),
+            (
+                "max_jobs_per_session",
+                [spec for spec in same_queue if spec["session"] == queue["session"]],
+            ),
+        )
+        return all(
+            queue[limit] is None or len(jobs) < queue[limit] for limit, jobs in limits
+        )
+
+    @staticmethod
+    def _count_jobs(waiting, running):
+        """``queue_stats`` of the queues of the waiting and running jobs."""
+        stats = {"waiting": {}, "running": {}}
+        for state, queues in (("waiting", waiting), ("running", running)):
+            for queue in queues:
+                name = queue["name"] if queue else DEFAULT_QUEUE
+                stats[state][name] = stats[state].get(name, 0) + 1
+        return stats
+
     @staticmethod
     def hash_function(fn, callback_id=""):
         try:
@@ -120,3 +299,43 @@ class BaseBackgroundCallbackManager(ABC):
         return hashlib.sha256(
             callback_id.encode("utf-8") + fn_str.encode("utf-8")
         ).hexdigest()
+
+
+def _hash_value(hasher, value):
+    """
+    Feed a value to the hasher as canonical JSON (sorted dict keys) built by
+    the C encoder, arrays and dataframes are hashed from their buffers.
+    """
+    try:
+        data = json.dumps(
+            value, sort_keys=True, separators=(",", ":"), default=_digest_value
+        )
+    except TypeError:
+        # Dict keys of mixed types can't be sorted.
+        data = json.dumps(value, separators=(",", ":"), default=_digest_value)
+    hasher.update(data.encode("utf-8", "surrogatepass"))
+
+
+def _digest_value(value):
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            return {"__ndarray__": str(value.shape), "items": value.tolist()}
+        digest = hashlib.sha256(
+            np.ascontiguousarray(value).reshape(-1).view(np.uint8)
+        ).hexdigest()
+        return {"__ndarray__": f"{value.dtype.str}{value.shape}", "sha256": digest}
+
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        if isinstance(value, pd.DataFrame):
+            meta = [[str(c) for c in value.columns], [str(t) for t in value.dtypes]]
+        else:
+            meta = str(value.dtype)
+        hashes = pd.util.hash_pandas_object(
+            value, index=not isinstance(value, pd.Index)
+        )
+        digest = hashlib.sha256(hashes.to_numpy()).hexdigest()
+        return {"__pandas__": type(value).__name__, "meta": meta, "sha256": digest}
+
+    return {"__repr__": repr(value)}
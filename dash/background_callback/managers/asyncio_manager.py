@@ -0,0 +1,290 @@
+import asyncio
+import inspect
+import os
+import threading
+import time
+import traceback
+import uuid
+
+from dash._callback_context import context_value
+from dash._utils import AttributeDict
+from dash.exceptions import PreventUpdate
+from dash.background_callback._proxy_set_props import ProxySetProps
+from dash.background_callback.managers import (
+    BaseBackgroundCallbackManager,
+    JobState,
+    merge_updated_props,
+)
+
+
+class AsyncioManager(BaseBackgroundCallbackManager):
+    """Manage the background execution of callbacks with asyncio tasks and an in-memory result store."""
+
+    def __init__(self, cache_by=None, expire=None, loop=None):
+        """
+        Background callback manager that runs callback logic as tasks on an
+        asyncio event loop of the server process, and stores results in memory.
+
+        Jobs start without a new process, for the background callbacks awaiting
+        I/O (HTTP APIs, databases...). Sync callbacks run in the default
+        executor of the loop. Cancelling a job cancels its task; a sync
+        callback already running in the executor runs to its end.
+
+        The jobs and their results live in the server process: use a single
+        process server, requests served by another process don't find them.
+
+        :param cache_by:
+            A list of zero-argument functions.  When provided, caching is enabled and
+            the return values of these functions are combined with the callback
+            function's input arguments, triggered inputs and source code to generate cache keys.
+        :param expire:
+            If provided, a cache entry will be removed when it has not been accessed
+            for ``expire`` seconds.  If not provided, cached results are kept until
+            the process exits.
+        :param loop:
+            The event loop running the jobs, for instance the loop of the ASGI
+            server. It must be running when the jobs are submitted. If not
+            provided, the jobs run on a loop of a dedicated thread, started with
+            the first job.
+        """
+        self.expire = expire
+        self._loop = loop
+        self._thread_loop = None
+        self._thread_loop_owner = None
+        self._lock = threading.Lock()
+        # Cache key and future of the running jobs, by job id.
+        self._jobs = {}
+        # Results by cache key, with the time they expire.
+        self._results = {}
+        self._progress = {}
+        self._updated_props = {}
+        self._subscribers = {}
+        super().__init__(cache_by)
+
+    def terminate_job(self, job):
+        if job is None:
+            return
+
+        with self._lock:
+            key, future = self._jobs.pop(job, (None, None))
+            if key is not None:
+                # Nobody reads the updates of a cancelled job.
+                self._progress.pop(self._make_progress_key(key), None)
+                self._updated_props.pop(self._make_set_props_key(key), None)
+        if future is not None:
+            # Cancels the task on its loop.
+            future.cancel()
+
+    def terminate_unhealthy_job(self, job):
+        with self._lock:
+            if job in self._jobs and not self._job_running(job):
+                del self._jobs[job]
+                return True
+        return False
+
+    def job_running(self, job):
+        with self._lock:
+            return self._job_running(job)
+
+    def _job_running(self, job):
+        _, future = self._jobs.get(job, (None, None))
+        return future is not None and not future.done()
+
+    def make_job_fn(self, fn, progress, key=None):
+        return _make_job_fn(fn, self, progress)
+
+    def clear_cache_entry(self, key):
+        with self._lock:
+            self._results.pop(key, None)
+
+    def call_job_fn(self, key, job_fn, args, context, queue=None):
+        if queue is not None:
+            raise ValueError("AsyncioManager does not support JobQueue limits.")
+        job = uuid.uuid4().hex
+        future = asyncio.run_coroutine_threadsafe(
+            job_fn(key, self._make_progress_key(key), args, context),
+            self._get_loop(),
+        )
+        with self._lock:
+            self._jobs[job] = (key, future)
+        return job
+
+    def queue_stats(self):
+        with self._lock:
+            running = [job for job in self._jobs if self._job_running(job)]
+        return self._count_jobs([], [None] * len(running))
+
+    def _get_loop(self):
+        if self._loop is not None:
+            return self._loop
+
+        with self._lock:
+            if self._thread_loop_owner != os.getpid():
+                # First job, or the app process was forked with the loop started.
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="dash-asyncio-manager", daemon=True
+                ).start()
+                self._thread_loop = loop
+                self._thread_loop_owner = os.getpid()
+            return self._thread_loop
+
+    def get_progress(self, key):
+        with self._lock:
+            return self._progress.pop(self._make_progress_key(key), None)
+
+    def result_ready(self, key):
+        with self._lock:
+            return self._read_result(key) is not self.UNDEFINED
+
+    def get_result(self, key, job):
+        with self._lock:
+            result = self._consume_result(key)
+        if result is not self.UNDEFINED:
+            self.terminate_job(job)
+        return result
+
+    def poll(self, key, job):
+        with self._lock:
+            progress = self._progress.pop(self._make_progress_key(key), None)
+            # The job stores its result before its task is done.
+            running = self._job_running(job)
+            result = self._consume_result(key)
+            updated_props = merge_updated_props(
+                self._updated_props.pop(self._make_set_props_key(key), [])
+            )
+            if result is not self.UNDEFINED:
+                self._jobs.pop(job, None)
+                running = False
+        return JobState(progress, result, updated_props, running)
+
+    def get_updated_props(self, key):
+        with self._lock:
+            return merge_updated_props(
+                self._updated_props.pop(self._make_set_props_key(key), [])
+            )
+
+    def subscribe(self, key, notify):
+        with self._lock:
+            self._subscribers.setdefault(key, set()).add(notify)
+
+        def unsubscribe():
+            with self._lock:
+                subscribers = self._subscribers.get(key)
+                if subscribers is not None:
+                    subscribers.discard(notify)
+                    if not subscribers:
+                        del self._subscribers[key]
+
+        return unsubscribe
+
+    def _read_result(self, key):
+        entry = self._results.get(key)
+        if entry is None:
+            return self.UNDEFINED
+        result, expires_at = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self._results[key]
+            return self.UNDEFINED
+        return result
+
+    def _consume_result(self, key):
+        result = self._read_result(key)
+        if result is self.UNDEFINED:
+            return result
+        # Clear result if not caching
+        if self.cache_by is None:
+            del self._results[key]
+        elif self.expire:
+            self._results[key] = (result, time.monotonic() + self.expire)
+        self._progress.pop(self._make_progress_key(key), None)
+        return result
+
+    def _store(self, key, publish):
+        with self._lock:
+            publish()
+            subscribers = list(self._subscribers.get(key, ()))
+        for notify in subscribers:
+            notify()
+
+    def _set_result(self, key, result):
+        def publish():
+            now = time.monotonic()
+            if self.expire:
+                # Results never read again.
+                for other, (_, expires_at) in list(self._results.items()):
+                    if expires_at < now:
+                        del self._results[other]
+            self._results[key] = (result, now + self.expire if self.expire else None)
+
+        self._store(key, publish)
+
+    def _set_progress(self, key, progress):
+        def publish():
+            self._progress[self._make_progress_key(key)] = progress
+
+        self._store(key, publish)
+
+    def _set_props(self, key, update):
+        def publish():
+            self._updated_props.setdefault(self._make_set_props_key(key), []).append(
+                update
+            )
+
+        self._store(key, publish)
+
+
+def _make_job_fn(fn, manager, progress):
+    async def job_fn(result_key, progress_key, user_callback_args, context):
+        # pylint: disable=unused-argument
+        def _set_progress(progress_value):
+            if not isinstance(progress_value, (list, tuple)):
+                progress_value = [progress_value]
+
+            manager._set_progress(  # pylint: disable=protected-access
+                result_key, progress_value
+            )
+
+        maybe_progress = [_set_progress] if progress else []
+
+        def _set_props(_id, props):
+            manager._set_props(  # pylint: disable=protected-access
+                result_key, {_id: props}
+            )
+
+        # The task runs in a copy of the context of the loop.
+        c = AttributeDict(**context)
+        c.ignore_register_page = False
+        c.updated_props = ProxySetProps(_set_props)
+        context_value.set(c)
+
+        if isinstance(user_callback_args, dict):
+            args, kwargs = maybe_progress, user_callback_args
+        elif isinstance(user_callback_args, (list, tuple)):
+            args, kwargs = [*maybe_progress, *user_callback_args], {}
+        else:
+            args, kwargs = [*maybe_progress, user_callback_args], {}
+
+        try:
+            if inspect.iscoroutinefunction(fn):
+                user_callback_output = await fn(*args, **kwargs)
+            else:
+                # Copies the context to the executor thread.
+                user_callback_output = await asyncio.to_thread(fn, *args, **kwargs)
+            if asyncio.iscoroutine(user_callback_output):
+                user_callback_output = await user_callback_output
+        except PreventUpdate:
+            user_callback_output = {"_dash_no_update": "_dash_no_update"}
+        except Exception as err:  # pylint: disable=broad-except
+            user_callback_output = {
+                "background_callback_error": {
+                    "msg": str(err),
+                    "tb": traceback.format_exc(),
+                }
+            }
+
+        manager._set_result(  # pylint: disable=protected-access
+            result_key, user_callback_output
+        )
+
+    return job_fn
@@ -1,6 +1,10 @@
+import contextlib
 import inspect
 import json
+import threading
+import time
 import traceback
+import uuid
 from contextvars import copy_context
 import asyncio
 from functools import partial
@@ -11,7 +15,30 @@ from dash._callback_context import context_value
 from dash._utils import AttributeDict
 from dash.exceptions import PreventUpdate
 from dash.background_callback._proxy_set_props import ProxySetProps
-from dash.background_callback.managers import BaseBackgroundCallbackManager
+from dash.background_callback.managers import (
+    BaseBackgroundCallbackManager,
+    JobState,
+    merge_updated_props,
+)
+
+# Redis pub/sub channel prefix of the job notifications, see `subscribe`.
+_CHANNEL_PREFIX = "dash-bg:"
+
+# Celery task states of a job not done yet.
+_RUNNING_STATES = ("PENDING", "RECEIVED", "STARTED", "RETRY", "PROGRESS")
+
+# Redis hashes of the queues of the jobs with limits by task id, waiting for a
+# slot or running, the time the slots of the running tasks expire unless
+# renewed by their task, and the lock of their updates.
+_QUEUE_WAITING = "dash-queue-waiting"
+_QUEUE_RUNNING = "dash-queue-running"
+_QUEUE_LEASES = "dash-queue-leases"
+_QUEUE_LOCK = "dash-queue-lock"
+# Seconds before a task without a slot is retried.
+_QUEUE_RETRY_DELAY = 1
+# Seconds a slot is held without being renewed: the slot of a task whose worker
+# was killed is freed after it. Renewed by the task every third of it.
+_QUEUE_LEASE = 30
 
 
 class CeleryManager(BaseBackgroundCallbackManager):
@@ -56,6 +83,9 @@ CeleryManager requires extra dependencies which can be installed doing
 
         self.handle = celery_app
         self.expire = expire
+        self._subscribers = {}
+        self._subscribers_lock = threading.Lock()
+        self._listener = None
         super().__init__(cache_by)
 
     def terminate_job(self, job):
@@ -72,13 +102,7 @@ CeleryManager requires extra dependencies which can be installed doing
 
     def job_running(self, job):
         future = self.get_task(job)
-        return future and future.status in (
-            "PENDING",
-            "RECEIVED",
-            "STARTED",
-            "RETRY",
-            "PROGRESS",
-        )
+        return future and future.status in _RUNNING_STATES
 
     def make_job_fn(self, fn, progress, key=None):
         return _make_job_fn(fn, self.handle, progress, key)
@@ -92,9 +116,39 @@ CeleryManager requires extra dependencies which can be installed doing
     def clear_cache_entry(self, key):
         self.handle.backend.delete(key)
 
-    def call_job_fn(self, key, job_fn, args, context):
-        task = job_fn.delay(key, self._make_progress_key(key), args, context)
-        return task.task_id
+    def call_job_fn(self, key, job_fn, args, context, queue=None):
+        if queue is None:
+            task = job_fn.delay(key, self._make_progress_key(key), args, context)
+            return task.task_id
+
+        client = _redis_client(self.handle.backend)
+        if client is None:
+            raise ValueError(
+                "The limits of a JobQueue require the redis result backend."
+            )
+        task_id = uuid.uuid4().hex
+        # The task takes a slot when it starts, retried while none is free.
+        client.hset(_QUEUE_WAITING, task_id, json.dumps(queue))
+        options = {"task_id": task_id}
+        if queue["priority"]:
+            options["priority"] = queue["priority"]
+        if queue["celery_queue"]:
+            options["queue"] = queue["celery_queue"]
+        job_fn.apply_async(
+            (key, self._make_progress_key(key), args, context),
+            {"job_queue": queue},
+            **options,
+        )
+        return task_id
+
+    def queue_stats(self):
+        client = _redis_client(self.handle.backend)
+        if client is None:
+            return self._count_jobs([], [])
+        with client.lock(_QUEUE_LOCK, timeout=10):
+            waiting = _waiting_jobs(self.handle, client)
+            running = _running_jobs(client)
+        return self._count_jobs(waiting.values(), running.values())
 
     def get_progress(self, key):
         progress_key = self._make_progress_key(key)
@@ -128,36 +182,263 @@ CeleryManager requires extra dependencies which can be installed doing
         self.terminate_job(job)
         return result
 
+    def poll(self, key, job):
+        backend = self.handle.backend
+        client = _redis_client(backend)
+        if client is None:
+            # Only the redis result backend can be read in one round trip.
+            return super().poll(key, job)
+
+        progress_key = self._make_progress_key(key)
+        set_props_key = self._make_set_props_key(key)
+        # Read and consume the entries in one transaction.
+        pipe = client.pipeline(transaction=True)
+        pipe.get(progress_key)
+        pipe.get(key)
+        pipe.lrange(set_props_key, 0, -1)
+        if job:
+            pipe.get(backend.get_key_for_task(job))
+        pipe.delete(progress_key, set_props_key)
+        if self.cache_by is None:
+            pipe.delete(key)
+        elif self.expire:
+            pipe.expire(key, self.expire)
+        progress, result, updated_props, *rest = pipe.execute()
+
+        if result is None:
+            result = self.UNDEFINED
+            # A task without state in the backend is pending.
+            meta = backend.decode_result(rest[0]) if job and rest[0] else None
+            running = bool(job) and (meta is None or meta["status"] in _RUNNING_STATES)
+        else:
+            result = json.loads(result)
+            self.terminate_job(job)
+            running = False
+        return JobState(
+            json.loads(progress) if progress else None,
+            result,
+            merge_updated_props(json.loads(update) for update in updated_props),
+            running,
+        )
+
     def get_updated_props(self, key):
-        updated_props = self.handle.backend.get(self._make_set_props_key(key))
+        set_props_key = self._make_set_props_key(key)
+        client = _redis_client(self.handle.backend)
+        if client is not None:
+            # Read and clear the list of the job in one transaction.
+            pipe = client.pipeline(transaction=True)
+            pipe.lrange(set_props_key, 0, -1)
+            pipe.delete(set_props_key)
+            updates, _ = pipe.execute()
+            return merge_updated_props(json.loads(update) for update in updates)
+
+        updated_props = self.handle.backend.get(set_props_key)
         if updated_props is None:
             return {}
 
-        self.clear_cache_entry(key)
+        self.clear_cache_entry(set_props_key)
 
         return json.loads(updated_props)
 
+    def subscribe(self, key, notify):
+        client = getattr(self.handle.backend, "client", None)
+        if not hasattr(client, "pubsub"):
+            # Only the redis result backend has notifications.
+            return None
+
+        with self._subscribers_lock:
+            self._subscribers.setdefault(key, set()).add(notify)
+            if self._listener is None:
+                # A single pattern subscription per process, dispatched to the
+                # subscribers by cache key.
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(**{f"{_CHANNEL_PREFIX}*": self._dispatch})
+                self._listener = pubsub.run_in_thread(sleep_time=1, daemon=True)
+
+        def unsubscribe():
+            with self._subscribers_lock:
+                subscribers = self._subscribers.get(key)
+                if subscribers is not None:
+                    subscribers.discard(notify)
+                    if not subscribers:
+                        del self._subscribers[key]
+
+        return unsubscribe
+
+    def _dispatch(self, message):
+        channel = message["channel"]
+        if isinstance(channel, bytes):
+            channel = channel.decode("utf-8")
+        with self._subscribers_lock:
+            subscribers = list(
+                self._subscribers.get(channel[len(_CHANNEL_PREFIX) :], ())
+            )
+        for notify in subscribers:
+            notify()
+
+
+def _redis_client(cache):
+    """The redis client of the result backend, None for other backends."""
+    client = getattr(cache, "client", None)
+    return client if hasattr(client, "pipeline") else None
+
+
+def _append_set_props(cache, key, update):
+    client = _redis_client(cache)
+    if client is None:
+        # Backends without lists: merged in place.
+        previous = cache.get(key)
+        if previous is not None:
+            update = merge_updated_props([json.loads(previous), update])
+        cache.set(key, json.dumps(update, cls=PlotlyJSONEncoder))
+        return
+    # Appended to the list of the job, merged when read by the server.
+    pipe = client.pipeline()
+    pipe.rpush(key, json.dumps(update, cls=PlotlyJSONEncoder))
+    if getattr(cache, "expires", None):
+        pipe.expire(key, int(cache.expires))
+    pipe.execute()
+
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _waiting_jobs(celery_app, client):
+    """The queues of the jobs waiting for a slot by task id, without the ended tasks."""
+    jobs = {
+        _decode(task_id): json.loads(queue)
+        for task_id, queue in client.hgetall(_QUEUE_WAITING).items()
+    }
+    ended = [
+        task_id
+        for task_id in jobs
+        if celery_app.AsyncResult(task_id).state in ("SUCCESS", "FAILURE", "REVOKED")
+    ]
+    if ended:
+        client.hdel(_QUEUE_WAITING, *ended)
+        for task_id in ended:
+            del jobs[task_id]
+    return jobs
+
+
+def _running_jobs(client):
+    """The queues of the jobs holding a slot by task id, without the expired slots."""
+    jobs = {
+        _decode(task_id): json.loads(queue)
+        for task_id, queue in client.hgetall(_QUEUE_RUNNING).items()
+    }
+    leases = {
+        _decode(task_id): float(expires)
+        for task_id, expires in client.hgetall(_QUEUE_LEASES).items()
+    }
+    now = time.time()
+    expired = [task_id for task_id in jobs if leases.get(task_id, 0) < now]
+    if expired:
+        pipe = client.pipeline(transaction=True)
+        pipe.hdel(_QUEUE_RUNNING, *expired)
+        pipe.hdel(_QUEUE_LEASES, *expired)
+        pipe.execute()
+        for task_id in expired:
+            del jobs[task_id]
+    return jobs
+
+
+def _hold_slot(client, task_id, job_queue):
+    """The pipeline taking or renewing the slot of the task, to execute."""
+    pipe = client.pipeline(transaction=True)
+    pipe.hset(_QUEUE_RUNNING, task_id, json.dumps(job_queue))
+    pipe.hset(_QUEUE_LEASES, task_id, time.time() + _QUEUE_LEASE)
+    return pipe
+
+
+def _take_slot(client, task_id, job_queue):
+    """Take a slot of the queue for the task if its limits allow it."""
+    with client.lock(_QUEUE_LOCK, timeout=10):
+        admitted = BaseBackgroundCallbackManager._job_admitted(  # pylint: disable=protected-access
+            job_queue, _running_jobs(client).values()
+        )
+        if admitted:
+            pipe = _hold_slot(client, task_id, job_queue)
+            pipe.hdel(_QUEUE_WAITING, task_id)
+            pipe.execute()
+    return admitted
+
+
+def _renew_slot(client, task_id, job_queue, stop):
+    while not stop.wait(_QUEUE_LEASE / 3):
+        try:
+            _hold_slot(client, task_id, job_queue).execute()
+        except Exception:  # pylint: disable=broad-except
+            # Renewed at the next beat, before the slot expires.
+            pass
+
+
+def _release_slot(client, task_id):
+    pipe = client.pipeline(transaction=True)
+    pipe.hdel(_QUEUE_RUNNING, task_id)
+    pipe.hdel(_QUEUE_LEASES, task_id)
+    pipe.execute()
+
+
+@contextlib.contextmanager
+def _queue_slot(celery_app, job_queue):
+    """Hold a slot of the queue of the running task, retry it while none is free."""
+    from celery import (  # type: ignore[import-not-found] # pylint: disable=import-outside-toplevel,import-error
+        current_task,
+    )
+
+    client = _redis_client(celery_app.backend)
+    task_id = current_task.request.id
+    if not _take_slot(client, task_id, job_queue):
+        # Sent again to the broker with its priority, behind the tasks of the
+        # same priority sent in the meantime.
+        options = {"priority": job_queue["priority"]} if job_queue["priority"] else {}
+        raise current_task.retry(
+            countdown=_QUEUE_RETRY_DELAY, max_retries=None, **options
+        )
+    stop = threading.Event()
+    heartbeat = threading.Thread(
+        target=_renew_slot,
+        args=(client, task_id, job_queue, stop),
+        name="dash-queue-slot",
+        daemon=True,
+    )
+    heartbeat.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        # Not renewed once released.
+        heartbeat.join()
+        _release_slot(client, task_id)
+
+
+def _publish(cache, result_key):
+    client = getattr(cache, "client", None)
+    if hasattr(client, "publish"):
+        client.publish(f"{_CHANNEL_PREFIX}{result_key}", "")
+
 
 def _make_job_fn(fn, celery_app, progress, key):  # pylint: disable=too-many-statements
     cache = celery_app.backend
 
     @celery_app.task(name=f"background_callback_{key}")
     def job_fn(
-        result_key, progress_key, user_callback_args, context=None
+        result_key, progress_key, user_callback_args, context=None, job_queue=None
     ):  # pylint: disable=too-many-statements
         def _set_progress(progress_value):
             if not isinstance(progress_value, (list, tuple)):
                 progress_value = [progress_value]
 
             cache.set(progress_key, json.dumps(progress_value, cls=PlotlyJSONEncoder))
+            _publish(cache, result_key)
 
         maybe_progress = [_set_progress] if progress else []
 
         def _set_props(_id, props):
-            cache.set(
-                f"{result_key}-set_props",
-                json.dumps({_id: props}, cls=PlotlyJSONEncoder),
-            )
+            _append_set_props(cache, f"{result_key}-set_props", {_id: props})
+            _publish(cache, result_key)
 
         ctx = copy_context()
 
@@ -252,11 +533,19 @@ def _make_job_fn(fn, celery_app, progress, key):  # pylint: disable=too-many-sta
                     result_key, json.dumps(user_callback_output, cls=PlotlyJSONEncoder)
                 )
 
-        if inspect.iscoroutinefunction(fn):
-            func = partial(ctx.run, async_run)
-            asyncio.run(func())
+        def execute():
+            if inspect.iscoroutinefunction(fn):
+                func = partial(ctx.run, async_run)
+                asyncio.run(func())
+            else:
+                ctx.run(run)
+
+        if job_queue is None:
+            execute()
         else:
-            ctx.run(run)
+            with _queue_slot(celery_app, job_queue):
+                execute()
+        _publish(cache, result_key)
 
     return job_fn
 
@@ -1,11 +1,20 @@
+import atexit
+import bisect
+import glob
+import hashlib
 import inspect
+import os
+import sys
+import threading
+import time
 import traceback
+import uuid
 from contextvars import copy_context
 import asyncio
 from functools import partial
 
 
-from . import BaseBackgroundCallbackManager
+from . import BaseBackgroundCallbackManager, JobState, merge_updated_props
 from .._proxy_set_props import ProxySetProps
 from ..._callback_context import context_value
 from ..._utils import AttributeDict
@@ -13,11 +22,48 @@ from ...exceptions import PreventUpdate
 
 _pending_value = "__$pending__"
 
+# Pooled mode, and jobs with limits: jobs wait in a list sorted by priority and
+# the state of each job is stored under its own key, either queued, cancelled,
+# starting (by the dispatcher thread of a server process) or the pid running it.
+# The queues of the started jobs are kept to count them against the limits.
+_POOL_WAITING = "dash-pool-waiting"
+_POOL_RUNNING = "dash-pool-running"
+_POOL_SEQUENCE = "dash-pool-sequence"
+_POOL_JOB_PREFIX = "pool-"
+_JOB_QUEUED = "queued"
+_JOB_CANCELLED = "cancelled"
+_JOB_STARTING = "starting"
+# Returned by ``_claim_pool_job`` when only jobs of functions registered after
+# the worker was started are waiting.
+_JOBS_UNKNOWN = "unknown"
+
+# Directory of the memory-mapped arrays when ``array_threshold`` is set,
+# backed by memory on Linux.
+_SHM_DIRECTORY = "/dev/shm"
+# Seconds between two sweeps of the array files of the results no longer in the
+# cache (expired or evicted before being read), and the minimum age of the
+# files swept: a result is stored once its arrays are written.
+_ARRAY_SWEEP_INTERVAL = 60
+
 
 class DiskcacheManager(BaseBackgroundCallbackManager):
     """Manage the background execution of callbacks with subprocesses and a diskcache result backend."""
 
-    def __init__(self, cache=None, cache_by=None, expire=None):
+    # Seconds between two checks of the queue by an idle worker and between two
+    # checks of the workers by the pool supervisor.
+    pool_poll_interval = 0.05
+
+    def __init__(
+        self,
+        cache=None,
+        cache_by=None,
+        expire=None,
+        workers=None,
+        max_jobs_per_worker=None,
+        max_jobs=None,
+        array_threshold=None,
+        array_directory=None,
+    ):
         """
         Background callback manager that runs callback logic in a subprocess and stores
         results on disk using diskcache
@@ -34,6 +80,32 @@ class DiskcacheManager(BaseBackgroundCallbackManager):
             If provided, a cache entry will be removed when it has not been accessed
             for ``expire`` seconds.  If not provided, the lifetime of cache entries
             is determined by the default behavior of the ``cache`` instance.
+        :param workers:
+            If provided, jobs are run by a pool of ``workers`` long-lived processes
+            pulling them from a queue stored in the cache, instead of a new process
+            per job. The workers are forked on the first job and replaced when they
+            exit, saving the start up cost of the process for every job.
+        :param max_jobs_per_worker:
+            With ``workers``, a worker process is replaced by a new one after
+            running this number of jobs, to release the memory it accumulated.
+        :param max_jobs:
+            If provided, maximum number of jobs running at once, across the
+            callbacks and the server processes sharing the cache. The other
+            jobs wait, in the order of the priority of their ``JobQueue``.
+            Without ``workers``, the jobs with a limit are started by a thread
+            of the server process once the limits allow it.
+        :param array_threshold:
+            If provided, the numpy arrays of a job result of at least this
+            number of bytes are written to memory-mapped files instead of
+            being pickled in the cache, only their path is stored with the
+            result. They are mapped read-only without copy when the result
+            is read, for the large results of jobs on the same host.
+        :param array_directory:
+            The directory of the memory-mapped arrays, ``/dev/shm`` when it
+            exists, else a ``dash-arrays`` directory in the cache directory.
+            The files of a result are removed with its cache entry, the files
+            of the entries expired or evicted from the cache are removed by
+            the next polls.
         """
         try:
             import diskcache  # type: ignore[import-not-found,import-untyped] # pylint: disable=import-outside-toplevel
@@ -58,41 +130,63 @@ DiskcacheManager requires extra dependencies which can be installed doing
             self.handle = cache
 
         self.expire = expire
+        self.workers = workers
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.max_jobs = max_jobs
+        self._pool = []
+        self._pool_owner = None
+        self._pool_lock = threading.Lock()
+        self._pool_stopped = threading.Event()
+        self._func_keys = {}
+        self._arrays = None
+        if array_threshold is not None:
+            if array_directory is None:
+                array_directory = (
+                    _SHM_DIRECTORY
+                    if os.path.isdir(_SHM_DIRECTORY)
+                    else os.path.join(self.handle.directory, "dash-arrays")
+                )
+            os.makedirs(array_directory, exist_ok=True)
+            self._arrays = _ArrayFiles(
+                array_directory,
+                array_threshold,
+                # The directory may be shared by the managers of other caches.
+                "dash-"
+                + hashlib.sha256(self.handle.directory.encode()).hexdigest()[:16],
+            )
         super().__init__(cache_by)
 
-    def terminate_job(self, job):
-        import psutil  # pylint: disable=import-outside-toplevel,import-error
+    def register(self, key, fn, progress):
+        super().register(key, fn, progress)
+        self._func_keys[self.func_registry[key]] = key
 
+    def terminate_job(self, job):
         if job is None:
             return
 
+        if _is_pool_job(job):
+            self._terminate_pool_job(job)
+            return
+
         job = int(job)
 
         # Use diskcache transaction so multiple process don't try to kill the
         # process at the same time
         with self.handle.transact():
-            if psutil.pid_exists(job):
-                process = psutil.Process(job)
-
-                for proc in process.children(recursive=True):
-                    try:
-                        proc.kill()
-                    except psutil.NoSuchProcess:
-                        pass
-
-                try:
-                    process.kill()
-                except psutil.NoSuchProcess:
-                    pass
-
-                try:
-                    process.wait(1)
-                except (psutil.TimeoutExpired, psutil.NoSuchProcess):
-                    pass
+            _kill_process(job)
 
     def terminate_unhealthy_job(self, job):
         import psutil  # pylint: disable=import-outside-toplevel,import-error
 
+        if _is_pool_job(job):
+            state_key = _pool_job_key(job)
+            with self.handle.transact():
+                pid = self.handle.get(state_key)
+                if isinstance(pid, int) and not _process_running(pid):
+                    self.handle.delete(state_key)
+                    return True
+            return False
+
         job = int(job)
 
         if job and psutil.pid_exists(job):
@@ -103,23 +197,24 @@ DiskcacheManager requires extra dependencies which can be installed doing
         return False
 
     def job_running(self, job):
-        import psutil  # pylint: disable=import-outside-toplevel,import-error
+        if _is_pool_job(job):
+            state = self.handle.get(_pool_job_key(job))
+            return state == _JOB_QUEUED or _job_alive(state)
 
         job = int(job)
 
-        if job and psutil.pid_exists(job):
-            proc = psutil.Process(job)
-            return proc.status() != psutil.STATUS_ZOMBIE
-        return False
+        return bool(job) and _process_running(job)
 
     def make_job_fn(self, fn, progress, key=None):
-        return _make_job_fn(fn, self.handle, progress)
+        return _make_job_fn(fn, self.handle, progress, self._arrays, self.expire)
 
     def clear_cache_entry(self, key):
         self.handle.delete(key)
+        if self._arrays is not None:
+            self._arrays.remove(key)
 
     # noinspection PyUnresolvedReferences
-    def call_job_fn(self, key, job_fn, args, context):
+    def call_job_fn(self, key, job_fn, args, context, queue=None):
         """
         Call the job function, supporting both sync and async jobs.
         Args:
@@ -127,9 +222,13 @@ DiskcacheManager requires extra dependencies which can be installed doing
             job_fn: The job function to execute.
             args: Arguments for the job function.
             context: Context for the job.
+            queue: Limits and priority of the job, ``JobQueue.spec``.
         Returns:
             The PID of the spawned process or None for async execution.
         """
+        if self.workers or self.max_jobs or queue is not None:
+            return self._submit_pool_job(key, job_fn, args, context, queue)
+
         # pylint: disable-next=import-outside-toplevel,no-name-in-module,import-error
         from multiprocess import Process  # type: ignore
 
@@ -141,6 +240,161 @@ DiskcacheManager requires extra dependencies which can be installed doing
         process.start()
         return process.pid
 
+    def _submit_pool_job(self, key, job_fn, args, context, queue=None):
+        self._start_pool()
+        job = f"{_POOL_JOB_PREFIX}{uuid.uuid4().hex}"
+        self.handle.set(_pool_item_key(job), (key, args, context))
+        with self.handle.transact():
+            self.handle.set(_pool_job_key(job), _JOB_QUEUED)
+            waiting = self.handle.get(_POOL_WAITING, [])
+            # Highest priority first, then in order of submission.
+            bisect.insort(
+                waiting,
+                (
+                    -(queue["priority"] if queue else 0),
+                    self.handle.incr(_POOL_SEQUENCE),
+                    job,
+                    self._func_keys[job_fn],
+                    queue,
+                ),
+            )
+            self.handle.set(_POOL_WAITING, waiting)
+        return job
+
+    def queue_stats(self):
+        with self.handle.transact():
+            waiting = [
+                queue
+                for _, _, job, _, queue in self.handle.get(_POOL_WAITING, [])
+                if self.handle.get(_pool_job_key(job)) == _JOB_QUEUED
+            ]
+            running = _running_jobs(self.handle)
+        return self._count_jobs(waiting, running.values())
+
+    def _terminate_pool_job(self, job):
+        state_key = _pool_job_key(job)
+        # The worker can't finish the job and claim another one while the
+        # transaction is held, so the pid still runs this job when killed.
+        with self.handle.transact():
+            state = self.handle.get(state_key)
+            if state == _JOB_QUEUED or isinstance(state, tuple):
+                # A starting job is killed by the dispatcher once started.
+                self.handle.set(state_key, _JOB_CANCELLED)
+            elif isinstance(state, int):
+                self.handle.delete(state_key)
+                _kill_process(state)
+
+    def _start_pool(self):
+        with self._pool_lock:
+            if self._pool_owner == os.getpid():
+                return
+            # First job, or the app process was forked with the pool started.
+            self._pool = []
+            self._pool_owner = os.getpid()
+            self._pool_stopped.clear()
+            if self.workers:
+                self._fill_pool()
+            threading.Thread(
+                target=self._supervise_pool, name="dash-diskcache-pool", daemon=True
+            ).start()
+            atexit.register(self.shutdown_pool)
+
+    def _fill_pool(self):
+        # pylint: disable-next=import-outside-toplevel,no-name-in-module,import-error
+        from multiprocess import Process  # type: ignore
+
+        # A worker killed with its job is reaped by psutil, which multiprocess
+        # doesn't notice, so check the pid too.
+        self._pool = [
+            process
+            for process in self._pool
+            if process.is_alive() and _process_running(process.pid)
+        ]
+        while len(self._pool) < self.workers:
+            # The functions of the jobs submitted so far are in the registry
+            # copied to the worker.
+            known = self.handle.get(_POOL_SEQUENCE, 0)
+            # pylint: disable-next=not-callable
+            process = Process(
+                target=_pool_worker,
+                args=(
+                    self.handle,
+                    self.func_registry,
+                    self.max_jobs_per_worker,
+                    self.pool_poll_interval,
+                    os.getpid(),
+                    self.max_jobs,
+                    known,
+                ),
+            )
+            process.start()
+            self._pool.append(process)
+
+    def _supervise_pool(self):
+        while not self._pool_stopped.wait(self.pool_poll_interval):
+            with self._pool_lock:
+                if self._pool_owner != os.getpid():
+                    return
+                if self.workers:
+                    self._fill_pool()
+                else:
+                    self._dispatch_jobs()
+
+    def _dispatch_jobs(self):
+        """Start a process for each waiting job the limits allow to start."""
+        # pylint: disable-next=import-outside-toplevel,no-name-in-module,import-error
+        from multiprocess import Process  # type: ignore
+
+        starting = (_JOB_STARTING, os.getpid())
+        while True:
+            item = _claim_pool_job(
+                self.handle, self.func_registry, self.max_jobs, starting
+            )
+            if item is None:
+                return
+            if item is False:
+                continue
+
+            job, func_key, key, args, context = item
+            # pylint: disable-next=not-callable
+            process = Process(
+                target=_run_pool_job,
+                args=(
+                    self.handle,
+                    self.func_registry[func_key],
+                    job,
+                    key,
+                    args,
+                    context,
+                ),
+            )
+            process.start()
+            state_key = _pool_job_key(job)
+            with self.handle.transact():
+                started = self.handle.get(state_key) == starting
+                if started:
+                    self.handle.set(state_key, process.pid)
+                else:
+                    self.handle.delete(state_key)
+            if not started:
+                # Cancelled while starting.
+                _kill_process(process.pid)
+
+    def shutdown_pool(self):
+        """
+        Stop the worker processes of the pooled mode, or the thread starting
+        the jobs with limits, queued jobs are kept.
+        """
+        with self._pool_lock:
+            self._pool_stopped.set()
+            if self._pool_owner != os.getpid():
+                return
+            for process in self._pool:
+                _kill_process(process.pid)
+                process.join(1)
+            self._pool = []
+            self._pool_owner = None
+
     @staticmethod
     def _run_async_in_process(job_fn, key, args, context):
         """
@@ -183,6 +437,9 @@ DiskcacheManager requires extra dependencies which can be installed doing
         result = self.handle.get(key, self.UNDEFINED)
         if result is self.UNDEFINED:
             return self.UNDEFINED
+        if self._arrays is not None:
+            # Mapped before the files are removed with the entry.
+            result = self._arrays.load(result)
 
         # Clear result if not caching
         if self.cache_by is None:
@@ -194,22 +451,326 @@ DiskcacheManager requires extra dependencies which can be installed doing
         self.clear_cache_entry(self._make_progress_key(key))
 
         if job:
-            self.terminate_job(job)
+            if _is_pool_job(job):
+                # The worker is done with the job, only release it.
+                self.clear_cache_entry(_pool_job_key(job))
+            else:
+                self.terminate_job(job)
         return result
 
+    def poll(self, key, job):
+        progress_key = self._make_progress_key(key)
+        pool_job = _is_pool_job(job)
+        with self.handle.transact():
+            progress = self.handle.get(progress_key)
+            result = self.handle.get(key, self.UNDEFINED)
+            updated_props = self._pull_updated_props(key)
+            state = self.handle.get(_pool_job_key(job)) if pool_job else None
+            self.handle.delete(progress_key)
+            if result is not self.UNDEFINED:
+                if self.cache_by is None:
+                    self.handle.delete(key)
+                elif self.expire:
+                    self.handle.touch(key, expire=self.expire)
+                if pool_job:
+                    # The worker is done with the job, only release it.
+                    self.handle.delete(_pool_job_key(job))
+                    state = None
+
+        if self._arrays is not None:
+            if result is not self.UNDEFINED:
+                result = self._arrays.load(result)
+                if self.cache_by is None:
+                    self._arrays.remove(key)
+            self._arrays.sweep(self.handle)
+
+        if pool_job:
+            running = state == _JOB_QUEUED or _job_alive(state)
+        elif result is not self.UNDEFINED:
+            self.terminate_job(job)
+            running = False
+        else:
+            running = self.job_running(job)
+        return JobState(progress, result, updated_props, running)
+
     def get_updated_props(self, key):
+        return self._pull_updated_props(key)
+
+    def _pull_updated_props(self, key):
+        queue = _queue_cache(self.handle)
         set_props_key = self._make_set_props_key(key)
-        result = self.handle.get(set_props_key, self.UNDEFINED)
-        if result is self.UNDEFINED:
-            return {}
+        updates = []
+        while True:
+            _, update = queue.pull(set_props_key)
+            if update is None:
+                break
+            updates.append(update)
+        return merge_updated_props(updates)
+
+
+def _queue_cache(cache):
+    """The cache holding the queues, a ``FanoutCache`` has them in a sub cache."""
+    import diskcache  # type: ignore[import-not-found,import-untyped] # pylint: disable=import-outside-toplevel
+
+    if isinstance(cache, diskcache.FanoutCache):
+        return cache.cache("dash-queues")
+    return cache
+
+
+class _SharedArray:  # pylint: disable=too-few-public-methods
+    """Path of an array of a job result, stored in the cache instead of the array."""
+
+    def __init__(self, path):
+        self.path = path
+
+
+class _ArrayFiles:
+    """The large arrays of the job results, as memory-mapped ``.npy`` files."""
+
+    def __init__(self, directory, threshold, prefix):
+        self.directory = directory
+        self.threshold = threshold
+        # Files are named ``{prefix}-{result key}-{uuid}.npy``.
+        self.prefix = prefix
+        self._swept = 0.0
+
+    def share(self, value, key):
+        """Replace the large arrays of ``value`` by the files they are written to."""
+        if "numpy" not in sys.modules:
+            # Results can't hold arrays.
+            return value
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        def _share(item):
+            if isinstance(item, numpy.ndarray):
+                if item.dtype.hasobject or item.nbytes < self.threshold:
+                    return item
+                path = os.path.join(
+                    self.directory, f"{self.prefix}-{key}-{uuid.uuid4().hex}.npy"
+                )
+                numpy.save(path, item, allow_pickle=False)
+                return _SharedArray(path)
+            if isinstance(item, dict):
+                return {k: _share(v) for k, v in item.items()}
+            if isinstance(item, (list, tuple)):
+                return type(item)(_share(v) for v in item)
+            return item
+
+        return _share(value)
+
+    def load(self, value):
+        """Map the arrays of a result read from the cache."""
+        if isinstance(value, _SharedArray):
+            import numpy  # pylint: disable=import-outside-toplevel
+
+            return numpy.load(value.path, mmap_mode="r")
+        if isinstance(value, dict):
+            return {k: self.load(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return type(value)(self.load(v) for v in value)
+        return value
+
+    def _files(self, key="*"):
+        return glob.glob(
+            os.path.join(glob.escape(self.directory), f"{self.prefix}-{key}-*.npy")
+        )
 
-        self.clear_cache_entry(set_props_key)
+    def remove(self, key):
+        # The mapped arrays stay readable on posix once the files are removed.
+        for path in self._files(key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def sweep(self, cache):
+        """Remove the files of the results no longer in ``cache``."""
+        now = time.time()
+        if now - self._swept < _ARRAY_SWEEP_INTERVAL:
+            return
+        self._swept = now
+        for path in self._files():
+            # Without the prefix and the ``-{uuid}.npy`` suffix.
+            key = os.path.basename(path)[len(self.prefix) + 1 : -37]
+            try:
+                if (
+                    now - os.path.getmtime(path) > _ARRAY_SWEEP_INTERVAL
+                    and key not in cache
+                ):
+                    os.remove(path)
+            except OSError:
+                pass
+
+
+def _pool_item_key(job):
+    return f"dash-pool-item-{job}"
+
+
+def _job_alive(state):
+    if isinstance(state, int):
+        return _process_running(state)
+    if isinstance(state, tuple):
+        # Starting, alive while the process starting it is.
+        return _process_running(state[1])
+    return False
+
+
+def _running_jobs(cache):
+    """The queues of the started jobs by job, without the jobs ended since."""
+    running = cache.get(_POOL_RUNNING, {})
+    ended = [job for job in running if not _job_alive(cache.get(_pool_job_key(job)))]
+    if ended:
+        for job in ended:
+            del running[job]
+        cache.set(_POOL_RUNNING, running)
+    return running
+
+
+def _is_pool_job(job):
+    return isinstance(job, str) and job.startswith(_POOL_JOB_PREFIX)
+
+
+def _pool_job_key(job):
+    return f"dash-pool-job-{job}"
+
+
+def _process_running(pid):
+    import psutil  # pylint: disable=import-outside-toplevel,import-error
+
+    try:
+        return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return False
 
-        return result
+
+def _kill_process(pid):
+    import psutil  # pylint: disable=import-outside-toplevel,import-error
+
+    if not psutil.pid_exists(pid):
+        return
+
+    process = psutil.Process(pid)
+
+    for proc in process.children(recursive=True):
+        try:
+            proc.kill()
+        except psutil.NoSuchProcess:
+            pass
+
+    try:
+        process.kill()
+    except psutil.NoSuchProcess:
+        pass
+
+    try:
+        process.wait(1)
+    except (psutil.TimeoutExpired, psutil.NoSuchProcess):
+        pass
+
+
+def _claim_pool_job(cache, func_registry, max_jobs=None, owner=None, known=None):
+    """
+    Pull the next waiting job the limits allow to start, and mark it as run by
+    ``owner``, the pid of this process by default.
+
+    ``known`` is the sequence of the last job submitted before ``func_registry``
+    was copied to this process, None if it's the registry of the server. The
+    later jobs of unknown functions are skipped, ``_JOBS_UNKNOWN`` is returned
+    if no other job can start. The earlier ones fail, their function isn't
+    registered by the server.
+    """
+    with cache.transact():
+        waiting = cache.get(_POOL_WAITING)
+        if not waiting:
+            return None
+        running = _running_jobs(cache)
+        if max_jobs and len(running) >= max_jobs:
+            return None
+        skipped = False
+        for index, (_, sequence, job, func_key, queue) in enumerate(waiting):
+            state_key = _pool_job_key(job)
+            if cache.get(state_key) != _JOB_QUEUED:
+                # Cancelled, or released as the result was already cached.
+                del waiting[index]
+                cache.set(_POOL_WAITING, waiting)
+                cache.delete(state_key)
+                cache.delete(_pool_item_key(job))
+                return False
+            admitted = BaseBackgroundCallbackManager._job_admitted(  # pylint: disable=protected-access
+                queue, running.values()
+            )
+            if not admitted:
+                continue
+            if func_key not in func_registry:
+                if known is not None and sequence > known:
+                    # Maybe registered after this worker was started, leave
+                    # it to a new one.
+                    skipped = True
+                    continue
+                del waiting[index]
+                cache.set(_POOL_WAITING, waiting)
+                cache.delete(state_key)
+                key, _, _ = cache.pop(_pool_item_key(job))
+                cache.set(
+                    key,
+                    {
+                        "background_callback_error": {
+                            "msg": f"Unknown background callback {func_key}.",
+                            "tb": "",
+                        }
+                    },
+                )
+                return False
+            del waiting[index]
+            cache.set(_POOL_WAITING, waiting)
+            running[job] = queue
+            cache.set(_POOL_RUNNING, running)
+            cache.set(state_key, os.getpid() if owner is None else owner)
+            key, args, context = cache.pop(_pool_item_key(job))
+            return job, func_key, key, args, context
+        return _JOBS_UNKNOWN if skipped else None
+
+
+def _run_pool_job(cache, job_fn, job, key, args, context):
+    # pylint: disable=protected-access
+    try:
+        job_fn(
+            key,
+            BaseBackgroundCallbackManager._make_progress_key(key),
+            args,
+            context,
+        )
+    except Exception:  # pylint: disable=broad-except
+        traceback.print_exc()
+    finally:
+        cache.delete(_pool_job_key(job))
+
+
+# pylint: disable-next=too-many-arguments
+def _pool_worker(
+    cache, func_registry, max_jobs, poll_interval, parent_pid, max_running, known
+):
+    done = 0
+    while max_jobs is None or done < max_jobs:
+        if os.getppid() != parent_pid:
+            return
+        item = _claim_pool_job(cache, func_registry, max_running, known=known)
+        if item == _JOBS_UNKNOWN:
+            # Replaced by a worker with the current registry.
+            return
+        if item is None:
+            time.sleep(poll_interval)
+            continue
+        if item is False:
+            continue
+
+        job, func_key, key, args, context = item
+        _run_pool_job(cache, func_registry[func_key], job, key, args, context)
+        done += 1
 
 
 # pylint: disable-next=too-many-statements
-def _make_job_fn(fn, cache, progress):
+def _make_job_fn(fn, cache, progress, arrays=None, expire=None):
     # pylint: disable-next=too-many-statements
     def job_fn(result_key, progress_key, user_callback_args, context):
         def _set_progress(progress_value):
@@ -221,7 +782,11 @@ def _make_job_fn(fn, cache, progress):
         maybe_progress = [_set_progress] if progress else []
 
         def _set_props(_id, props):
-            cache.set(f"{result_key}-set_props", {_id: props})
+            # Appended to the queue of the job, merged when read by the server.
+            # Expires like the results when the job is never polled.
+            _queue_cache(cache).push(
+                {_id: props}, prefix=f"{result_key}-set_props", expire=expire
+            )
 
         ctx = copy_context()
 
@@ -241,7 +806,9 @@ def _make_job_fn(fn, cache, progress):
                     user_callback_output = fn(*maybe_progress, user_callback_args)
             except PreventUpdate:
                 errored = True
-                cache.set(result_key, {"_dash_no_update": "_dash_no_update"})
+                cache.set(
+                    result_key, {"_dash_no_update": "_dash_no_update"}, expire=expire
+                )
             except Exception as err:  # pylint: disable=broad-except
                 errored = True
                 cache.set(
@@ -252,10 +819,15 @@ def _make_job_fn(fn, cache, progress):
                             "tb": traceback.format_exc(),
                         }
                     },
+                    expire=expire,
                 )
 
             if not errored:
-                cache.set(result_key, user_callback_output)
+                if arrays is not None:
+                    user_callback_output = arrays.share(
+                        user_callback_output, result_key
+                    )
+                cache.set(result_key, user_callback_output, expire=expire)
 
         async def async_run():
             c = AttributeDict(**context)
@@ -277,7 +849,9 @@ def _make_job_fn(fn, cache, progress):
                     user_callback_output = await fn(*maybe_progress, user_callback_args)
             except PreventUpdate:
                 errored = True
-                cache.set(result_key, {"_dash_no_update": "_dash_no_update"})
+                cache.set(
+                    result_key, {"_dash_no_update": "_dash_no_update"}, expire=expire
+                )
             except Exception as err:  # pylint: disable=broad-except
                 errored = True
                 cache.set(
@@ -288,13 +862,18 @@ def _make_job_fn(fn, cache, progress):
                             "tb": traceback.format_exc(),
                         }
                     },
+                    expire=expire,
                 )
 
             if not errored:
                 if asyncio.iscoroutine(user_callback_output):
                     user_callback_output = await user_callback_output
                 try:
-                    cache.set(result_key, user_callback_output)
+                    if arrays is not None:
+                        user_callback_output = arrays.share(
+                            user_callback_output, result_key
+                        )
+                    cache.set(result_key, user_callback_output, expire=expire)
                 except Exception as err:  # pylint: disable=broad-except
                     print(f"Diskcache manager couldn't save output: {err}")
 
@@ -0,0 +1,126 @@
+import {mergeDeepRight} from 'ramda';
+
+import {STATUS} from '../constants/constants';
+import {urlBase} from './utils';
+import {getCSRFHeader} from '.';
+
+/**
+ * Batched callback requests, used when the app sets `batch_callbacks=True`.
+ *
+ * The callback requests made in the same tick are sent together to
+ * `_dash-update-component-batch`. Each caller gets back a `Response` built
+ * from its entry of the batch, so it is handled exactly like the response of
+ * a single `_dash-update-component` request.
+ */
+
+type BatchEntry = {
+    status: number;
+    data?: any;
+    message?: string;
+};
+
+type PendingRequest = {
+    body: string;
+    resolve: (res: Response) => void;
+    reject: (err: any) => void;
+};
+
+type PendingBatch = {
+    config: any;
+    requests: PendingRequest[];
+};
+
+let pendingBatch: PendingBatch | null = null;
+
+export function isBatchEnabled(config: any): boolean {
+    return Boolean(config?.batch_callbacks);
+}
+
+function entryResponse(entry: BatchEntry, batchResponse: Response): Response {
+    const headers: Record<string, string> = {};
+    const timing = batchResponse.headers.get('Server-Timing');
+    if (timing) {
+        headers['Server-Timing'] = timing;
+    }
+
+    let body: string | null = null;
+    if (entry.status === STATUS.OK) {
+        body = JSON.stringify(entry.data);
+        headers['Content-Type'] = 'application/json';
+    } else if (entry.status !== STATUS.PREVENT_UPDATE) {
+        body = entry.message || '';
+        headers['Content-Type'] = 'text/html';
+    }
+    if (body !== null) {
+        headers['Content-Length'] = String(body.length);
+    }
+    return new Response(body, {status: entry.status, headers});
+}
+
+function sendBatch({config, requests}: PendingBatch) {
+    const fetchConfig = (url: string, body: string) =>
+        fetch(
+            url,
+            mergeDeepRight(config.fetch, {
+                method: 'POST',
+                headers: getCSRFHeader(config) as any,
+                body
+            })
+        );
+
+    if (requests.length === 1) {
+        const [{body, resolve, reject}] = requests;
+        fetchConfig(`${urlBase(config)}_dash-update-component`, body).then(
+            resolve,
+            reject
+        );
+        return;
+    }
+
+    fetchConfig(
+        `${urlBase(config)}_dash-update-component-batch`,
+        `[${requests.map(r => r.body).join(',')}]`
+    ).then(
+        (res: Response) => {
+            if (res.status !== STATUS.OK) {
+                // The whole batch failed (auth, CSRF...), every callback
+                // handles the failure as its own.
+                requests.forEach(r => r.resolve(res.clone()));
+                return;
+            }
+            res.json().then(
+                (entries: BatchEntry[]) =>
+                    requests.forEach((r, i) =>
+                        r.resolve(entryResponse(entries[i], res))
+                    ),
+                err => requests.forEach(r => r.reject(err))
+            );
+        },
+        err => requests.forEach(r => r.reject(err))
+    );
+}
+
+/**
+ * Queue a callback request for the next batch, resolves with the response
+ * of this callback.
+ */
+export function fetchBatched(config: any, body: string): Promise<Response> {
+    return new Promise((resolve, reject) => {
+        if (pendingBatch && pendingBatch.config !== config) {
+            // Different fetch options (e.g. a refreshed JWT), don't mix them.
+            sendBatch(pendingBatch);
+            pendingBatch = null;
+        }
+        if (!pendingBatch) {
+            const batch: PendingBatch = {config, requests: []};
+            pendingBatch = batch;
+            setTimeout(() => {
+                if (pendingBatch === batch) {
+                    pendingBatch = null;
+                    sendBatch(batch);
+                }
+            }, 0);
+        }
+        pendingBatch.requests.push({body, resolve, reject});
+    });
+}
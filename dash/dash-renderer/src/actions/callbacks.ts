@@ -2,6 +2,7 @@ import {
     concat,
     flatten,
     intersection,
+    isEmpty,
     keys,
     map,
     mergeDeepRight,
@@ -36,12 +37,23 @@ import {
 } from '../types/callbacks';
 import {isMultiValued, stringifyId, isMultiOutputProp} from './dependencies';
 import {urlBase} from './utils';
-import {getCSRFHeader, dispatchError, setPaths} from '.';
+import {fetchBatched, isBatchEnabled} from './batchFetch';
+import {
+    decodeTypedArrays,
+    encodeTypedArrays,
+    isBinaryArraysEnabled
+} from './typedArrays';
+import {
+    getCSRFHeader,
+    dispatchError,
+    handleAsyncError,
+    setPaths
+} from '.';
 import {createAction, Action} from 'redux-actions';
 import {addHttpHeaders} from '../actions';
 import {notifyObservers, updateProps} from './index';
 import {CallbackJobPayload} from '../reducers/callbackJobs';
-import {parsePatchProps} from './patch';
+import {isPatch, parsePatchProps} from './patch';
 import {computePaths, getPath} from './paths';
 
 import {requestDependencies} from './requestDependencies';
@@ -113,6 +125,43 @@ const addCallbackJob = createAction('ADD_CALLBACK_JOB');
 const removeCallbackJob = createAction('REMOVE_CALLBACK_JOB');
 const setCallbackJobOutdated = createAction('CALLBACK_JOB_OUTDATED');
 
+// Sent with the HTTP callback requests so the server can drop a request
+// superseded by a newer one for the same outputs from this page. Numbered by
+// resolved outputs: the instances of a pattern-matching callback don't
+// supersede each other.
+const requestSession =
+    Math.random().toString(36).slice(2) + Date.now().toString(36);
+const requestGenerations: Record<string, number> = {};
+
+function nextGeneration(outputs: string): [string, number] {
+    requestGenerations[outputs] = (requestGenerations[outputs] || 0) + 1;
+    return [requestSession, requestGenerations[outputs]];
+}
+
+// Output values of the `auto_patch` callbacks kept by the server, with their
+// token. The token is sent back while the output holds the same value, the
+// server then sends the changes of the value, see `dash._auto_patch`.
+type PatchBase = {token: string; value: any};
+const patchBases: Record<string, PatchBase> = {};
+
+function getPatchBases(outputs: any[], paths: any, layout: any) {
+    const bases: Record<string, PatchBase> = {};
+    flatten(outputs).forEach((out: any) => {
+        const propName = cleanOutputProp(out.property);
+        const propId = `${stringifyId(out.id)}.${propName}`;
+        const base = patchBases[propId];
+        const outputPath = getPath(paths, out.id);
+        if (
+            base &&
+            outputPath &&
+            path([...outputPath, 'props', propName], layout) === base.value
+        ) {
+            bases[propId] = base;
+        }
+    });
+    return bases;
+}
+
 function unwrapIfNotMulti(
     paths: any,
     idProps: any,
@@ -468,19 +517,25 @@ function handleServerside(
     background: BackgroundCallbackInfo | undefined,
     additionalArgs: [string, string, boolean?][] | undefined,
     getState: any,
-    running: any
+    running: any,
+    onChained?: (chained: string[]) => void,
+    onPatchBases?: (bases: Record<string, string>) => void
 ): Promise<CallbackResponse> {
     if (hooks.request_pre) {
         hooks.request_pre(payload);
     }
 
     const requestTime = Date.now();
-    const body = JSON.stringify(payload);
+    const binaryArrays = isBinaryArraysEnabled(config);
+    const body = JSON.stringify(
+        binaryArrays ? encodeTypedArrays(payload) : payload
+    );
     let cacheKey: string;
     let job: string;
     let runningOff: any;
     let progressDefault: any;
     let moreArgs = additionalArgs;
+    let watched = false;
 
     if (running) {
         dispatch(sideUpdate(running.running, payload));
@@ -514,6 +569,10 @@ function handleServerside(
             newBody = JSON.stringify(tmpBody);
         }
 
+        if (!background && !moreArgs?.length && isBatchEnabled(config)) {
+            return fetchBatched(config, newBody);
+        }
+
         if (moreArgs) {
             moreArgs.forEach(([key, value]) => addArg(key, value));
             moreArgs = moreArgs.filter(([_, __, single]) => !single);
@@ -593,6 +652,22 @@ function handleServerside(
                     result = {[id]: (response as CallbackResponse).props};
                 }
 
+                if (data.chained && onChained) {
+                    onChained(data.chained);
+                }
+                if (data.chainErrors) {
+                    toPairs(data.chainErrors).forEach(([output, error]) =>
+                        handleAsyncError(
+                            error,
+                            `Callback error updating ${output}`,
+                            dispatch
+                        )
+                    );
+                }
+                if (data.patchBases && onPatchBases) {
+                    onPatchBases(data.patchBases);
+                }
+
                 recordProfile(result);
                 resolve(result);
             };
@@ -611,6 +686,10 @@ function handleServerside(
 
             if (status === STATUS.OK) {
                 res.json().then((data: CallbackResponseData) => {
+                    if (binaryArrays) {
+                        data = decodeTypedArrays(data);
+                    }
+
                     if (!cacheKey && data.cacheKey) {
                         cacheKey = data.cacheKey;
                     }
@@ -648,14 +727,23 @@ function handleServerside(
                             completeJob();
                             finishLine(data);
                         }
+                    } else if (!watched && isWebSocketEnabled(config)) {
+                        // The server pushes the progress and set_props over
+                        // the WebSocket, the result is fetched once done.
+                        watched = true;
+                        const workerClient = getWorkerClient();
+                        workerClient
+                            .ensureConnected(config)
+                            .then(() =>
+                                workerClient.watchBackgroundJob({
+                                    output: payload.output,
+                                    cacheKey,
+                                    job
+                                })
+                            )
+                            .then(handle, poll);
                     } else {
-                        // Poll chain.
-                        setTimeout(
-                            handle,
-                            background.interval !== undefined
-                                ? background.interval
-                                : 500
-                        );
+                        poll();
                     }
                 });
             } else if (status === STATUS.PREVENT_UPDATE) {
@@ -686,6 +774,13 @@ function handleServerside(
         const handle = () => {
             fetchCallback().then(handleOutput, handleError);
         };
+
+        // Poll chain.
+        const poll = () =>
+            setTimeout(
+                handle,
+                background?.interval !== undefined ? background.interval : 500
+            );
         handle();
     });
 }
@@ -721,7 +816,10 @@ async function handleWebsocketCallback(
         // Ensure WebSocket connection is established
         await workerClient.ensureConnected(config);
 
-        const response = await workerClient.sendCallback(payload);
+        const binaryArrays = isBinaryArraysEnabled(config);
+        const response = await workerClient.sendCallback(
+            binaryArrays ? encodeTypedArrays(payload) : payload
+        );
 
         // Handle running off state
         if (runningOff) {
@@ -756,7 +854,9 @@ async function handleWebsocketCallback(
         }
 
         // Extract the callback data - structure is {multi: boolean, response: {...}}
-        const callbackData = response.data as CallbackResponseData;
+        const callbackData = (
+            binaryArrays ? decodeTypedArrays(response.data) : response.data
+        ) as CallbackResponseData;
 
         // Handle sideUpdate if present
         if (callbackData?.sideUpdate) {
@@ -1039,9 +1139,30 @@ export function executeCallback(
                         (cb.callback.websocket &&
                             isWebSocketAvailable(config)));
 
+                // The values the patches of the response apply to.
+                let requestBases: Record<string, PatchBase> = {};
+                if (!useWebSocket && !background) {
+                    payload.generation = nextGeneration(jsonOutput);
+                    const {layout: currentLayout, paths: currentPaths} =
+                        getState();
+                    requestBases = getPatchBases(
+                        outputs,
+                        currentPaths,
+                        currentLayout
+                    );
+                    if (!isEmpty(requestBases)) {
+                        payload.patchBases = map(
+                            base => base.token,
+                            requestBases
+                        );
+                    }
+                }
+
                 for (let retry = 0; retry <= MAX_AUTH_RETRIES; retry++) {
                     try {
                         let data: CallbackResponse;
+                        let chained: string[] | undefined;
+                        let sentBases: Record<string, string> = {};
 
                         if (useWebSocket) {
                             // Use WebSocket path for real-time callbacks
@@ -1064,7 +1185,13 @@ export function executeCallback(
                                     ? additionalArgs
                                     : undefined,
                                 getState,
-                                cb.callback.running
+                                cb.callback.running,
+                                ids => {
+                                    chained = ids;
+                                },
+                                bases => {
+                                    sentBases = bases;
+                                }
                             );
                         }
 
@@ -1074,6 +1201,45 @@ export function executeCallback(
                         // Layout may have changed.
                         // DRY: Always run through parsePatchProps for each output
                         const currentLayout = getState().layout;
+                        const stalePatches = flatten(outputs).filter(
+                            (out: any) => {
+                                const propName = cleanOutputProp(out.property);
+                                const propId = `${stringifyId(
+                                    out.id
+                                )}.${propName}`;
+                                const base = requestBases[propId];
+                                return (
+                                    base &&
+                                    isPatch(
+                                        path(
+                                            [stringifyId(out.id), propName],
+                                            data
+                                        )
+                                    ) &&
+                                    path(
+                                        [
+                                            ...getPath(paths, out.id),
+                                            'props',
+                                            propName
+                                        ],
+                                        currentLayout
+                                    ) !== base.value
+                                );
+                            }
+                        );
+                        if (stalePatches.length) {
+                            // The output changed while the request ran, the
+                            // patch was made for the value sent: request the
+                            // full values.
+                            Object.keys(requestBases).forEach(propId => {
+                                delete patchBases[propId];
+                            });
+                            requestBases = {};
+                            delete payload.patchBases;
+                            payload.generation = nextGeneration(jsonOutput);
+                            retry--;
+                            continue;
+                        }
                         flatten(outputs).forEach((out: any) => {
                             const propName = cleanOutputProp(out.property);
                             const outputPath = getPath(paths, out.id);
@@ -1097,8 +1263,47 @@ export function executeCallback(
                                 newProps[propName],
                                 data
                             );
+
+                            const propId = dataPath.join('.');
+                            if (sentBases[propId]) {
+                                patchBases[propId] = {
+                                    token: sentBases[propId],
+                                    value: newProps[propName]
+                                };
+                            } else {
+                                delete patchBases[propId];
+                            }
                         });
 
+                        if (chained) {
+                            // The chained callbacks may return patches too.
+                            toPairs(data).forEach(([id, props]) => {
+                                const outputPath = getPath(
+                                    paths,
+                                    id.startsWith('{') ? JSON.parse(id) : id
+                                );
+                                toPairs(props as Record<string, any>).forEach(
+                                    ([propName, value]) => {
+                                        if (!outputPath || !isPatch(value)) {
+                                            return;
+                                        }
+                                        const newProps = parsePatchProps(
+                                            {[propName]: value},
+                                            path(
+                                                [...outputPath, 'props'],
+                                                currentLayout
+                                            ) || {}
+                                        );
+                                        data = assocPath(
+                                            [id, propName],
+                                            newProps[propName],
+                                            data
+                                        );
+                                    }
+                                );
+                            });
+                        }
+
                         if (dynamic_creator) {
                             setTimeout(
                                 () => dispatch(requestDependencies()),
@@ -1106,7 +1311,7 @@ export function executeCallback(
                             );
                         }
 
-                        return {data, payload};
+                        return {data, payload, chained};
                     } catch (res: any) {
                         lastError = res;
                         if (
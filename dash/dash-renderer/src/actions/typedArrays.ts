@@ -0,0 +1,196 @@
+/**
+ * Binary numeric arrays, used when the app sets `binary_arrays=True`.
+ *
+ * The server sends the numeric arrays of the callback responses as plotly.js
+ * typed array specs: `{dtype: 'f8', bdata: <base64>, shape?: '2, 3'}`. They
+ * are decoded into typed arrays from their bytes, without parsing every
+ * number, and the typed arrays sent back as inputs are encoded the same way.
+ */
+
+type TypedArraySpec = {
+    dtype: string;
+    bdata: string;
+    shape?: string;
+};
+
+const TYPED_ARRAYS: Record<string, any> = {
+    i1: Int8Array,
+    u1: Uint8Array,
+    u1c: Uint8ClampedArray,
+    i2: Int16Array,
+    u2: Uint16Array,
+    i4: Int32Array,
+    u4: Uint32Array,
+    f4: Float32Array,
+    f8: Float64Array
+};
+
+const DTYPES: [any, string][] = [
+    [Int8Array, 'i1'],
+    [Uint8ClampedArray, 'u1c'],
+    [Uint8Array, 'u1'],
+    [Int16Array, 'i2'],
+    [Uint16Array, 'u2'],
+    [Int32Array, 'i4'],
+    [Uint32Array, 'u4'],
+    [Float32Array, 'f4'],
+    [Float64Array, 'f8']
+];
+
+export function isBinaryArraysEnabled(config: any): boolean {
+    return Boolean(config?.binary_arrays);
+}
+
+function isSpec(value: any): value is TypedArraySpec {
+    return (
+        typeof value.bdata === 'string' &&
+        value.dtype in TYPED_ARRAYS &&
+        Object.keys(value).length <= 3
+    );
+}
+
+function base64ToBytes(data: string): Uint8Array {
+    const fromBase64 = (Uint8Array as any).fromBase64;
+    if (fromBase64) {
+        return fromBase64(data);
+    }
+    const binary = atob(data);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    return bytes;
+}
+
+function bytesToBase64(bytes: Uint8Array): string {
+    if ((bytes as any).toBase64) {
+        return (bytes as any).toBase64();
+    }
+    let binary = '';
+    // Chunked to stay below the arguments limit of `fromCharCode`.
+    for (let i = 0; i < bytes.length; i += 0x8000) {
+        binary += String.fromCharCode.apply(
+            null,
+            bytes.subarray(i, i + 0x8000) as any
+        );
+    }
+    return btoa(binary);
+}
+
+function reshape(array: any, shape: number[]): any {
+    if (shape.length <= 1) {
+        return array;
+    }
+    const [size, ...rest] = shape;
+    const step = array.length / size;
+    const rows = [];
+    for (let i = 0; i < size; i++) {
+        rows.push(reshape(array.subarray(i * step, (i + 1) * step), rest));
+    }
+    return rows;
+}
+
+function decodeArray({dtype, bdata, shape}: TypedArraySpec): any {
+    const bytes = base64ToBytes(bdata);
+    const ArrayType = TYPED_ARRAYS[dtype];
+    const array = new ArrayType(
+        bytes.buffer,
+        bytes.byteOffset,
+        bytes.byteLength / ArrayType.BYTES_PER_ELEMENT
+    );
+    if (!shape) {
+        return array;
+    }
+    return reshape(array, shape.split(',').map(Number));
+}
+
+/**
+ * Replace the typed array specs of a callback response by typed arrays.
+ * Multidimensional arrays become nested arrays of typed arrays.
+ */
+export function decodeTypedArrays(value: any): any {
+    if (Array.isArray(value)) {
+        let decoded: any[] | null = null;
+        for (let i = 0; i < value.length; i++) {
+            const item = value[i];
+            if (item === null || typeof item !== 'object') {
+                continue;
+            }
+            const newItem = decodeTypedArrays(item);
+            if (newItem !== item) {
+                decoded = decoded || value.slice();
+                decoded[i] = newItem;
+            }
+        }
+        return decoded || value;
+    }
+    if (value === null || typeof value !== 'object') {
+        return value;
+    }
+    if ('bdata' in value && isSpec(value)) {
+        return decodeArray(value);
+    }
+    let decoded: Record<string, any> | null = null;
+    for (const key in value) {
+        const item = value[key];
+        if (item === null || typeof item !== 'object') {
+            continue;
+        }
+        const newItem = decodeTypedArrays(item);
+        if (newItem !== item) {
+            decoded = decoded || {...value};
+            decoded[key] = newItem;
+        }
+    }
+    return decoded || value;
+}
+
+/**
+ * Replace the typed arrays of a callback payload by typed array specs,
+ * the server decodes them into numpy arrays.
+ */
+export function encodeTypedArrays(value: any): any {
+    if (value === null || typeof value !== 'object') {
+        return value;
+    }
+    if (ArrayBuffer.isView(value)) {
+        const entry = DTYPES.find(([ArrayType]) => value instanceof ArrayType);
+        if (!entry) {
+            return value;
+        }
+        return {
+            dtype: entry[1],
+            bdata: bytesToBase64(
+                new Uint8Array(value.buffer, value.byteOffset, value.byteLength)
+            )
+        };
+    }
+    if (Array.isArray(value)) {
+        let encoded: any[] | null = null;
+        for (let i = 0; i < value.length; i++) {
+            const item = value[i];
+            if (item === null || typeof item !== 'object') {
+                continue;
+            }
+            const newItem = encodeTypedArrays(item);
+            if (newItem !== item) {
+                encoded = encoded || value.slice();
+                encoded[i] = newItem;
+            }
+        }
+        return encoded || value;
+    }
+    let encoded: Record<string, any> | null = null;
+    for (const key in value) {
+        const item = value[key];
+        if (item === null || typeof item !== 'object') {
+            continue;
+        }
+        const newItem = encodeTypedArrays(item);
+        if (newItem !== item) {
+            encoded = encoded || {...value};
+            encoded[key] = newItem;
+        }
+    }
+    return encoded || value;
+}
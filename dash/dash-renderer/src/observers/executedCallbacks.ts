@@ -93,9 +93,11 @@ const observer: IStoreObserverDefinition<IStoreState> = {
                 return;
             }
 
-            const {data, error, payload} = executionResult;
+            const {data, error, payload, chained} = executionResult;
 
             if (data !== undefined) {
+                const requestedBefore = requestedCallbacks.length;
+
                 Object.entries(data).forEach(
                     ([id, props]: [any, {[key: string]: any}]) => {
                         const parsedId = parseIfWildcard(id);
@@ -279,6 +281,16 @@ const observer: IStoreObserverDefinition<IStoreState> = {
                     }
                 );
 
+                if (chained) {
+                    // Already run by the server, their outputs are in data.
+                    requestedCallbacks = concat(
+                        requestedCallbacks.slice(0, requestedBefore),
+                        requestedCallbacks
+                            .slice(requestedBefore)
+                            .filter(rcb => !chained.includes(rcb.callback.output))
+                    );
+                }
+
                 // Add information about potentially updated outputs vs. updated outputs,
                 // this will be used to drop callbacks from execution groups when no output
                 // matching the downstream callback's inputs were modified
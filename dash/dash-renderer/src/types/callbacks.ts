@@ -79,12 +79,19 @@ export interface ICallbackPayload {
     output: string;
     outputs: any[];
     state?: any[] | null;
+    // [page session, request number] of the callback, see `dash._generation`.
+    generation?: [string, number];
+    // Tokens of the output values the server can patch, see `dash._auto_patch`.
+    patchBases?: Record<string, string>;
 }
 
 export type CallbackResult = {
     data?: CallbackResponse;
     error?: Error;
     payload: ICallbackPayload | null;
+    // Callbacks the server ran after this one (`chain_callbacks=True`),
+    // their outputs are included in `data`.
+    chained?: string[];
 };
 
 export type BackgroundCallbackInfo = {
@@ -109,6 +116,10 @@ export type CallbackResponseData = {
     cancel?: ICallbackProperty[];
     dist?: any;
     sideUpdate?: any;
+    chained?: string[];
+    // Errors of the chained callbacks by callback id.
+    chainErrors?: Record<string, string>;
+    patchBases?: Record<string, string>;
 };
 
 export type SideUpdateOutput = {
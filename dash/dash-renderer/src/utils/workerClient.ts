@@ -11,12 +11,14 @@ export enum WorkerMessageType {
     CALLBACK_REQUEST = 'callback_request',
     GET_PROPS_RESPONSE = 'get_props_response',
     TAB_VISIBLE = 'tab_visible',
+    BACKGROUND_SUBSCRIBE = 'background_subscribe',
     CONNECTED = 'connected',
     DISCONNECTED = 'disconnected',
     CALLBACK_RESPONSE = 'callback_response',
     SET_PROPS = 'set_props',
     SET_PROPS_BATCH = 'set_props_batch',
     GET_PROPS_REQUEST = 'get_props_request',
+    BACKGROUND_DONE = 'background_done',
     ERROR = 'error'
 }
 
@@ -229,6 +231,39 @@ class WorkerClient {
         });
     }
 
+    /**
+     * Ask the server to push the progress and set_props of a background job.
+     * Resolves when the job is done, with `prevent_update` if the connection
+     * is lost before.
+     * @param payload The callback output with the cache key and job id
+     */
+    public async watchBackgroundJob(payload: {
+        output: string;
+        cacheKey: string;
+        job: string;
+    }): Promise<CallbackResponse> {
+        if (this.connectionPromise && !this.isConnected) {
+            await this.connectionPromise;
+        }
+
+        if (!this.worker) {
+            throw new Error('Worker not connected');
+        }
+
+        const requestId = `${this.rendererId}-${++this.requestCounter}`;
+
+        return new Promise((resolve, reject) => {
+            this.pendingCallbacks.set(requestId, {resolve, reject});
+
+            this.worker!.port.postMessage({
+                type: WorkerMessageType.BACKGROUND_SUBSCRIBE,
+                rendererId: this.rendererId,
+                requestId,
+                payload
+            });
+        });
+    }
+
     /**
      * Send a get_props response back to the server.
      * @param requestId The request ID from the get_props request
@@ -307,6 +342,15 @@ class WorkerClient {
                 break;
             }
 
+            case WorkerMessageType.BACKGROUND_DONE: {
+                const pending = this.pendingCallbacks.get(message.requestId);
+                if (pending) {
+                    this.pendingCallbacks.delete(message.requestId);
+                    pending.resolve({status: 'ok'});
+                }
+                break;
+            }
+
             case WorkerMessageType.SET_PROPS:
                 if (this.onSetProps) {
                     this.onSetProps(message.payload);
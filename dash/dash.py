@@ -48,13 +48,16 @@ from ._utils import (
     patch_collections_abc,
     split_callback_id,
     to_json,
-    convert_to_AttributeDict,
+    set_json_engine,
     gen_salt,
     hooks_to_js_object,
     get_caller_name,
     get_root_path,
 )
 from . import _callback
+from . import _chain
+from . import _generation
+from . import _typed_arrays
 from . import _get_paths
 from . import _dash_renderer
 from . import _validate
@@ -63,9 +66,8 @@ from . import _get_app
 from . import backends
 
 from ._get_app import with_app_context, with_app_context_factory
-from ._grouping import map_grouping, grouping_len, update_args_group
 from ._obsolete import ObsoleteChecker
-from ._callback_context import callback_context
+from ._callback_context import LazyContext, callback_context
 
 from . import _pages
 from ._pages import (
@@ -393,7 +395,8 @@ class Dash(ObsoleteChecker):
 
     :param background_callback_manager: Background callback manager instance
         to support the ``@callback(..., background=True)`` decorator.
-        One of ``DiskcacheManager`` or ``CeleryManager`` currently supported.
+        One of ``DiskcacheManager``, ``CeleryManager`` or ``AsyncioManager``
+        currently supported.
 
     :param add_log_handler: Automatically add a StreamHandler to the app logger
         if not added previously.
@@ -431,6 +434,60 @@ class Dash(ObsoleteChecker):
     :param csrf_header_name: Name of the HTTP header to send the CSRF token in.
         Default ``'X-CSRFToken'``.
     :type csrf_header_name: string
+
+    :param json_engine: Serializer for the layout, the callback dependencies
+        and the callback responses. ``None`` (default) uses plotly's
+        ``to_json_plotly``. ``"orjson"`` serializes component trees, numpy
+        arrays, pandas objects and patches with orjson in a single pass,
+        falling back to plotly for other types. A function taking the value
+        and returning a JSON string can also be given. The engine is set for
+        the whole process.
+    :type json_engine: string, function or None
+
+    :param batch_callbacks: When True, the renderer groups the callbacks that
+        are ready at the same time into a single request to the
+        ``_dash-update-component-batch`` endpoint, instead of one request per
+        callback. The callbacks of a batch run concurrently on the server:
+        async callbacks are gathered on the event loop, sync callbacks run on
+        the callback thread pool sized by ``websocket_max_workers``.
+        Background callbacks are not batched. Default ``False``.
+    :type batch_callbacks: boolean
+
+    :param chain_callbacks: When True, the server callbacks triggered by the
+        outputs of a callback run in the same request when the values of all
+        their inputs and states are known, saving a round trip per level of a
+        callback cascade. The chain stops at clientside callbacks and at
+        outputs rendering new components, the other callbacks are requested
+        by the renderer as usual. Background, websocket and pattern-matching
+        callbacks are not chained. Default ``False``.
+    :type chain_callbacks: boolean
+
+    :param coalesce_callbacks: When True, identical calls of a callback (same
+        input and state values) arriving while one is running wait for its
+        result instead of running the function again. Callbacks seen reading
+        the request cookies, headers... or setting the response are not
+        coalesced, use ``coalesce=False`` on the callbacks reading the request
+        some other way. Can be set per callback with ``coalesce``.
+        Default ``False``.
+    :type coalesce_callbacks: boolean
+
+    :param binary_arrays: When True, the numeric numpy arrays and pandas
+        series of the callback responses are sent as base64 typed arrays and
+        the renderer gives them to the components as JavaScript typed arrays,
+        instead of encoding and parsing every number as JSON text. Typed
+        arrays sent back as callback inputs or states arrive as numpy arrays.
+        Default ``False``.
+    :type binary_arrays: boolean
+
+    :param callback_executors: Thread pools for the sync callbacks, by name:
+        ``{"cpu": 2, "io": 32}`` gives the number of threads of each pool. A
+        callback runs on a pool with its ``executor`` argument, for instance
+        to keep CPU-heavy callbacks from taking the threads of the I/O-bound
+        ones. With the async backends (FastAPI, Quart) and the WebSocket
+        transport the other sync callbacks run on the callback thread pool
+        sized by ``websocket_max_workers``, off the event loop. Flask runs the
+        HTTP callbacks on its request threads.
+    :type callback_executors: dict
     """
 
     _plotlyjs_url: str
@@ -493,6 +550,12 @@ class Dash(ObsoleteChecker):
         websocket_max_workers: Optional[int] = 4,
         enable_mcp: Optional[bool] = None,
         mcp_path: Optional[str] = None,
+        json_engine: Union[str, Callable[[Any], str], None] = None,
+        batch_callbacks: bool = False,
+        chain_callbacks: bool = False,
+        coalesce_callbacks: bool = False,
+        binary_arrays: bool = False,
+        callback_executors: Optional[Dict[str, int]] = None,
         **obsolete,
     ):
 
@@ -657,6 +720,9 @@ class Dash(ObsoleteChecker):
 
         self._assets_files: list = []
 
+        # pre-rendered, request independent pieces of the index page
+        self._index_cache: Optional[Dict[str, Any]] = None
+
         self._background_manager = background_callback_manager
         self._websocket_callbacks = websocket_callbacks
         self._websocket_allowed_origins = websocket_allowed_origins or []
@@ -664,6 +730,16 @@ class Dash(ObsoleteChecker):
         self._websocket_heartbeat_interval = websocket_heartbeat_interval
         self._websocket_batch_delay = websocket_batch_delay
         self._websocket_max_workers = websocket_max_workers
+        self._batch_callbacks = batch_callbacks
+        self._chain_callbacks = chain_callbacks
+        self._chain_graph: Optional[Dict[str, Any]] = None
+        self._coalesce_callbacks = coalesce_callbacks
+        self._generations = _generation.GenerationRegistry()
+        self._binary_arrays = binary_arrays
+        self._callback_executors = callback_executors or {}
+
+        if json_engine is not None:
+            set_json_engine(json_engine)
 
         self.logger = logging.getLogger(__name__)
 
@@ -811,6 +887,12 @@ class Dash(ObsoleteChecker):
             self.backend.serve_callback(self),
             ["POST"],
         )
+        if self._batch_callbacks:
+            self._add_url(
+                "_dash-update-component-batch",
+                self.backend.serve_callback_batch(self),
+                ["POST"],
+            )
         self._add_url("_reload-hash", self.serve_reload_hash)
         self._add_url(
             "_favicon.ico",
@@ -983,6 +1065,8 @@ class Dash(ObsoleteChecker):
             "validate_callbacks": self._dev_tools.validate_callbacks,
             "csrf_token_name": self.config.csrf_token_name,
             "csrf_header_name": self.config.csrf_header_name,
+            "batch_callbacks": self._batch_callbacks,
+            "binary_arrays": self._binary_arrays,
         }
         if self._plotly_cloud is None:
             if os.getenv("DASH_ENTERPRISE_ENV") == "WORKSPACE":
@@ -1093,6 +1177,8 @@ class Dash(ObsoleteChecker):
         return f"{self.config.requests_pathname_prefix}_dash-component-suites/{namespace}/{fingerprint}"
 
     def get_dist(self, libraries: Sequence[str]) -> list:
+        # Newly registered libraries add bundles to the index page.
+        self._index_cache = None
         dists = []
         for dist_type in ("_js_dist", "_css_dist"):
             resources = ComponentRegistry.get_resources(dist_type, libraries)
@@ -1293,19 +1379,7 @@ class Dash(ObsoleteChecker):
 
         return meta_tags + self.config.meta_tags
 
-    def index(self, *_args, **_kwargs):
-        scripts = self._generate_scripts_html()
-        css = self._generate_css_dist_html()
-        config = self._generate_config_html()
-        metas = self._generate_meta()
-        renderer = self._generate_renderer()
-        title = self.title
-        # Refactored: direct access to global request adapter
-        request = self.backend.request_adapter()
-
-        if self.use_pages and self.config.include_pages_meta and request:
-            metas = _page_meta_tags(self, request) + metas
-
+    def _generate_favicon(self) -> str:
         if self._favicon:
             favicon_mod_time = os.path.getmtime(
                 os.path.join(self.config.assets_folder, self._favicon)
@@ -1315,12 +1389,74 @@ class Dash(ObsoleteChecker):
             prefix = self.config.requests_pathname_prefix
             favicon_url = f"{prefix}_favicon.ico?v={__version__}"
 
-        favicon = format_tag(
+        return format_tag(
             "link",
             {"rel": "icon", "type": "image/x-icon", "href": favicon_url},
             opened=True,
         )
 
+    def _has_dynamic_config(self) -> bool:
+        # Dev tools hooks with callable props are evaluated on every request.
+        return bool(self._dev_tools.ui) and any(
+            callable(hook.get("props")) for hook in self._hooks.get_hooks("dev_tools")
+        )
+
+    def _index_cache_key(self) -> tuple:
+        # pylint: disable=protected-access
+        hooks = self._hooks.hooks
+        return (
+            len(ComponentRegistry.registry),
+            len(self.scripts._resources._resources),
+            len(self.css._resources._resources),
+            len(self._inline_scripts) + len(_callback.GLOBAL_INLINE_SCRIPTS),
+            len(hooks._js_dist),
+            len(hooks._css_dist),
+            len(hooks.get_hooks("dev_tools")),
+            id(self.validation_layout),
+        )
+
+    def _build_index_cache(self) -> Dict[str, Any]:
+        """Render the request independent parts of the index page.
+
+        Collecting the resources imports every component package and stats
+        each bundle on disk, so the result is kept until hot reload, a
+        dynamic ``get_dist`` registration or a change in the registered
+        resources, hooks or inline scripts invalidates it.
+        """
+        scripts = self._generate_scripts_html()
+        cache = {
+            "key": self._index_cache_key(),
+            "scripts": scripts,
+            "css": self._generate_css_dist_html(),
+            "config": None,
+            "favicon": self._generate_favicon(),
+        }
+        if not self._has_dynamic_config():
+            cache["config"] = self._generate_config_html()
+        self._index_cache = cache
+        return cache
+
+    def _get_index_cache(self) -> Dict[str, Any]:
+        cache = self._index_cache
+        if cache is None or cache["key"] != self._index_cache_key():
+            cache = self._build_index_cache()
+        return cache
+
+    def index(self, *_args, **_kwargs):
+        cache = self._get_index_cache()
+        scripts = cache["scripts"]
+        css = cache["css"]
+        config = cache["config"] or self._generate_config_html()
+        favicon = cache["favicon"]
+        metas = self._generate_meta()
+        renderer = self._generate_renderer()
+        title = self.title
+        # Refactored: direct access to global request adapter
+        request = self.backend.request_adapter()
+
+        if self.use_pages and self.config.include_pages_meta and request:
+            metas = _page_meta_tags(self, request) + metas
+
         tags = "\n      ".join(
             format_tag("meta", x, opened=True, sanitize=True) for x in metas
         )
@@ -1516,26 +1652,44 @@ class Dash(ObsoleteChecker):
 
     # pylint: disable=R0915
     def _initialize_context(self, body: CallbackExecutionBody):
-        """Initialize the global context for the request."""
+        """Initialize the global context for the request.
+
+        The request and body derived values are only computed when the
+        callback (or a hook) reads them.
+        """
         adapter = self.backend.request_adapter()
-        g = AttributeDict({})
-        g.inputs_list = body.get("inputs", [])
-        g.states_list = body.get("state", [])
-        g.outputs_list = body.get("outputs", [])
-        g.input_values = inputs_to_dict(g.inputs_list)
-        g.state_values = inputs_to_dict(g.states_list)
-        g.triggered_inputs = [
-            {"prop_id": x, "value": g.input_values.get(x)}
-            for x in body.get("changedPropIds", [])
-        ]
-        g.dash_response = self.backend.response_adapter()
-        g.cookies = dict(adapter.cookies)
-        g.headers = dict(adapter.headers)
-        g.args = adapter.args
-        g.path = adapter.full_path
-        g.remote = adapter.remote_addr
-        g.origin = adapter.origin
-        g.updated_props = {}
+        if self._binary_arrays:
+            body = _typed_arrays.decode_body(body)
+        inputs_list = body.get("inputs", [])
+        states_list = body.get("state", [])
+
+        def triggered_inputs():
+            input_values = g.input_values
+            return [
+                {"prop_id": x, "value": input_values.get(x)}
+                for x in body.get("changedPropIds", [])
+            ]
+
+        g = LazyContext(
+            {
+                "input_values": lambda: inputs_to_dict(inputs_list),
+                "state_values": lambda: inputs_to_dict(states_list),
+                "triggered_inputs": triggered_inputs,
+                "dash_response": self.backend.response_adapter,
+                "cookies": lambda: dict(adapter.cookies),
+                "headers": lambda: dict(adapter.headers),
+                "args": lambda: adapter.args,
+                "path": lambda: adapter.full_path,
+                "remote": lambda: adapter.remote_addr,
+                "origin": lambda: adapter.origin,
+            },
+            inputs_list=inputs_list,
+            states_list=states_list,
+            outputs_list=body.get("outputs", []),
+            updated_props={},
+            patch_bases=body.get("patchBases") or {},
+            page_session=(body.get("generation") or [None])[0],
+        )
         return g
 
     def _prepare_callback(self, g, body: CallbackExecutionBody):
@@ -1549,9 +1703,7 @@ class Dash(ObsoleteChecker):
             )
             g.ignore_register_page = cb.get("background", False)
 
-            # Add args_grouping
-            inputs_state_indices = cb["inputs_state_indices"]
-            inputs_state = convert_to_AttributeDict(g.inputs_list + g.states_list)
+            plan = cb["plan"]
 
             if cb.get("no_output"):
                 g.outputs_list = []
@@ -1559,45 +1711,33 @@ class Dash(ObsoleteChecker):
                 # Legacy support for older renderers
                 split_callback_id(output)
 
-            # Update args_grouping attributes
-            for s in inputs_state:
-                # check for pattern matching: list of inputs or state
-                if isinstance(s, list):
-                    for pattern_match_g in s:
-                        update_args_group(
-                            pattern_match_g, body.get("changedPropIds", [])
-                        )
-                update_args_group(s, body.get("changedPropIds", []))
-
-            g.args_grouping, g.using_args_grouping = self._prepare_grouping(
-                inputs_state, inputs_state_indices
+            g.args_grouping, g.using_args_grouping = plan.args_grouping(
+                g.inputs_list + g.states_list, body.get("changedPropIds", [])
             )
-            g.outputs_grouping, g.using_outputs_grouping = self._prepare_grouping(
-                g.outputs_list, cb.get("outputs_indices", [])
+            g.outputs_grouping, g.using_outputs_grouping = plan.outputs_grouping(
+                g.outputs_list
             )
+
+            generation = body.get("generation")
+            if generation and not cb.get("background") and "dash_websocket" not in g:
+                session, number = generation
+                # Begun by `_execute_callback`, with the call ending it.
+                g.generation_request = (
+                    session,
+                    _generation.outputs_key(g.outputs_list, output),
+                    number,
+                )
         except KeyError as e:
             raise KeyError(f"Callback function not found for output '{output}'.") from e
         return func
 
-    def _prepare_grouping(self, data_list, indices):
-        """Prepare grouping logic for inputs or outputs."""
-        if not isinstance(data_list, list):
-            flat_data = [data_list]
-        else:
-            flat_data = data_list
-
-        if len(flat_data) > 0:
-            grouping = map_grouping(lambda ind: flat_data[ind], indices)
-            using_grouping = not isinstance(indices, int) and indices != list(
-                range(grouping_len(indices))
-            )
-        else:
-            grouping, using_grouping = [], False
+    def _execute_callback(self, func, args, outputs_list, g, chain=True):
+        """Execute the callback with the prepared arguments.
 
-        return grouping, using_grouping
-
-    def _execute_callback(self, func, args, outputs_list, g):
-        """Execute the callback with the prepared arguments."""
+        With ``chain_callbacks``, the callbacks triggered by the outputs also
+        run, see ``dash._chain``. Requests superseded by a newer one of the
+        page are dropped, see ``dash._generation``.
+        """
         g.custom_data = AttributeDict({})
 
         for hook in self._hooks.get_hooks("custom_data"):
@@ -1614,6 +1754,16 @@ class Dash(ObsoleteChecker):
             app_on_error=self._on_error,
             app_use_async=self._use_async,
         )
+        if chain and self._chain_callbacks and "dash_websocket" not in g:
+            partial_func = functools.partial(
+                _chain.run_chain, self, func, partial_func, g
+            )
+        generation_request = g.get("generation_request")
+        if generation_request is not None:
+            # Begun once nothing but the call can fail, `_generation.run`
+            # ends it whatever the outcome.
+            g.generation = self._generations.begin(*generation_request)
+            return functools.partial(_generation.run, partial_func, g)
         return partial_func
 
     def _setup_server(self):
@@ -1640,8 +1790,7 @@ class Dash(ObsoleteChecker):
 
         _validate.validate_layout(self.layout, self._layout_value())
 
-        self._generate_scripts_html()
-        self._generate_css_dist_html()
+        self._build_index_cache()
 
         # Copy over global callback data structures assigned with `dash.callback`
         for k in list(_callback.GLOBAL_CALLBACK_MAP):
@@ -1669,6 +1818,9 @@ class Dash(ObsoleteChecker):
         _callback.GLOBAL_CALLBACK_LIST.clear()
 
         _validate.validate_background_callbacks(self.callback_map)
+        _validate.validate_callback_executors(
+            self.callback_map, self._callback_executors
+        )
 
         cancels = {}
 
@@ -2111,6 +2263,9 @@ class Dash(ObsoleteChecker):
             validate_callbacks=dev_tools_validate_callbacks,
         )
 
+        # Bundles (dev/prod) and the front end config depend on the dev tools.
+        self._index_cache = None
+
         if dev_tools.silence_routes_logging:
             # Silence route logging based on backend type
             backend_type = getattr(self.backend, "server_type", "flask")
@@ -2237,6 +2392,7 @@ class Dash(ObsoleteChecker):
         with _reload.lock:
             _reload.hard = True
             _reload.hash = generate_hash()
+            self._index_cache = None
 
             if self.config.assets_folder in filename:
                 asset_path = (
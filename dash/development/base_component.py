@@ -9,6 +9,7 @@ import warnings
 import textwrap
 
 from .._utils import patch_collections_abc, stringify_id, OrderedSet
+from .._static import encode_static
 
 MutableSequence = patch_collections_abc("MutableSequence")
 
@@ -90,6 +91,76 @@ class ComponentMeta(abc.ABCMeta):
         return _component
 
 
+class _PropValidator:
+    """
+    Checks the keyword arguments of a component class, compiled once per
+    class from its props. Error messages are only built on failure.
+    """
+
+    __slots__ = ("prop_names", "wildcards", "base_nodes", "_props", "_prefixes")
+
+    def __init__(self, prop_names, wildcards, base_nodes):
+        self.prop_names = prop_names
+        self.wildcards = wildcards
+        self.base_nodes = base_nodes
+        self._props = frozenset(prop_names)
+        self._prefixes = tuple(wildcards)
+
+    def matches(self, component):
+        # pylint: disable=protected-access
+        return (
+            self.prop_names == component._prop_names
+            and self.wildcards == component._valid_wildcard_attributes
+            and self.base_nodes == component._base_nodes
+        )
+
+    def validate(self, component, kwargs):
+        # pylint: disable=protected-access
+        props = self._props
+        prefixes = self._prefixes
+        base_nodes = self.base_nodes
+        # A new component is not part of any indexed tree yet.
+        _setattr = object.__setattr__
+
+        for k, v in kwargs.items():
+            if k not in props and not k.startswith(prefixes):
+                allowed_args = ", ".join(sorted(self.prop_names))
+                raise TypeError(
+                    f"{component._error_string_prefix(kwargs)} received an unexpected"
+                    f" keyword argument: `{k}`\nAllowed arguments: {allowed_args}"
+                )
+
+            if isinstance(v, Component) and k not in base_nodes:
+                raise TypeError(
+                    component._error_string_prefix(kwargs)
+                    + " detected a Component for a prop other than `children`\n"
+                    + f"Prop {k} has value {v!r}\n\n"
+                    + "Did you forget to wrap multiple `children` in an array?\n"
+                    + 'For example, it must be html.Div(["a", "b", "c"]) not html.Div("a", "b", "c")\n'
+                )
+
+            if k == "id":
+                _validate_id(v)
+
+            _setattr(component, k, v)
+
+
+def _validate_id(v):
+    if isinstance(v, dict):
+        for id_key, id_val in v.items():
+            if not isinstance(id_key, str):
+                raise TypeError(
+                    "dict id keys must be strings,\n" + f"found {id_key!r} in id {v!r}"
+                )
+            if not isinstance(id_val, (str, int, float, bool)):
+                raise TypeError(
+                    "dict id values must be strings, numbers or bools,\n"
+                    + f"found {id_val!r} in id {v!r}"
+                )
+    elif not isinstance(v, str):
+        raise TypeError(f"`id` prop must be a string or dict, not {v!r}")
+
+
 def is_number(s):
     try:
         float(s)
@@ -98,6 +169,25 @@ def is_number(s):
         return False
 
 
+def _children_items(component):
+    """Iterator over the direct children of a component."""
+    children = getattr(component, "children", None)
+    if isinstance(children, Component):
+        return iter((children,))
+    if isinstance(children, (list, tuple, MutableSequence)):
+        return iter(children)
+    return iter(())
+
+
+def _is_child(parent, child):
+    children = getattr(parent, "children", None)
+    if children is child:
+        return True
+    return isinstance(children, (list, tuple, MutableSequence)) and any(
+        item is child for item in children
+    )
+
+
 def _check_if_has_indexable_children(item):
     if not hasattr(item, "children") or (
         not isinstance(item.children, Component)
@@ -113,10 +203,28 @@ class Component(metaclass=ComponentMeta):
     _namespace: str
     _type: str
     _prop_names: typing.List[str]
+    # Set on the instances which have it, in their `__dict__`.
+    children: typing.Any
 
     _valid_wildcard_attributes: typing.List[str]
     available_wildcard_properties: typing.List[str]
 
+    # The component metadata shared by all the instances of a class, the
+    # props (set ones only) and wildcard props live in the instance `__dict__`.
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "_prop_names",
+        "_valid_wildcard_attributes",
+        "available_properties",
+        "available_wildcard_properties",
+    )
+
+    # Set by `dash.static`, the subtree is serialized only once.
+    _static = None
+
+    _prop_validator: typing.Optional[_PropValidator] = None
+
     @classmethod
     def __get_pydantic_core_schema__(cls, _source_type, _handler):
         from pydantic_core import core_schema  # pylint: disable=import-outside-toplevel
@@ -157,81 +265,59 @@ class Component(metaclass=ComponentMeta):
 
     def __init__(self, **kwargs):
         self._validate_deprecation()
-        import dash  # pylint: disable=import-outside-toplevel, cyclic-import
 
-        for k, v in list(kwargs.items()):
+        validator = type(self)._prop_validator
+        if validator is None or not validator.matches(self):
             # pylint: disable=no-member
-            k_in_propnames = k in self._prop_names
-            k_in_wildcards = any(
-                k.startswith(w) for w in self._valid_wildcard_attributes
+            validator = _PropValidator(
+                self._prop_names, self._valid_wildcard_attributes, self._base_nodes
             )
-            # e.g. "The dash_core_components.Dropdown component (version 1.6.0)
-            # with the ID "my-dropdown"
-            id_suffix = f' with the ID "{kwargs["id"]}"' if "id" in kwargs else ""
-            try:
-                # Get fancy error strings that have the version numbers
-                error_string_prefix = "The `{}.{}` component (version {}){}"
-                # These components are part of dash now, so extract the dash version:
-                dash_packages = {
-                    "dash_html_components": "html",
-                    "dash_core_components": "dcc",
-                    "dash_table": "dash_table",
-                }
-                if self._namespace in dash_packages:
-                    error_string_prefix = error_string_prefix.format(
-                        dash_packages[self._namespace],
-                        self._type,
-                        dash.__version__,
-                        id_suffix,
-                    )
-                else:
-                    # Otherwise import the package and extract the version number
-                    error_string_prefix = error_string_prefix.format(
-                        self._namespace,
-                        self._type,
-                        getattr(__import__(self._namespace), "__version__", "unknown"),
-                        id_suffix,
-                    )
-            except ImportError:
-                # Our tests create mock components with libraries that
-                # aren't importable
-                error_string_prefix = f"The `{self._type}` component{id_suffix}"
-
-            if not k_in_propnames and not k_in_wildcards:
-                allowed_args = ", ".join(
-                    sorted(self._prop_names)
-                )  # pylint: disable=no-member
-                raise TypeError(
-                    f"{error_string_prefix} received an unexpected keyword argument: `{k}`"
-                    f"\nAllowed arguments: {allowed_args}"
-                )
+            type(self)._prop_validator = validator
 
-            if k not in self._base_nodes and isinstance(v, Component):
-                raise TypeError(
-                    error_string_prefix
-                    + " detected a Component for a prop other than `children`\n"
-                    + f"Prop {k} has value {v!r}\n\n"
-                    + "Did you forget to wrap multiple `children` in an array?\n"
-                    + 'For example, it must be html.Div(["a", "b", "c"]) not html.Div("a", "b", "c")\n'
-                )
+        validator.validate(self, kwargs)
 
-            if k == "id":
-                if isinstance(v, dict):
-                    for id_key, id_val in v.items():
-                        if not isinstance(id_key, str):
-                            raise TypeError(
-                                "dict id keys must be strings,\n"
-                                + f"found {id_key!r} in id {v!r}"
-                            )
-                        if not isinstance(id_val, (str, int, float, bool)):
-                            raise TypeError(
-                                "dict id values must be strings, numbers or bools,\n"
-                                + f"found {id_val!r} in id {v!r}"
-                            )
-                elif not isinstance(v, str):
-                    raise TypeError(f"`id` prop must be a string or dict, not {v!r}")
-
-            setattr(self, k, v)
+        # The generated `__init__` builds these lists for every instance,
+        # keep a single copy per class.
+        self._prop_names = validator.prop_names
+        self._valid_wildcard_attributes = validator.wildcards
+        if getattr(self, "available_properties", None) == validator.prop_names:
+            self.available_properties = validator.prop_names
+        if getattr(self, "available_wildcard_properties", None) == validator.wildcards:
+            self.available_wildcard_properties = validator.wildcards
+
+    def _error_string_prefix(self, kwargs):
+        import dash  # pylint: disable=import-outside-toplevel, cyclic-import
+
+        # e.g. "The dash_core_components.Dropdown component (version 1.6.0)
+        # with the ID "my-dropdown"
+        id_suffix = f' with the ID "{kwargs["id"]}"' if "id" in kwargs else ""
+        try:
+            # Get fancy error strings that have the version numbers
+            error_string_prefix = "The `{}.{}` component (version {}){}"
+            # These components are part of dash now, so extract the dash version:
+            dash_packages = {
+                "dash_html_components": "html",
+                "dash_core_components": "dcc",
+                "dash_table": "dash_table",
+            }
+            if self._namespace in dash_packages:
+                return error_string_prefix.format(
+                    dash_packages[self._namespace],
+                    self._type,
+                    dash.__version__,
+                    id_suffix,
+                )
+            # Otherwise import the package and extract the version number
+            return error_string_prefix.format(
+                self._namespace,
+                self._type,
+                getattr(__import__(self._namespace), "__version__", "unknown"),
+                id_suffix,
+            )
+        except ImportError:
+            # Our tests create mock components with libraries that
+            # aren't importable
+            return f"The `{self._type}` component{id_suffix}"
 
     def _set_random_id(self):
 
@@ -267,6 +353,13 @@ class Component(metaclass=ComponentMeta):
         return v
 
     def to_plotly_json(self):
+        if self._static is not None:
+            placeholder = encode_static(self)
+            if placeholder is not None:
+                return placeholder
+        return self._to_plotly_json()
+
+    def _to_plotly_json(self):
         # Add normal properties
         props = {
             p: getattr(self, p)
@@ -274,17 +367,7 @@ class Component(metaclass=ComponentMeta):
             if hasattr(self, p)
         }
         # Add the wildcard properties data-* and aria-*
-        props.update(
-            {
-                k: getattr(self, k)
-                for k in self.__dict__
-                if any(
-                    k.startswith(w)
-                    # pylint:disable=no-member
-                    for w in self._valid_wildcard_attributes
-                )
-            }
-        )
+        props.update(self._wildcard_props())
         as_json = {
             "props": props,
             "type": self._type,  # pylint: disable=no-member
@@ -293,6 +376,12 @@ class Component(metaclass=ComponentMeta):
 
         return as_json
 
+    def _wildcard_props(self):
+        prefixes = tuple(self._valid_wildcard_attributes)  # pylint: disable=no-member
+        if not prefixes:
+            return {}
+        return {k: v for k, v in self.__dict__.items() if k.startswith(prefixes)}
+
     # pylint: disable=too-many-branches, too-many-return-statements
     # pylint: disable=redefined-builtin, inconsistent-return-statements
     def _get_set_or_delete(self, id, operation, new_item=None):
@@ -372,7 +461,11 @@ class Component(metaclass=ComponentMeta):
 
         # A component's children can be undefined, a string, another component,
         # or a list of components.
-        return self._get_set_or_delete(id, "get")
+        _check_if_has_indexable_children(self)
+        found = self._find_by_id(id)
+        if found is None:
+            raise KeyError(id)
+        return found
 
     def __setitem__(self, id, item):  # pylint: disable=redefined-builtin
         """Set an element by its ID."""
@@ -382,10 +475,62 @@ class Component(metaclass=ComponentMeta):
         """Delete items by ID in the tree of children."""
         return self._get_set_or_delete(id, "delete")
 
+    def __contains__(self, id):  # pylint: disable=redefined-builtin
+        """Whether a component with the given ID is in the tree of children."""
+        return self._find_by_id(id) is not None
+
+    def _build_id_index(self):
+        """
+        Map the stringified IDs of the tree to their first component and its
+        ancestors, checked by `_find_by_id` before a hit is returned.
+        """
+        index = {}
+        stack = [(self, _children_items(self))]
+        while stack:
+            for item in stack[-1][1]:
+                if isinstance(item, Component):
+                    id_ = getattr(item, "id", None)
+                    if id_ is not None:
+                        ancestors = tuple(parent for parent, _ in stack)
+                        index.setdefault(stringify_id(id_), (item, ancestors))
+                    stack.append((item, _children_items(item)))
+                    break
+            else:
+                stack.pop()
+        self.__dict__["_id_index"] = index
+        return index
+
+    def _find_by_id(self, id):  # pylint: disable=redefined-builtin
+        key = stringify_id(id)
+        cached = self.__dict__.get("_id_index")
+        if cached is not None:
+            hit = cached.get(key)
+            # Changes of the tree are not tracked: the component must still
+            # have its ID and be under its ancestors.
+            if hit is not None and getattr(hit[0], "id", None) == id:
+                found, ancestors = hit
+                if all(
+                    _is_child(parent, child)
+                    for parent, child in zip(ancestors, ancestors[1:] + (found,))
+                ):
+                    return found
+        # Walk the tree again before reporting the ID as missing.
+        hit = self._build_id_index().get(key)
+        if hit is not None and getattr(hit[0], "id", None) == id:
+            return hit[0]
+        return None
+
     def _traverse(self):
         """Yield each item in the tree."""
-        for t in self._traverse_with_paths():
-            yield t[1]
+        stack = [_children_items(self)]
+        while stack:
+            for item in stack[-1]:
+                yield item
+                if isinstance(item, Component):
+                    stack.append(_children_items(item))
+                    break
+            else:
+                stack.pop()
 
     @staticmethod
     def _id_str(component):
@@ -453,11 +598,7 @@ class Component(metaclass=ComponentMeta):
         # pylint: disable=no-member
         props_with_values = [
             c for c in self._prop_names if getattr(self, c, None) is not None
-        ] + [
-            c
-            for c in self.__dict__
-            if any(c.startswith(wc_attr) for wc_attr in self._valid_wildcard_attributes)
-        ]
+        ] + list(self._wildcard_props())
         if any(p != "children" for p in props_with_values):
             props_string = ", ".join(
                 f"{p}={getattr(self, p)!r}" for p in props_with_values
@@ -0,0 +1,71 @@
+"""Fixtures of the unit tests posting callback requests to an app."""
+import pytest
+
+from dash import Dash, html
+
+
+def _callback_body(output, inputs, **extra):
+    """
+    The payload of a callback request as sent by the renderer.
+
+    ``output`` is the ``"id.prop"`` of the output, or a list of them for a
+    multi-output callback, ``inputs`` the changed input values by
+    ``"id.prop"``, ``extra`` the other payload keys (``generation``...).
+    """
+
+    def dependency(prop_id):
+        component_id, prop = prop_id.rsplit(".", 1)
+        return {"id": component_id, "property": prop}
+
+    if isinstance(output, list):
+        callback_id = f"..{'...'.join(output)}.."
+        outputs = [dependency(prop_id) for prop_id in output]
+    else:
+        callback_id, outputs = output, dependency(output)
+    return {
+        "output": callback_id,
+        "outputs": outputs,
+        "inputs": [
+            dict(dependency(prop_id), value=value) for prop_id, value in inputs.items()
+        ],
+        "changedPropIds": list(inputs),
+        **extra,
+    }
+
+
+@pytest.fixture
+def callback_body():
+    return _callback_body
+
+
+@pytest.fixture
+def empty_app():
+    """A `Dash` app with an empty layout, for the callbacks of a test."""
+
+    def make(**kwargs):
+        app = Dash(__name__, **kwargs)
+        app.layout = html.Div()
+        return app
+
+    return make
+
+
+@pytest.fixture
+def post_callback():
+    """Post a callback request to a Flask app, returns the response."""
+
+    def post(app, body, url="/_dash-update-component"):
+        return app.server.test_client().post(url, json=body)
+
+    return post
+
+
+@pytest.fixture
+def post_callback_async():
+    """Post a callback request to a Quart app, returns the JSON response."""
+
+    async def post(app, body, url="/_dash-update-component"):
+        response = await app.server.test_client().post(url, json=body)
+        return await response.get_json()
+
+    return post
@@ -539,3 +539,66 @@ def test_debc029_random_id_errors():
 def test_debc030_invalid_children_args():
     with pytest.raises(TypeError):
         dcc.Input(children="invalid children")
+
+
+def test_debc031_shared_component_metadata(monkeypatch):
+    def fail(*_):
+        raise AssertionError("error string built for a valid component")
+
+    monkeypatch.setattr(Component, "_error_string_prefix", fail)
+
+    div1 = html.Div("a", id="a", **{"data-a": 1})
+    div2 = html.Div("b", id="b")
+
+    assert div1._prop_names is div2._prop_names
+    assert div1.available_properties is div2.available_properties
+    assert div1._valid_wildcard_attributes is div2._valid_wildcard_attributes
+    assert div1.to_plotly_json()["props"] == {"children": "a", "id": "a", "data-a": 1}
+
+
+def test_debc032_id_index_follows_mutations():
+    span = html.Span(id="span")
+    layout = html.Div([html.Div(span, id="inner"), html.P(id={"type": "p", "i": 1})])
+
+    assert layout["span"] is span
+    assert "span" in layout
+    assert {"i": 1, "type": "p"} in layout
+    assert "missing" not in layout
+
+    # Setting an id or children is picked up by the index.
+    span.id = "renamed"
+    assert "span" not in layout
+    assert layout["renamed"] is span
+
+    layout["inner"].children = html.B(id="bold")
+    assert "renamed" not in layout
+    assert "bold" in layout
+
+    # In place changes of a children list are found on a miss.
+    layout.children.append(html.I(id="italic"))
+    assert "italic" in layout
+
+    del layout["italic"]
+    assert "italic" not in layout
+    assert list(layout) == ["inner", "bold", {"type": "p", "i": 1}]
+
+
+def test_debc033_id_index_follows_list_changes():
+    a, b = html.Span(id="a"), html.Span(id="b")
+    inner = html.Div([b], id="inner")
+    layout = html.Div([a, inner])
+
+    assert layout["a"] is a
+    assert layout["b"] is b
+
+    layout.children.remove(a)
+    assert "a" not in layout
+    with pytest.raises(KeyError):
+        layout["a"]  # pylint: disable=pointless-statement
+
+    inner.children[0] = html.Span(id="c")
+    assert "b" not in layout
+    assert "c" in layout
+
+    layout.children.insert(0, a)
+    assert layout["a"] is a
@@ -0,0 +1,105 @@
+"""Unit tests for the background callbacks run as asyncio tasks, `AsyncioManager`."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from dash import AsyncioManager, Dash, Input, Output, html, set_props
+from dash.background_callback.managers import BaseBackgroundCallbackManager
+
+
+def _body(output):
+    return {
+        "output": f"{output}.children",
+        "outputs": {"id": output, "property": "children"},
+        "inputs": [{"id": "button", "property": "n_clicks", "value": 1}],
+        "changedPropIds": ["button.n_clicks"],
+    }
+
+
+def test_asyncio_manager_callbacks():
+    pytest.importorskip("quart")
+    manager = AsyncioManager()
+    app = Dash(__name__, backend="quart", background_callback_manager=manager)
+    app.layout = html.Div()
+    release = threading.Event()
+
+    @app.callback(
+        Output("async", "children"),
+        Input("button", "n_clicks"),
+        background=True,
+        progress=Output("progress", "children"),
+    )
+    async def run_async(set_progress, n_clicks):
+        set_progress("started")
+        set_props("status", {"children": "a"})
+        set_props("status", {"className": "b"})
+        while not release.is_set():
+            await asyncio.sleep(0.01)
+        return threading.current_thread().name
+
+    @app.callback(
+        Output("sync", "children"), Input("button", "n_clicks"), background=True
+    )
+    def run_sync(n_clicks):
+        return threading.current_thread().name
+
+    async def post(output, job=None):
+        url = "/_dash-update-component"
+        if job is not None:
+            url += f"?cacheKey={job['cacheKey']}&job={job['job']}"
+        response = await app.server.test_client().post(url, json=_body(output))
+        return await response.get_json()
+
+    async def result(output, job):
+        for _ in range(250):
+            data = await post(output, job)
+            if "response" in data:
+                return data["response"][output]["children"]
+            await asyncio.sleep(0.02)
+        raise AssertionError(f"No result for {output}")
+
+    async def run():
+        job = await post("async")
+        await asyncio.sleep(0.1)
+        running = await post("async", job)
+        assert running["progress"] == {"progress.children": "started"}
+        assert running["sideUpdate"] == {"status": {"children": "a", "className": "b"}}
+        assert manager.job_running(job["job"])
+
+        release.set()
+        assert await result("async", job) == "dash-asyncio-manager"
+        assert not manager.job_running(job["job"])
+
+        job = await post("sync")
+        assert await result("sync", job) != "dash-asyncio-manager"
+
+    try:
+        asyncio.run(run())
+    finally:
+        app.backend.shutdown_executor(wait=False)
+        BaseBackgroundCallbackManager.managers.remove(manager)
+
+
+def test_asyncio_manager_cancel():
+    manager = AsyncioManager()
+    cancelled = threading.Event()
+
+    async def wait(n):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    job_fn = manager.make_job_fn(wait, False)
+    job = manager.call_job_fn("key", job_fn, [1], {})
+    time.sleep(0.05)
+    assert manager.job_running(job)
+
+    manager.terminate_job(job)
+    assert cancelled.wait(1)
+    assert not manager.job_running(job)
+    assert manager.poll("key", job).result is manager.UNDEFINED
+    BaseBackgroundCallbackManager.managers.remove(manager)
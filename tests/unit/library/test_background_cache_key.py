@@ -0,0 +1,64 @@
+"""Unit tests for `BaseBackgroundCallbackManager.build_cache_key`."""
+import inspect
+
+import numpy as np
+import pandas as pd
+
+from dash.background_callback.managers import BaseBackgroundCallbackManager
+
+
+class _Manager(BaseBackgroundCallbackManager):
+    def make_job_fn(self, fn, progress, key=None):
+        return fn
+
+
+def _fn(value):
+    return value
+
+
+def _key(manager, args, ignore=None, triggered=None):
+    return manager.build_cache_key(_fn, args, ignore or [], triggered)
+
+
+def test_cache_key_source_read_once(monkeypatch):
+    manager = _Manager(None)
+    BaseBackgroundCallbackManager.register_func(_fn, False, "cache-key-test")
+
+    def fail(_):
+        raise AssertionError("function source read while building a cache key")
+
+    monkeypatch.setattr(inspect, "getsource", fail)
+    assert _key(manager, [1]) == _key(manager, [1])
+
+
+def test_cache_key_values():
+    manager = _Manager(None)
+
+    assert _key(manager, [{"a": 1, "b": [1, 2]}]) == _key(
+        manager, [{"b": [1, 2], "a": 1}]
+    )
+    keys = {_key(manager, [v]) for v in (1, 1.0, True, "1", None, [1])}
+    assert len(keys) == 6
+    assert _key(manager, [1, 2], ignore=[1]) == _key(manager, [1, 3], ignore=[1])
+    assert _key(manager, [1], triggered=["a.value"]) != _key(manager, [1])
+
+    cache_by = _Manager([lambda: "session"])
+    assert _key(cache_by, [1]) != _key(manager, [1])
+
+
+def test_cache_key_arrays():
+    manager = _Manager(None)
+    array = np.arange(100_000, dtype="float64")
+    changed = array.copy()
+    # str() of a large array elides the middle values.
+    changed[50_000] = -1
+
+    assert _key(manager, [array]) == _key(manager, [array.copy()])
+    assert _key(manager, [array]) != _key(manager, [changed])
+    assert _key(manager, [array]) != _key(manager, [array.astype("float32")])
+    assert _key(manager, [array[::2]]) == _key(manager, [array[::2].copy()])
+
+    frame = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    assert _key(manager, [frame]) == _key(manager, [frame.copy()])
+    assert _key(manager, [frame]) != _key(manager, [frame.iloc[::-1]])
+    assert _key(manager, [frame["a"]]) != _key(manager, [frame["a"] + 1])
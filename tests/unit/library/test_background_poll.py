@@ -0,0 +1,108 @@
+"""Unit tests for `BaseBackgroundCallbackManager.poll`."""
+import time
+
+import pytest
+
+from dash import set_props
+
+from dash.background_callback.managers import BaseBackgroundCallbackManager, JobState
+
+diskcache = pytest.importorskip("diskcache")
+pytest.importorskip("multiprocess")
+pytest.importorskip("psutil")
+
+from dash.background_callback import DiskcacheManager  # noqa: E402
+
+
+class _Manager(BaseBackgroundCallbackManager):
+    def __init__(self, state):
+        self.state = state
+        self.calls = []
+        super().__init__(None)
+
+    def make_job_fn(self, fn, progress, key=None):
+        return fn
+
+    def get_progress(self, key):
+        self.calls.append("progress")
+        return self.state.pop("progress", None)
+
+    def get_result(self, key, job):
+        self.calls.append("result")
+        return self.state.pop("result", self.UNDEFINED)
+
+    def job_running(self, job):
+        self.calls.append("running")
+        return self.state["running"]
+
+    def get_updated_props(self, key):
+        self.calls.append("props")
+        return self.state.pop("props", {})
+
+
+def test_default_poll():
+    manager = _Manager({"progress": [1], "props": {"a": {"b": 1}}, "running": True})
+    assert manager.poll("key", "job") == JobState(
+        [1], manager.UNDEFINED, {"a": {"b": 1}}, True
+    )
+    assert manager.calls == ["progress", "result", "running", "props"]
+    BaseBackgroundCallbackManager.managers.remove(manager)
+
+
+def test_diskcache_poll(tmp_path):
+    manager = DiskcacheManager(diskcache.Cache(str(tmp_path)))
+    handle = manager.handle
+    job = "pool-test"
+    handle.set("dash-pool-job-pool-test", "queued")
+    handle.set("key-progress", [0.5])
+    handle.push({"a": {"b": 1}}, prefix="key-set_props")
+
+    assert manager.poll("key", job) == JobState(
+        [0.5], manager.UNDEFINED, {"a": {"b": 1}}, True
+    )
+    # Progress and set_props are consumed.
+    assert manager.poll("key", job) == JobState(None, manager.UNDEFINED, {}, True)
+
+    handle.set("key", {"result": 1})
+    assert manager.poll("key", job) == JobState(None, {"result": 1}, {}, False)
+    assert "key" not in handle
+    assert "dash-pool-job-pool-test" not in handle
+
+    # Cancelled job.
+    handle.set("dash-pool-job-pool-other", "cancelled")
+    assert not manager.poll("other", "pool-other").running
+    BaseBackgroundCallbackManager.managers.remove(manager)
+
+
+def _report(n):
+    for i in range(n):
+        set_props("progress", {"children": i})
+        set_props({"type": "item", "index": i}, {"value": i})
+    set_props("progress", {"className": "done"})
+    return n
+
+
+@pytest.mark.parametrize("cache_class", ["Cache", "FanoutCache"])
+def test_diskcache_set_props_accumulate(tmp_path, cache_class):
+    manager = DiskcacheManager(getattr(diskcache, cache_class)(str(tmp_path)))
+    job_fn = manager.make_job_fn(_report, False)
+    job_fn("key", "key-progress", [3], {})
+
+    assert manager.get_updated_props("key") == {
+        "progress": {"children": 2, "className": "done"},
+        **{f'{{"index":{i},"type":"item"}}': {"value": i} for i in range(3)},
+    }
+    assert manager.get_updated_props("key") == {}
+    assert manager.get_result("key", None) == 3
+    BaseBackgroundCallbackManager.managers.remove(manager)
+
+
+def test_diskcache_set_props_expire(tmp_path):
+    handle = diskcache.Cache(str(tmp_path))
+    manager = DiskcacheManager(handle, expire=60)
+    manager.make_job_fn(_report, False)("key", "key-progress", [1], {})
+
+    # Never polled, the updates expire with the result.
+    handle.expire(now=time.time() + 120)
+    assert manager.get_updated_props("key") == {}
+    BaseBackgroundCallbackManager.managers.remove(manager)
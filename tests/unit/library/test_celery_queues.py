@@ -0,0 +1,100 @@
+"""Unit tests for the slots of the Celery jobs with limits, `JobQueue`."""
+import contextlib
+import threading
+import time
+
+from dash.background_callback.managers import JobQueue
+from dash.background_callback.managers import celery_manager
+
+
+class _FakeRedis:
+    """The hash commands of a redis client, the pipelines run when executed."""
+
+    def __init__(self):
+        self.hashes = {}
+
+    def hgetall(self, name):
+        return {
+            key.encode(): str(value).encode()
+            for key, value in self.hashes.get(name, {}).items()
+        }
+
+    def hset(self, name, key, value):
+        self.hashes.setdefault(name, {})[key] = value
+
+    def hdel(self, name, *keys):
+        for key in keys:
+            self.hashes.get(name, {}).pop(key, None)
+
+    def pipeline(self, transaction=True):  # pylint: disable=unused-argument
+        return _FakePipeline(self)
+
+    @contextlib.contextmanager
+    def lock(self, name, timeout=None):  # pylint: disable=unused-argument
+        yield
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.commands.append((name, args))
+
+    def execute(self):
+        for name, args in self.commands:
+            getattr(self.client, name)(*args)
+
+
+def _take(client, task_id, queue):
+    client.hset(celery_manager._QUEUE_WAITING, task_id, "{}")
+    return celery_manager._take_slot(client, task_id, queue.spec("cb", task_id))
+
+
+def test_take_slot():
+    client = _FakeRedis()
+    queue = JobQueue("q", max_jobs=2)
+
+    assert _take(client, "a", queue)
+    assert _take(client, "b", queue)
+    assert not _take(client, "c", queue)
+    assert list(client.hashes[celery_manager._QUEUE_WAITING]) == ["c"]
+    assert list(celery_manager._running_jobs(client)) == ["a", "b"]
+
+    celery_manager._release_slot(client, "a")
+    assert _take(client, "c", queue)
+    assert not client.hashes[celery_manager._QUEUE_WAITING]
+
+
+def test_expired_slot_is_freed():
+    client = _FakeRedis()
+    queue = JobQueue("q", max_jobs=1)
+    assert _take(client, "killed", queue)
+    assert not _take(client, "b", queue)
+
+    # The worker of the task was killed, its slot isn't renewed.
+    client.hashes[celery_manager._QUEUE_LEASES]["killed"] = time.time() - 1
+    assert _take(client, "b", queue)
+    assert list(client.hashes[celery_manager._QUEUE_RUNNING]) == ["b"]
+    assert list(client.hashes[celery_manager._QUEUE_LEASES]) == ["b"]
+
+
+def test_slot_renewed(monkeypatch):
+    monkeypatch.setattr(celery_manager, "_QUEUE_LEASE", 0.15)
+    client = _FakeRedis()
+    assert _take(client, "a", JobQueue("q", max_jobs=1))
+
+    stop = threading.Event()
+    heartbeat = threading.Thread(
+        target=celery_manager._renew_slot,
+        args=(client, "a", JobQueue("q", max_jobs=1).spec("cb", "a"), stop),
+    )
+    heartbeat.start()
+    time.sleep(0.5)
+    assert list(celery_manager._running_jobs(client)) == ["a"]
+    stop.set()
+    heartbeat.join()
+
+    time.sleep(0.2)
+    assert not celery_manager._running_jobs(client)
@@ -0,0 +1,117 @@
+"""Unit tests for the pooled mode of `DiskcacheManager`."""
+import os
+import time
+
+import pytest
+
+from dash.background_callback.managers import BaseBackgroundCallbackManager
+
+diskcache = pytest.importorskip("diskcache")
+pytest.importorskip("multiprocess")
+pytest.importorskip("psutil")
+
+from dash.background_callback import DiskcacheManager  # noqa: E402
+from dash.background_callback.managers import diskcache_manager  # noqa: E402
+
+
+def _work(duration):
+    time.sleep(duration)
+    return os.getpid()
+
+
+def _late_work():
+    return "late"
+
+
+@pytest.fixture
+def pool(tmp_path):
+    key = BaseBackgroundCallbackManager.register_func(_work, False, "pool-test")
+    manager = DiskcacheManager(
+        diskcache.Cache(str(tmp_path)), workers=2, max_jobs_per_worker=2
+    )
+    job_fn = manager.func_registry[key]
+
+    def submit(cache_key, duration=0.0):
+        return manager.call_job_fn(cache_key, job_fn, [duration], {})
+
+    yield manager, submit
+    manager.shutdown_pool()
+
+
+def _wait(manager, key, timeout=10):
+    deadline = time.time() + timeout
+    while not manager.result_ready(key):
+        assert time.time() < deadline, f"{key} not done"
+        time.sleep(0.02)
+
+
+def test_pool_runs_jobs_and_recycles_workers(pool):
+    manager, submit = pool
+
+    jobs = {f"key-{i}": submit(f"key-{i}", 0.05) for i in range(5)}
+    assert all(job.startswith("pool-") for job in jobs.values())
+    assert all(manager.job_running(job) for job in jobs.values())
+
+    pids = []
+    for key, job in jobs.items():
+        _wait(manager, key)
+        pids.append(manager.get_result(key, job))
+        assert not manager.job_running(job)
+
+    assert os.getpid() not in pids
+    # Two workers running two jobs each, the fifth job needs a new worker.
+    assert len(set(pids)) == 3
+
+
+def test_pool_cancel_by_job_id(pool):
+    manager, submit = pool
+
+    jobs = [submit(f"long-{i}", 30) for i in range(3)]
+    deadline = time.time() + 10
+    while not all(
+        isinstance(manager.handle.get(f"dash-pool-job-{job}"), int) for job in jobs[:2]
+    ):
+        assert time.time() < deadline
+        time.sleep(0.02)
+
+    for job in jobs:
+        manager.terminate_job(job)
+        assert not manager.job_running(job)
+
+    # The killed workers are replaced and the cancelled job is skipped.
+    job = submit("after")
+    _wait(manager, "after")
+    assert manager.get_result("after", job) != os.getpid()
+    assert not any(manager.result_ready(f"long-{i}") for i in range(3))
+
+
+def test_pool_function_registered_later(pool):
+    manager, submit = pool
+    job = submit("first")
+    _wait(manager, "first")
+    manager.get_result("first", job)
+
+    # Registered after the workers were started, run by new workers.
+    key = BaseBackgroundCallbackManager.register_func(_late_work, False, "pool-late")
+    job = manager.call_job_fn("late", manager.func_registry[key], [], {})
+    _wait(manager, "late")
+    assert manager.get_result("late", job) == "late"
+
+
+def test_pool_unknown_function(tmp_path):
+    cache = diskcache.Cache(str(tmp_path))
+    waiting = []
+    for sequence, job in enumerate(["early", "late"], 1):
+        cache.set(diskcache_manager._pool_job_key(job), diskcache_manager._JOB_QUEUED)
+        cache.set(diskcache_manager._pool_item_key(job), (job, [], {}))
+        waiting.append((0, sequence, job, "missing", None))
+    cache.set(diskcache_manager._POOL_WAITING, waiting)
+
+    # Submitted before the worker started, the function isn't registered.
+    assert diskcache_manager._claim_pool_job(cache, {}, known=1) is False
+    error = cache.get("early")["background_callback_error"]
+    assert error["msg"] == "Unknown background callback missing."
+    # Submitted after, left to a new worker.
+    claimed = diskcache_manager._claim_pool_job(cache, {}, known=1)
+    assert claimed == diskcache_manager._JOBS_UNKNOWN
+    assert cache.get(diskcache_manager._POOL_WAITING) == [waiting[1]]
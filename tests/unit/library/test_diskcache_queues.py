@@ -0,0 +1,135 @@
+"""Unit tests for the limits and priorities of the background jobs, `JobQueue`."""
+import time
+
+import pytest
+
+from dash import Dash, Input, Output
+from dash.background_callback.managers import BaseBackgroundCallbackManager, JobQueue
+
+diskcache = pytest.importorskip("diskcache")
+pytest.importorskip("multiprocess")
+pytest.importorskip("psutil")
+
+from dash.background_callback import DiskcacheManager  # noqa: E402
+
+
+def _work(duration):
+    time.sleep(duration)
+    return time.time()
+
+
+def _wait(manager, key, timeout=10):
+    deadline = time.time() + timeout
+    while not manager.result_ready(key):
+        assert time.time() < deadline, f"{key} not done"
+        time.sleep(0.02)
+
+
+@pytest.fixture
+def make_manager(tmp_path):
+    key = BaseBackgroundCallbackManager.register_func(_work, False, "queue-test")
+    managers = []
+
+    def make(**kwargs):
+        manager = DiskcacheManager(diskcache.Cache(str(tmp_path)), **kwargs)
+        managers.append(manager)
+        job_fn = manager.func_registry[key]
+
+        def submit(cache_key, duration, queue=None, session="a"):
+            return manager.call_job_fn(
+                cache_key,
+                job_fn,
+                [duration],
+                {},
+                queue=queue and queue.spec("queue-test", session),
+            )
+
+        return manager, submit
+
+    yield make
+    for manager in managers:
+        manager.shutdown_pool()
+        BaseBackgroundCallbackManager.managers.remove(manager)
+
+
+def test_job_admitted():
+    queue = JobQueue(
+        "q",
+        max_jobs=3,
+        max_jobs_per_callback=2,
+        max_jobs_per_session=1,
+        session=lambda: "a",
+    )
+    admitted = BaseBackgroundCallbackManager._job_admitted
+    spec = queue.spec("cb", "a")
+    assert admitted(spec, [None, JobQueue("other", max_jobs=1).spec("cb", "a")])
+    assert not admitted(spec, [queue.spec("other-cb", "a")])
+    assert not admitted(spec, [queue.spec("cb", "b"), queue.spec("cb", "c")])
+    assert not admitted(
+        spec, [queue.spec("x", "b"), queue.spec("y", "c"), queue.spec("z", "d")]
+    )
+    assert admitted(spec, [queue.spec("x", "b"), queue.spec("cb", "c")])
+    assert admitted(None, [spec] * 10)
+
+
+def test_session_limit(make_manager):
+    manager, submit = make_manager()
+    queue = JobQueue("run", max_jobs_per_session=1, session=lambda: "a")
+
+    first = submit("first", 1, queue)
+    second = submit("second", 0, queue)
+    other = submit("other", 0, queue, session="b")
+    _wait(manager, "other")
+    assert manager.job_running(first)
+    assert manager.job_running(second)
+    assert not manager.result_ready("second")
+    assert manager.queue_stats() == {"waiting": {"run": 1}, "running": {"run": 1}}
+
+    _wait(manager, "second")
+    assert manager.get_result("second", second) >= manager.get_result("first", first)
+    manager.get_result("other", other)
+    assert manager.queue_stats() == {"waiting": {}, "running": {}}
+
+
+def test_cancel_waiting_job(make_manager):
+    manager, submit = make_manager(max_jobs=1)
+
+    running = submit("running", 30)
+    waiting = submit("waiting", 0)
+    manager.terminate_job(waiting)
+    assert not manager.job_running(waiting)
+    manager.terminate_job(running)
+    assert not manager.job_running(running)
+
+    job = submit("after", 0)
+    _wait(manager, "after")
+    assert manager.get_result("after", job)
+    assert not manager.result_ready("waiting")
+
+
+def test_pool_priority(make_manager):
+    manager, submit = make_manager(workers=1)
+    low, high = JobQueue("low"), JobQueue("high", priority=1)
+
+    blocker = submit("blocker", 0.5)
+    deadline = time.time() + 10
+    while not isinstance(manager.handle.get(f"dash-pool-job-{blocker}"), int):
+        assert time.time() < deadline
+        time.sleep(0.02)
+    jobs = [submit("low", 0, low), submit("high", 0, high)]
+    assert manager.queue_stats()["waiting"] == {"low": 1, "high": 1}
+    _wait(manager, "low")
+    assert manager.get_result("high", jobs[1]) < manager.get_result("low", jobs[0])
+
+
+def test_queue_requires_background():
+    with pytest.raises(ValueError, match="queue"):
+        Dash(__name__).callback(
+            Output("a", "children"), Input("b", "children"), queue=JobQueue("q")
+        )
+
+
+def test_session_limit_requires_session():
+    # The remote address is shared by the users behind a proxy.
+    with pytest.raises(ValueError, match="session"):
+        JobQueue("q", max_jobs_per_session=1)
@@ -0,0 +1,86 @@
+"""Unit tests for the memory-mapped result arrays of `DiskcacheManager`."""
+import os
+import time
+
+import numpy as np
+import pytest
+
+from dash.background_callback.managers import BaseBackgroundCallbackManager
+
+diskcache = pytest.importorskip("diskcache")
+pytest.importorskip("multiprocess")
+pytest.importorskip("psutil")
+
+from dash.background_callback import DiskcacheManager  # noqa: E402
+
+
+def _simulate(n):
+    return [np.arange(n, dtype="float64"), {"small": np.ones(2), "n": n}]
+
+
+@pytest.mark.parametrize("cache_by", [None, [lambda: 1]])
+def test_shared_arrays(tmp_path, cache_by):
+    directory = str(tmp_path / "arrays")
+    manager = DiskcacheManager(
+        diskcache.Cache(str(tmp_path / "cache")),
+        cache_by=cache_by,
+        array_threshold=1024,
+        array_directory=directory,
+    )
+    manager.make_job_fn(_simulate, False)("key", "key-progress", [1000], {})
+
+    # Only the large array is written to a file.
+    assert len(os.listdir(directory)) == 1
+    stored = manager.handle.get("key")
+    assert not isinstance(stored[0], np.ndarray)
+    assert isinstance(stored[1]["small"], np.ndarray)
+
+    result = manager.poll("key", None).result
+    assert isinstance(result[0], np.memmap)
+    assert not result[0].flags.writeable
+    np.testing.assert_array_equal(result[0], np.arange(1000))
+    assert result[1]["n"] == 1000
+
+    if cache_by is None:
+        assert not os.listdir(directory)
+    else:
+        np.testing.assert_array_equal(
+            manager.get_result("key", None)[0], np.arange(1000)
+        )
+        manager.clear_cache_entry("key")
+        assert not os.listdir(directory)
+    BaseBackgroundCallbackManager.managers.remove(manager)
+
+
+def test_shared_arrays_swept(tmp_path):
+    directory = str(tmp_path / "arrays")
+    manager = DiskcacheManager(
+        diskcache.Cache(str(tmp_path / "cache")),
+        expire=60,
+        array_threshold=1024,
+        array_directory=directory,
+    )
+    job_fn = manager.make_job_fn(_simulate, False)
+    job_fn("expired", "expired-progress", [1000], {})
+    # A file of the manager of another cache sharing the directory.
+    with open(os.path.join(directory, f"dash-other-key-{'0' * 32}.npy"), "wb"):
+        pass
+
+    # Never read, the result expires.
+    manager.handle.expire(now=time.time() + 120)
+    assert "expired" not in manager.handle
+    job_fn("key", "key-progress", [1000], {})
+
+    # The files just written aren't swept, their result may be stored next.
+    manager.poll("missing", "0")
+    assert len(os.listdir(directory)) == 3
+
+    for name in os.listdir(directory):
+        os.utime(os.path.join(directory, name), (time.time() - 120,) * 2)
+    manager._arrays._swept = 0
+    manager.poll("missing", "0")
+    remaining = os.listdir(directory)
+    assert len(remaining) == 2
+    assert any(name.startswith("dash-other-") for name in remaining)
+    np.testing.assert_array_equal(manager.poll("key", None).result[0], np.arange(1000))
+    BaseBackgroundCallbackManager.managers.remove(manager)
@@ -25,7 +25,7 @@ class FakeCache:
     def __init__(self):
         self.store = {}
 
-    def set(self, key, value):
+    def set(self, key, value, expire=None):  # pylint: disable=unused-argument
         self.store[key] = value
 
     def get(self, key, default=None):
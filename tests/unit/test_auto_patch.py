@@ -0,0 +1,189 @@
+"""Unit tests for the automatic patches of the outputs, `auto_patch=True`."""
+import copy
+import itertools
+
+import numpy as np
+import pytest
+
+from dash import AutoPatchStore, Dash, Input, Output
+from dash._auto_patch import diff
+
+
+def _apply(value, patch):
+    # The operations as applied by the renderer, `actions/patch.ts`.
+    value = copy.deepcopy(value)
+    for operation in patch["operations"]:
+        name, location = operation["operation"], operation["location"]
+        params = operation["params"]
+        if name == "Assign" and not location:
+            value = params["value"]
+            continue
+        target = value
+        for key in location[:-1] if name != "Extend" else location:
+            target = target[key]
+        if name == "Assign":
+            target[location[-1]] = params["value"]
+        elif name == "Delete":
+            del target[location[-1]]
+        elif name == "Extend":
+            target.extend(params["value"])
+        else:
+            raise AssertionError(name)
+    return value
+
+
+@pytest.mark.parametrize(
+    "old,new",
+    [
+        ({"a": 1, "b": {"c": [1, 2]}}, {"a": 1, "b": {"c": [1, 3]}, "d": None}),
+        ({"a": 1, "b": 2}, {"b": 2}),
+        (list(range(10)), list(range(2, 13))),
+        (list(range(10)), list(range(12))),
+        (list(range(10)), list(range(6))),
+        (list(range(10)), list(range(3, 8))),
+        ([1, 2, 3], [4, 5, 6]),
+        ([1, 2], []),
+        ({"a": [1, True]}, {"a": [1, 1]}),
+        (
+            {"x": {"dtype": "f8", "bdata": "AA=="}},
+            {"x": {"dtype": "f8", "bdata": "AQ=="}},
+        ),
+    ],
+)
+def test_diff(old, new):
+    assert _apply(old, diff(old, new)) == new
+
+
+def test_diff_operations():
+    old = {"data": [{"y": list(range(100)), "name": "a"}, {"y": [1]}]}
+    new = copy.deepcopy(old)
+    new["data"][1]["y"] = [2]
+    new["data"][0]["y"] = list(range(1, 101))
+    assert diff(old, new)["operations"] == [
+        {"operation": "Delete", "location": ["data", 0, "y", 0], "params": {}},
+        {
+            "operation": "Extend",
+            "location": ["data", 0, "y"],
+            "params": {"value": [100]},
+        },
+        {"operation": "Assign", "location": ["data", 1, "y"], "params": {"value": [2]}},
+    ]
+    assert diff(1, 2) is None
+    assert diff([1], {"a": 1}) is None
+
+
+_numbers = itertools.count()
+
+
+@pytest.fixture
+def post(callback_body, post_callback):
+    def post_value(app, value, bases=None, session=None):
+        extra = {}
+        if bases is not None:
+            extra["patchBases"] = bases
+        if session is not None:
+            extra["generation"] = [session, next(_numbers)]
+        body = callback_body("graph.figure", {"interval.n_intervals": value}, **extra)
+        return post_callback(app, body).get_json()
+
+    return post_value
+
+
+def test_auto_patch_callback(post, empty_app):
+    app = empty_app()
+
+    @app.callback(
+        Output("graph", "figure"), Input("interval", "n_intervals"), auto_patch=True
+    )
+    def update(n):
+        if n == 3:
+            return {"data": [{"y": [n]}]}
+        return {
+            "data": [{"y": np.arange(n, n + 1000)}, {"y": [0] * 1000}],
+            "layout": {"title": str(n)},
+        }
+
+    first = post(app, 0)
+    assert first["response"]["graph"]["figure"]["layout"] == {"title": "0"}
+    token = first["patchBases"]["graph.figure"]
+
+    second = post(app, 1, {"graph.figure": token})
+    patch = second["response"]["graph"]["figure"]
+    assert patch["__dash_patch_update"] == "__dash_patch_update"
+    assert (
+        _apply(first["response"]["graph"]["figure"], patch)
+        == post(app, 1)["response"]["graph"]["figure"]
+    )
+    assert second["patchBases"]["graph.figure"] != token
+
+    # The token is used once, unknown tokens get the full value.
+    assert post(app, 1, {"graph.figure": token})["response"]["graph"]["figure"][
+        "layout"
+    ] == {"title": "1"}
+
+    # Full value when it's smaller than the patch.
+    third = post(app, 3, {"graph.figure": second["patchBases"]["graph.figure"]})
+    assert third["response"]["graph"]["figure"] == {"data": [{"y": [3]}]}
+
+
+def test_auto_patch_sessions(post, empty_app):
+    app = empty_app()
+
+    @app.callback(
+        Output("graph", "figure"),
+        Input("interval", "n_intervals"),
+        auto_patch=AutoPatchStore(max_sessions=8),
+    )
+    def update(n):
+        return {"data": [{"y": list(range(n, n + 1000))}]}
+
+    # More pages than a store of the last 8 values would hold, each page
+    # gets the patch of the value it holds.
+    tokens = {}
+    for session in range(8):
+        tokens[session] = post(app, 0, session=str(session))["patchBases"]
+    for _ in range(3):
+        for session in range(8):
+            response = post(app, 1, tokens[session], session=str(session))
+            assert "operations" in response["response"]["graph"]["figure"]
+            tokens[session] = response["patchBases"]
+
+    # The token of a page isn't the base of another page.
+    response = post(app, 1, tokens[1], session="0")
+    assert "operations" not in response["response"]["graph"]["figure"]
+
+    # The page least recently updated is dropped past the limit.
+    post(app, 0, session="new")
+    response = post(app, 1, tokens[2], session="2")
+    assert "operations" in response["response"]["graph"]["figure"]
+    response = post(app, 1, tokens[1], session="1")
+    assert "operations" not in response["response"]["graph"]["figure"]
+
+
+def test_auto_patch_store_bounded():
+    store = AutoPatchStore(max_sessions=10, max_bytes=100)
+    tokens = [store.add(index, "a.b", [index], 40) for index in range(3)]
+    # The page least recently updated was dropped for the total to fit.
+    assert store.nbytes == 80
+    assert store.pop(0, "a.b", tokens[0]) is None
+    assert store.pop(2, "a.b", tokens[1]) is None
+    assert store.pop(2, "a.b", tokens[2]) == [2]
+    assert store.nbytes == 40
+    # The last value of an output replaces the previous one.
+    token = store.add(1, "a.b", [3], 30)
+    assert store.nbytes == 30
+    assert store.pop(1, "a.b", tokens[1]) is None
+    assert store.pop(1, "a.b", token) == [3]
+    # Values larger than the store aren't kept.
+    assert store.add(1, "a.b", [], 101) is None
+    assert store.nbytes == 0
+
+
+def test_auto_patch_background():
+    with pytest.raises(ValueError, match="auto_patch"):
+        Dash(__name__).callback(
+            Output("a", "children"),
+            Input("b", "children"),
+            background=True,
+            auto_patch=True,
+        )
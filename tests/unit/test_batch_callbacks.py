@@ -0,0 +1,103 @@
+"""Unit tests for the batched callback endpoint, `batch_callbacks=True`."""
+import asyncio
+import time
+
+import pytest
+
+from dash import Input, Output, ctx
+from dash.exceptions import PreventUpdate
+
+BATCH_URL = "/_dash-update-component-batch"
+
+
+@pytest.fixture
+def batch_app(empty_app):
+    def make(**kwargs):
+        app = empty_app(batch_callbacks=True, **kwargs)
+
+        @app.callback(Output("out-0", "children"), Input("in-0", "children"))
+        def slow(value):
+            time.sleep(0.3)
+            ctx.response.set_cookie("slow", "done")
+            return f"slow {value}"
+
+        @app.callback(Output("out-1", "children"), Input("in-1", "children"))
+        def slow_too(value):
+            time.sleep(0.3)
+            return f"slow too {value}"
+
+        @app.callback(Output("out-2", "children"), Input("in-2", "children"))
+        def prevent(_):
+            raise PreventUpdate
+
+        @app.callback(Output("out-3", "children"), Input("in-3", "children"))
+        def fail(_):
+            raise ValueError("failed")
+
+        return app
+
+    return make
+
+
+@pytest.fixture
+def body(callback_body):
+    def make(index, value=None):
+        return callback_body(f"out-{index}.children", {f"in-{index}.children": value})
+
+    return make
+
+
+def test_batch_callbacks_responses(body, batch_app, post_callback):
+    start = time.perf_counter()
+    response = post_callback(batch_app(), [body(i, i) for i in range(4)], BATCH_URL)
+    elapsed = time.perf_counter() - start
+
+    assert response.status_code == 200
+    assert "slow=done" in response.headers["Set-Cookie"]
+    slow, slow_too, prevent, fail = response.get_json()
+    assert slow == {
+        "status": 200,
+        "data": {"multi": True, "response": {"out-0": {"children": "slow 0"}}},
+    }
+    assert slow_too["data"]["response"] == {"out-1": {"children": "slow too 1"}}
+    assert prevent == {"status": 204}
+    assert fail == {"status": 500, "message": "Internal server error."}
+    # The two slow callbacks ran concurrently.
+    assert elapsed < 0.55
+
+
+def test_batch_callbacks_unknown_callback(body, batch_app, post_callback):
+    response = post_callback(
+        batch_app(), [{"output": "missing.children"}, body(2)], BATCH_URL
+    )
+    assert response.get_json() == [
+        {"status": 500, "message": "Internal server error."},
+        {"status": 204},
+    ]
+
+
+def test_batch_callbacks_async_quart(body, batch_app, post_callback_async):
+    pytest.importorskip("quart")
+    app = batch_app(backend="quart")
+
+    @app.callback(Output("out-async", "children"), Input("in-async", "children"))
+    async def async_callback(value):
+        await asyncio.sleep(0.3)
+        return f"async {value}"
+
+    start = time.perf_counter()
+    slow, prevent, async_response = asyncio.run(
+        post_callback_async(app, [body(0, "a"), body(2), body("async", "b")], BATCH_URL)
+    )
+    assert time.perf_counter() - start < 0.55
+    assert slow["data"]["response"] == {"out-0": {"children": "slow a"}}
+    assert prevent == {"status": 204}
+    assert async_response["data"]["response"] == {"out-async": {"children": "async b"}}
+
+
+def test_batch_callbacks_disabled_by_default(batch_app, empty_app, post_callback):
+    app = empty_app()
+    assert app._config()["batch_callbacks"] is False
+    assert post_callback(app, [], BATCH_URL).status_code == 405
+
+    assert batch_app()._config()["batch_callbacks"] is True
@@ -0,0 +1,84 @@
+"""Unit tests for the thread pools of the sync callbacks, `callback_executors`."""
+import asyncio
+import threading
+
+import pytest
+
+from dash import Dash, Input, Output
+from dash.exceptions import UnknownCallbackExecutor
+
+
+def test_quart_sync_callbacks_off_the_loop(
+    callback_body, empty_app, post_callback_async
+):
+    pytest.importorskip("quart")
+    app = empty_app(backend="quart", callback_executors={"cpu": 1})
+
+    @app.callback(Output("shared", "children"), Input("button", "n_clicks"))
+    def shared(_):
+        return threading.current_thread().name
+
+    @app.callback(
+        Output("cpu", "children"), Input("button", "n_clicks"), executor="cpu"
+    )
+    def cpu(_):
+        return threading.current_thread().name
+
+    @app.callback(Output("loop", "children"), Input("button", "n_clicks"))
+    async def loop(_):
+        return threading.current_thread().name
+
+    async def post(output):
+        body = callback_body(f"{output}.children", {"button.n_clicks": 1})
+        data = await post_callback_async(app, body)
+        return data["response"][output]["children"]
+
+    async def run():
+        return await asyncio.gather(post("shared"), post("cpu"), post("loop"))
+
+    try:
+        shared_thread, cpu_thread, loop_thread = asyncio.run(run())
+    finally:
+        app.backend.shutdown_executor(wait=False)
+    assert shared_thread.startswith("dash-callback-")
+    assert cpu_thread.startswith("dash-cpu-")
+    assert loop_thread == threading.current_thread().name
+
+
+def test_named_executors():
+    app = Dash(__name__, callback_executors={"io": 3})
+    backend = app.backend
+
+    @app.callback(Output("a", "children"), Input("b", "children"), executor="io")
+    def update(value):
+        return value
+
+    executor = backend.get_executor_for(app, "a.children")
+    assert executor is backend.get_callback_executor(3, name="io")
+    assert executor is not backend.get_callback_executor(4)
+    assert executor._max_workers == 3
+
+    backend.shutdown_executor(wait=False)
+    assert backend.get_executor_for(app, "a.children") is not executor
+    backend.shutdown_executor(wait=False)
+
+
+def test_unknown_executor(empty_app):
+    app = empty_app()
+
+    @app.callback(Output("a", "children"), Input("b", "children"), executor="gpu")
+    def update(value):
+        return value
+
+    with pytest.raises(UnknownCallbackExecutor, match="gpu"):
+        app._setup_server()
+    with pytest.raises(UnknownCallbackExecutor, match="gpu"):
+        app.backend.get_executor_for(app, "a.children")
+
+    with pytest.raises(ValueError, match="executor"):
+        app.callback(
+            Output("c", "children"),
+            Input("d", "children"),
+            background=True,
+            executor="io",
+        )
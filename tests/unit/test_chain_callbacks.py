@@ -0,0 +1,160 @@
+"""Unit tests for the server-side callback chaining of `chain_callbacks=True`."""
+import pytest
+
+from dash import Input, Output, Patch, State, ctx
+from dash.exceptions import PreventUpdate
+
+
+@pytest.fixture
+def post(callback_body, post_callback):
+    body = callback_body("region.options", {"country.value": "FR"})
+    return lambda app: post_callback(app, body)
+
+
+@pytest.fixture
+def region_app(empty_app):
+    def make(**kwargs):
+        app = empty_app(**kwargs)
+
+        @app.callback(Output("region", "options"), Input("country", "value"))
+        def regions(country):
+            return [f"{country}-r1", f"{country}-r2"]
+
+        @app.callback(Output("region", "value"), Input("region", "options"))
+        def region(options):
+            return options[0]
+
+        @app.callback(
+            Output("city", "options"),
+            Input("region", "value"),
+            State("country", "value"),
+        )
+        def cities(region_value, country):
+            ctx.response.set_cookie("chained", "1")
+            return [f"{country}/{region_value}"]
+
+        # The state value isn't known by the server, left to the renderer.
+        @app.callback(
+            Output("city", "value"),
+            Input("city", "options"),
+            State("unknown", "value"),
+        )
+        def city(options, _):
+            return options[0]
+
+        return app
+
+    return make
+
+
+def test_chain_callbacks(post, region_app):
+    response = post(region_app(chain_callbacks=True))
+    assert "chained=1" in response.headers["Set-Cookie"]
+    assert response.get_json() == {
+        "multi": True,
+        "response": {
+            "region": {"options": ["FR-r1", "FR-r2"], "value": "FR-r1"},
+            "city": {"options": ["FR/FR-r1"]},
+        },
+        "chained": ["region.value", "city.options"],
+    }
+
+
+def test_chain_callbacks_disabled_by_default(post, region_app):
+    response = post(region_app())
+    assert "Set-Cookie" not in response.headers
+    assert response.get_json() == {
+        "multi": True,
+        "response": {"region": {"options": ["FR-r1", "FR-r2"]}},
+    }
+
+
+def test_chain_stops_at_clientside_callbacks(post, region_app):
+    app = region_app(chain_callbacks=True)
+    app.clientside_callback(
+        "(options) => options.length",
+        Output("count", "children"),
+        Input("region", "options"),
+    )
+    assert "chained" not in post(app).get_json()
+
+
+def test_chain_prevented_update(post, empty_app):
+    app = empty_app(chain_callbacks=True)
+
+    @app.callback(Output("region", "options"), Input("country", "value"))
+    def regions(country):
+        return [country]
+
+    @app.callback(Output("region", "value"), Input("region", "options"))
+    def region(_):
+        raise PreventUpdate
+
+    @app.callback(Output("city", "options"), Input("region", "value"))
+    def cities(region_value):
+        return [region_value]
+
+    assert post(app).get_json() == {
+        "multi": True,
+        "response": {"region": {"options": ["FR"]}},
+        "chained": ["region.value"],
+    }
+
+
+def test_chain_failed_step(caplog, post, empty_app):
+    app = empty_app(chain_callbacks=True)
+    calls = []
+
+    @app.callback(Output("region", "options"), Input("country", "value"))
+    def regions(country):
+        return [country]
+
+    @app.callback(Output("region", "value"), Input("region", "options"))
+    def region(_):
+        calls.append(1)
+        raise ValueError("no region")
+
+    # The failed callback is not requested again by the renderer, its error
+    # is reported to the dev tools.
+    assert post(app).get_json() == {
+        "multi": True,
+        "response": {"region": {"options": ["FR"]}},
+        "chained": ["region.value"],
+        "chainErrors": {"region.value": "Internal server error."},
+    }
+    assert calls == [1]
+    assert "Chained callback region.value failed" in caplog.text
+    assert "no region" in caplog.text
+
+    app._setup_dev_tools(debug=True, dev_tools_hot_reload=False)
+    assert "no region" in post(app).get_json()["chainErrors"]["region.value"]
+
+
+def test_chain_patch_step(post, empty_app):
+    app = empty_app(chain_callbacks=True)
+    calls = []
+
+    @app.callback(Output("region", "options"), Input("country", "value"))
+    def regions(country):
+        return [country]
+
+    @app.callback(Output("log", "children"), Input("region", "options"))
+    def log(options):
+        calls.append("log")
+        patch = Patch()
+        patch.append(options[0])
+        return patch
+
+    @app.callback(Output("summary", "children"), Input("log", "children"))
+    def summary(children):
+        calls.append("summary")
+        return len(children)
+
+    data = post(app).get_json()
+    # The patch is applied by the renderer, which runs the callbacks reading
+    # the patched prop.
+    assert data["chained"] == ["log.children"]
+    assert data["response"]["log"]["children"]["operations"] == [
+        {"operation": "Append", "location": [], "params": {"value": "FR"}}
+    ]
+    assert calls == ["log"]
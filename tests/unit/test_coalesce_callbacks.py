@@ -0,0 +1,147 @@
+"""Unit tests for the single-flight coalescing of identical callback calls."""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dash import Input, Output, ctx, set_props
+from dash.exceptions import PreventUpdate
+
+
+@pytest.fixture
+def body(callback_body):
+    def make(value=1, output="out"):
+        return callback_body(f"{output}.children", {"in.value": value})
+
+    return make
+
+
+def _post_concurrently(app, bodies):
+    barrier = threading.Barrier(len(bodies))
+
+    def post(body):
+        client = app.server.test_client()
+        barrier.wait()
+        response = client.post("/_dash-update-component", json=body)
+        return response.status_code, response.get_json()
+
+    with ThreadPoolExecutor(len(bodies)) as pool:
+        return list(pool.map(post, bodies))
+
+
+@pytest.fixture
+def report_app(empty_app):
+    def make(calls, **kwargs):
+        app = empty_app(**kwargs)
+
+        @app.callback(Output("out", "children"), Input("in", "value"))
+        def report(value):
+            calls.append(value)
+            time.sleep(0.2)
+            if value is None:
+                raise PreventUpdate
+            set_props("side", {"children": value})
+            return value * 2
+
+        return app
+
+    return make
+
+
+def test_coalesce_identical_calls(body, report_app):
+    calls = []
+    app = report_app(calls, coalesce_callbacks=True)
+
+    responses = _post_concurrently(app, [body(1)] * 4 + [body(2)] * 2)
+    assert sorted(calls) == [1, 2]
+    assert [r[1]["response"] for r in responses] == [{"out": {"children": 2}}] * 4 + [
+        {"out": {"children": 4}}
+    ] * 2
+    assert all(r[1]["sideUpdate"] for r in responses)
+
+    # Later calls run the function again.
+    _post_concurrently(app, [body(1)])
+    assert sorted(calls) == [1, 1, 2]
+
+    calls.clear()
+    responses = _post_concurrently(app, [body(None)] * 3)
+    assert calls == [None]
+    assert [r[0] for r in responses] == [204] * 3
+
+
+def test_coalesce_disabled(body, report_app):
+    calls = []
+    app = report_app(calls)
+    _post_concurrently(app, [body(1)] * 3)
+    assert calls == [1, 1, 1]
+
+
+def test_coalesce_skips_request_dependent_callbacks(body, empty_app):
+    app = empty_app()
+    calls = []
+
+    @app.callback(Output("user", "children"), Input("in", "value"), coalesce=True)
+    def user(value):
+        calls.append(value)
+        time.sleep(0.2)
+        return ctx.cookies.get("user")
+
+    @app.callback(Output("out", "children"), Input("in", "value"), coalesce=False)
+    def opted_out(value):
+        calls.append(value)
+        time.sleep(0.2)
+        return value
+
+    responses = _post_concurrently(app, [body(1, "user")] * 3)
+    # The waiting calls ran the function once the first read the cookies.
+    assert calls == [1, 1, 1]
+    assert all(r[0] == 200 for r in responses)
+
+    calls.clear()
+    _post_concurrently(app, [body(1, "user")] * 2 + [body(2)] * 2)
+    assert sorted(calls) == [1, 1, 2, 2]
+
+
+def test_coalesce_after_batched_request(body, report_app, post_callback):
+    calls = []
+    app = report_app(calls, coalesce_callbacks=True, batch_callbacks=True)
+    response = post_callback(app, [body(3)], "/_dash-update-component-batch")
+    assert response.status_code == 200
+    assert calls == [3]
+
+    calls.clear()
+    _post_concurrently(app, [body(1)] * 3)
+    assert calls == [1]
+
+
+def test_coalesce_async(body, empty_app, post_callback_async):
+    pytest.importorskip("quart")
+    app = empty_app(backend="quart", coalesce_callbacks=True)
+    calls = []
+
+    @app.callback(Output("out", "children"), Input("in", "value"))
+    async def report(value):
+        calls.append(value)
+        await asyncio.sleep(0.2)
+        return value * 2
+
+    async def run():
+        return await asyncio.gather(
+            *(post_callback_async(app, body(1)) for _ in range(3))
+        )
+
+    responses = asyncio.run(run())
+    assert calls == [1]
+    assert [r["response"] for r in responses] == [{"out": {"children": 2}}] * 3
+
+
+def test_coalesce_background_not_supported(empty_app):
+    with pytest.raises(ValueError):
+        empty_app().callback(
+            Output("a", "children"),
+            Input("in", "value"),
+            background=True,
+            coalesce=True,
+        )
@@ -0,0 +1,126 @@
+"""Unit tests for the per-callback dispatch plans built by `insert_callback`."""
+from dash import ALL, Dash, Input, Output, State, ctx, html
+from dash._grouping import compile_grouping
+from dash._utils import stringify_id
+
+
+def _post(app, body):
+    response = app.server.test_client().post("/_dash-update-component", json=body)
+    assert response.status_code == 200
+    return response.get_json()["response"]
+
+
+def test_compile_grouping():
+    flat = ["a", "b", "c"]
+
+    build, using = compile_grouping(1)
+    assert (build(flat), using) == ("b", False)
+
+    build, using = compile_grouping([0, 1, 2])
+    assert (build(flat), using) == (flat, False)
+
+    build, using = compile_grouping({"x": 2, "y": [0, 1]})
+    assert (build(flat), using) == ({"x": "c", "y": ["a", "b"]}, True)
+
+
+def test_dispatch_plan_groupings():
+    app = Dash(__name__)
+    app.layout = html.Div()
+    seen = {}
+
+    @app.callback(
+        output=dict(out=Output("out", "children"), other=Output("other", "title")),
+        inputs=dict(
+            items=dict(
+                all=Input({"item": ALL}, "children"),
+                new=Input({"kind": "new"}, "value"),
+            ),
+            trigger=Input("add", "n_clicks"),
+        ),
+        state=dict(store=State("store", "data")),
+    )
+    def grouped(items, trigger, store):
+        seen["args"] = ctx.args_grouping
+        seen["outputs"] = ctx.outputs_grouping
+        seen["using"] = (ctx.using_args_grouping, ctx.using_outputs_grouping)
+        return dict(out=len(items["all"]), other=store)
+
+    items = [
+        {"id": {"item": i}, "property": "children", "value": f"item {i}"}
+        for i in range(2)
+    ]
+    response = _post(
+        app,
+        {
+            "output": "..out.children...other.title..",
+            "outputs": [
+                {"id": "out", "property": "children"},
+                {"id": "other", "property": "title"},
+            ],
+            "inputs": [
+                items,
+                {"id": {"kind": "new"}, "property": "value", "value": "new"},
+                {"id": "add", "property": "n_clicks", "value": 3},
+            ],
+            "state": [{"id": "store", "property": "data", "value": "stored"}],
+            "changedPropIds": ["add.n_clicks"],
+        },
+    )
+    assert response == {"out": {"children": 2}, "other": {"title": "stored"}}
+
+    def arg(component_id, prop, value, triggered=False):
+        return {
+            "id": component_id,
+            "property": prop,
+            "value": value,
+            "str_id": stringify_id(component_id),
+            "triggered": triggered,
+        }
+
+    assert seen["args"] == {
+        "items": {
+            "all": [arg({"item": i}, "children", f"item {i}") for i in range(2)],
+            "new": arg({"kind": "new"}, "value", "new"),
+        },
+        "trigger": arg("add", "n_clicks", 3, True),
+        "store": arg("store", "data", "stored"),
+    }
+    assert seen["args"]["items"]["new"].id.kind == "new"
+    assert seen["outputs"] == {
+        "out": {"id": "out", "property": "children"},
+        "other": {"id": "other", "property": "title"},
+    }
+    assert seen["using"] == (True, True)
+
+
+def test_dispatch_plan_flat_callback():
+    app = Dash(__name__)
+    app.layout = html.Div()
+    seen = {}
+
+    @app.callback(Output("out", "children"), Input("in", "value"))
+    def flat(value):
+        seen["args"] = ctx.args_grouping
+        seen["outputs"] = ctx.outputs_grouping
+        seen["using"] = (ctx.using_args_grouping, ctx.using_outputs_grouping)
+        return value
+
+    response = _post(
+        app,
+        {
+            "output": "out.children",
+            "outputs": {"id": "out", "property": "children"},
+            "inputs": [{"id": "in", "property": "value", "value": 1}],
+            "changedPropIds": ["in.value"],
+        },
+    )
+    assert response == {"out": {"children": 1}}
+    assert seen["args"] == {
+        "id": "in",
+        "property": "value",
+        "value": 1,
+        "str_id": "in",
+        "triggered": True,
+    }
+    assert seen["outputs"] == {"id": "out", "property": "children"}
+    assert seen["using"] == (False, False)
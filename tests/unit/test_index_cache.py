@@ -0,0 +1,77 @@
+"""Unit tests for the cached, request independent parts of the index page."""
+from dash import Dash, Input, Output, html
+
+
+def _count_resource_collection(app, monkeypatch):
+    calls = []
+    original = app._collect_and_register_resources
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(app, "_collect_and_register_resources", counting)
+    return calls
+
+
+def test_index_cache_reused_between_requests(monkeypatch):
+    app = Dash(__name__)
+    app.layout = html.Div("Test")
+    client = app.server.test_client()
+
+    calls = _count_resource_collection(app, monkeypatch)
+
+    first = client.get("/")
+    built = len(calls)
+    assert built > 0
+
+    second = client.get("/")
+    assert len(calls) == built
+    assert first.data == second.data
+
+
+def test_index_cache_invalidated_by_assets_change(monkeypatch):
+    app = Dash(__name__)
+    app.layout = html.Div("Test")
+    client = app.server.test_client()
+    client.get("/")
+
+    calls = _count_resource_collection(app, monkeypatch)
+    app._on_assets_change("/not/an/asset.txt", 0, False)
+    client.get("/")
+    assert calls
+
+
+def test_index_cache_invalidated_by_get_dist():
+    app = Dash(__name__)
+    app.layout = html.Div("Test")
+    client = app.server.test_client()
+    client.get("/")
+    assert app._index_cache is not None
+
+    app.get_dist(["dash"])
+    assert app._index_cache is None
+
+
+def test_index_cache_picks_up_new_inline_scripts():
+    app = Dash(__name__)
+    app.layout = html.Div("Test")
+    client = app.server.test_client()
+    client.get("/")
+
+    app.clientside_callback(
+        "function(x) { return 'cached-index-inline'; }",
+        Output("out", "children"),
+        Input("in", "value"),
+    )
+    assert b"cached-index-inline" in client.get("/").data
+
+
+def test_index_title_not_cached():
+    app = Dash(__name__)
+    app.layout = html.Div("Test")
+    client = app.server.test_client()
+    client.get("/")
+
+    app.title = "Changed title"
+    assert b"<title>Changed title</title>" in client.get("/").data
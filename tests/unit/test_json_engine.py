@@ -0,0 +1,99 @@
+"""Unit tests for the pluggable JSON engine used by `dash._utils.to_json`."""
+import datetime
+import decimal
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dash import Dash, Input, Output, Patch, dcc, html
+from dash import _utils
+from dash._utils import set_json_engine, to_json
+
+
+@pytest.fixture
+def orjson_engine():
+    pytest.importorskip("orjson")
+    set_json_engine("orjson")
+    yield
+    set_json_engine(None)
+
+
+def test_orjson_engine_matches_plotly(orjson_engine):
+    patch = Patch()
+    patch.append(np.int64(3))
+    patch["a"] = pd.Series([1.5, np.nan])
+
+    values = [
+        html.Div(
+            [
+                html.P("</script>", id="p"),
+                dcc.Graph(
+                    figure={"data": [{"x": np.arange(5), "y": np.linspace(0, 1, 5)}]}
+                ),
+            ]
+        ),
+        {
+            "series": pd.Series([1, 2]),
+            "index": pd.Index(["a", "b"]),
+            "timestamp": pd.Timestamp("2020-01-01"),
+            "nat": pd.NaT,
+            "scalar": np.float32(1.5),
+            "decimal": decimal.Decimal("1.5"),
+            "strided": np.arange(6)[::2],
+            "object": np.array([1, "a"], dtype=object),
+            "date": datetime.date(2020, 1, 2),
+            "nan": float("nan"),
+            1: "int key",
+        },
+        patch,
+    ]
+
+    for value in values:
+        encoded = to_json(value)
+        assert json.loads(encoded) == json.loads(_utils._plotly_to_json(value))
+
+
+def test_orjson_engine_is_script_safe(orjson_engine):
+    encoded = to_json({"a": "</script> "})
+    assert "<" not in encoded
+    assert "/" not in encoded
+    assert " " not in encoded
+    assert json.loads(encoded) == {"a": "</script> "}
+
+
+def test_orjson_engine_falls_back_to_plotly(orjson_engine):
+    class Unknown:
+        pass
+
+    with pytest.raises(TypeError):
+        to_json({"a": Unknown()})
+
+
+def test_custom_json_engine():
+    calls = []
+
+    def engine(value):
+        calls.append(value)
+        return json.dumps(value)
+
+    app = Dash(__name__, json_engine=engine)
+    try:
+        app.layout = html.Div(id="out")
+
+        app.callback(Output("out", "children"), Input("out", "id"))(lambda v: v)
+
+        response = app.callback_map["out.children"]["callback"](
+            "out",
+            outputs_list={"id": "out", "property": "children"},
+        )
+        assert json.loads(response)["response"] == {"out": {"children": "out"}}
+        assert calls
+    finally:
+        set_json_engine(None)
+
+
+def test_invalid_json_engine():
+    with pytest.raises(ValueError):
+        set_json_engine("simplejson")
@@ -0,0 +1,65 @@
+"""Unit tests for the lazily computed request values of the callback context."""
+from dash import Dash, Input, Output, ctx, html
+from dash._callback_context import LazyContext
+from dash.backends._flask import FlaskRequestAdapter
+
+
+def test_lazy_context():
+    calls = []
+
+    def load():
+        calls.append(1)
+        return "loaded"
+
+    g = LazyContext({"lazy": load}, value=1)
+    assert "lazy" in g and "missing" not in g
+    assert g.get("missing", 2) == 2
+    assert not calls
+
+    assert g.lazy == g["lazy"] == g.get("lazy") == "loaded"
+    assert len(calls) == 1
+
+    g = LazyContext({"lazy": load}, value=1)
+    assert dict(g.resolve()) == {"value": 1, "lazy": "loaded"}
+
+
+def test_callback_reads_request_on_access(monkeypatch):
+    reads = []
+    cookies = FlaskRequestAdapter.cookies
+
+    def count_cookies(self):
+        reads.append(1)
+        return cookies.fget(self)
+
+    monkeypatch.setattr(FlaskRequestAdapter, "cookies", property(count_cookies))
+
+    app = Dash(__name__)
+    app.layout = html.Div()
+
+    @app.callback(Output("plain", "children"), Input("in", "value"))
+    def plain(value):
+        return value
+
+    @app.callback(Output("reads", "children"), Input("in", "value"))
+    def reads_context(value):
+        return [ctx.cookies.get("user"), ctx.triggered_id, ctx.inputs]
+
+    client = app.server.test_client()
+    client.set_cookie("user", "me")
+
+    def post(output):
+        return client.post(
+            "/_dash-update-component",
+            json={
+                "output": f"{output}.children",
+                "outputs": {"id": output, "property": "children"},
+                "inputs": [{"id": "in", "property": "value", "value": 1}],
+                "changedPropIds": ["in.value"],
+            },
+        ).get_json()["response"]
+
+    assert post("plain") == {"plain": {"children": 1}}
+    assert not reads
+
+    assert post("reads") == {"reads": {"children": ["me", "in", {"in.value": 1}]}}
+    assert len(reads) == 1
@@ -0,0 +1,178 @@
+"""Unit tests for the `memoize` option of callbacks."""
+import asyncio
+import json
+import time
+
+import pytest
+
+from dash import (
+    Dash,
+    DiskcacheMemoizeStore,
+    Input,
+    LRUMemoizeStore,
+    Output,
+    RedisMemoizeStore,
+    State,
+    set_props,
+)
+from dash._memoize import MISSING
+from dash.exceptions import PreventUpdate
+
+
+class FakeRedis:
+    """Local stand-in for a Redis client, only get/set are used."""
+
+    def __init__(self):
+        self.data = {}
+        self.expires = {}
+
+    def get(self, name):
+        return self.data.get(name)
+
+    def set(self, name, value, ex=None):
+        self.data[name] = value
+        self.expires[name] = ex
+
+
+def _register(app, func, memoize=True):
+    app.callback(
+        Output("out", "children"),
+        Input("in", "value"),
+        State("state", "value"),
+        memoize=memoize,
+    )(func)
+    return app.callback_map["out.children"]["callback"]
+
+
+def _call(callback, value, state="s"):
+    return callback(value, state, outputs_list={"id": "out", "property": "children"})
+
+
+def test_memoize_reuses_result():
+    calls = []
+
+    def update(value, state):
+        calls.append(value)
+        return f"{value}-{state}"
+
+    callback = _register(Dash(__name__), update)
+
+    first = _call(callback, "a")
+    assert _call(callback, "a") == first
+    assert json.loads(first)["response"]["out"]["children"] == "a-s"
+    assert calls == ["a"]
+
+    _call(callback, "b")
+    _call(callback, "a", state="other")
+    assert calls == ["a", "b", "a"]
+
+
+def test_memoize_large_arrays():
+    np = pytest.importorskip("numpy")
+    calls = []
+
+    def total(value, state):
+        calls.append(value)
+        return float(value.sum())
+
+    callback = _register(Dash(__name__), total)
+    first = np.arange(5000, dtype="float64")
+    second = first.copy()
+    # Hidden in the middle of their repr.
+    second[2500] = -1
+
+    def children(value):
+        return json.loads(_call(callback, value))["response"]["out"]["children"]
+
+    assert children(first) == first.sum()
+    assert children(second) == second.sum()
+    assert children(first.copy()) == first.sum()
+    assert len(calls) == 2
+
+
+def test_memoize_replays_set_props():
+    calls = []
+
+    def update(value, _):
+        calls.append(value)
+        set_props("side", {"children": value})
+        return value
+
+    callback = _register(Dash(__name__), update)
+
+    _call(callback, "a")
+    response = json.loads(_call(callback, "a"))
+    assert response["sideUpdate"] == {"side": {"children": "a"}}
+    assert calls == ["a"]
+
+
+def test_memoize_skips_prevent_update():
+    calls = []
+
+    def update(value, _):
+        calls.append(value)
+        raise PreventUpdate
+
+    callback = _register(Dash(__name__), update)
+
+    for _ in range(2):
+        with pytest.raises(PreventUpdate):
+            _call(callback, "a")
+    assert calls == ["a", "a"]
+
+
+def test_memoize_async():
+    calls = []
+
+    async def update(value, state):
+        calls.append(value)
+        return f"{value}-{state}"
+
+    callback = _register(Dash(__name__), update)
+
+    first = asyncio.run(_call(callback, "a"))
+    assert asyncio.run(_call(callback, "a")) == first
+    assert calls == ["a"]
+
+
+def test_memoize_custom_stores(tmp_path):
+    diskcache = pytest.importorskip("diskcache")
+    redis = FakeRedis()
+
+    for store in (
+        DiskcacheMemoizeStore(diskcache.Cache(str(tmp_path)), expire=60),
+        RedisMemoizeStore(redis, expire=60),
+    ):
+        calls = []
+
+        def update(value, _, calls=calls):
+            calls.append(value)
+            return value
+
+        callback = _register(Dash(__name__), update, memoize=store)
+        _call(callback, "a")
+        _call(callback, "a")
+        assert calls == ["a"]
+
+    assert list(redis.expires.values()) == [60]
+
+
+def test_lru_store_eviction_and_ttl():
+    store = LRUMemoizeStore(maxsize=2)
+    store.set("a", 1)
+    store.set("b", 2)
+    assert store.get("a") == 1
+    store.set("c", 3)
+    assert store.get("b") is MISSING
+    assert store.get("a") == 1
+
+    store = LRUMemoizeStore(ttl=0.01)
+    store.set("a", 1)
+    time.sleep(0.02)
+    assert store.get("a") is MISSING
+
+
+def test_memoize_invalid_options():
+    app = Dash(__name__)
+    with pytest.raises(TypeError):
+        _register(app, lambda v, s: v, memoize="yes")
@@ -0,0 +1,121 @@
+"""Unit tests for the concurrent outputs of `parallel=True` callbacks."""
+import asyncio
+import time
+
+import pytest
+
+from dash import Input, Output, ctx, set_props
+
+
+@pytest.fixture
+def body(callback_body):
+    def make(outputs):
+        return callback_body([f"{o}.children" for o in outputs], {"in.value": 2})
+
+    return make
+
+
+def test_parallel_outputs(body, empty_app, post_callback):
+    app = empty_app()
+
+    @app.callback(
+        output=dict(
+            a=Output("a", "children"),
+            group=dict(b=Output("b", "children"), c=Output("c", "children")),
+            d=Output("d", "children"),
+        ),
+        inputs=dict(value=Input("in", "value")),
+        parallel=True,
+    )
+    def update(value):
+        def slow(result):
+            time.sleep(0.3)
+            return result
+
+        def group():
+            set_props("side", {"children": ctx.triggered_id})
+            return dict(b=slow(value * 2), c=value * 3)
+
+        return dict(a=lambda: slow(value), group=group, d="plain")
+
+    start = time.perf_counter()
+    response = post_callback(app, body(["a", "b", "c", "d"])).get_json()
+    assert time.perf_counter() - start < 0.55
+    assert response["response"] == {
+        "a": {"children": 2},
+        "b": {"children": 4},
+        "c": {"children": 6},
+        "d": {"children": "plain"},
+    }
+    assert response["sideUpdate"] == {"side": {"children": "in"}}
+
+
+def test_parallel_outputs_error(body, empty_app, post_callback):
+    app = empty_app()
+    errors = []
+
+    def on_error(err):
+        errors.append(str(err))
+        return ["error", "error"]
+
+    @app.callback(
+        Output("a", "children"),
+        Output("b", "children"),
+        Input("in", "value"),
+        parallel=True,
+        on_error=on_error,
+    )
+    def update(value):
+        def fail():
+            raise ValueError("failed")
+
+        return [lambda: value, fail]
+
+    response = post_callback(app, body(["a", "b"])).get_json()
+    assert errors == ["failed"]
+    assert response["response"] == {
+        "a": {"children": "error"},
+        "b": {"children": "error"},
+    }
+
+
+def test_parallel_outputs_async(body, empty_app, post_callback_async):
+    pytest.importorskip("quart")
+    app = empty_app(backend="quart")
+
+    @app.callback(
+        Output("a", "children"),
+        Output("b", "children"),
+        Output("c", "children"),
+        Input("in", "value"),
+        parallel=True,
+    )
+    async def update(value):
+        async def slow(result):
+            await asyncio.sleep(0.3)
+            return result
+
+        def blocking():
+            time.sleep(0.3)
+            return value * 3
+
+        return [lambda: slow(value), lambda: slow(value * 2), blocking]
+
+    start = time.perf_counter()
+    response = asyncio.run(post_callback_async(app, body(["a", "b", "c"])))
+    assert time.perf_counter() - start < 0.55
+    assert response["response"] == {
+        "a": {"children": 2},
+        "b": {"children": 4},
+        "c": {"children": 6},
+    }
+
+
+def test_parallel_background_not_supported(empty_app):
+    with pytest.raises(ValueError):
+        empty_app().callback(
+            Output("a", "children"),
+            Input("in", "value"),
+            background=True,
+            parallel=True,
+        )
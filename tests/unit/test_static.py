@@ -0,0 +1,93 @@
+"""Unit tests for `dash.static` pre-encoded layout subtrees."""
+import json
+
+import pytest
+
+from dash import Dash, Input, Output, html, static
+from dash._utils import to_json
+
+
+def _footer():
+    return html.Footer(
+        [html.A(f"link {i}", href=f"/page-{i}") for i in range(5)]
+        + [html.Span("</script>", id="span")],
+        id="footer",
+    )
+
+
+def _count_encodings(monkeypatch):
+    calls = []
+    original = html.Footer._to_plotly_json
+
+    def counting(self):
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(html.Footer, "_to_plotly_json", counting)
+    return calls
+
+
+def test_static_same_json_as_regular():
+    layout = html.Div([_footer(), "content"])
+    static_layout = html.Div([static(_footer()), "content"])
+
+    assert to_json(static_layout) == to_json(layout)
+    assert to_json(static_layout) == to_json(static_layout)
+
+
+def test_static_encoded_once(monkeypatch):
+    calls = _count_encodings(monkeypatch)
+    footer = static(_footer())
+
+    for i in range(3):
+        encoded = to_json(html.Div([footer, f"page {i}"]))
+        assert json.loads(encoded)["props"]["children"][1] == f"page {i}"
+
+    assert len(calls) == 1
+
+
+def test_static_frozen_until_marked_again():
+    footer = static(_footer())
+    to_json(footer)
+
+    footer.id = "changed"
+    assert json.loads(to_json(footer))["props"]["id"] == "footer"
+
+    static(footer)
+    assert json.loads(to_json(footer))["props"]["id"] == "changed"
+
+
+def test_static_nested():
+    inner = static(html.Span("inner", id="inner"))
+    outer = static(html.Div([inner, html.Span("outer")]))
+
+    regular = html.Div([html.Span("inner", id="inner"), html.Span("outer")])
+    assert to_json(html.Div(outer)) == to_json(html.Div(regular))
+
+
+def test_static_to_plotly_json_outside_to_json():
+    footer = static(_footer())
+    assert footer.to_plotly_json()["type"] == "Footer"
+
+
+def test_static_serve_layout_and_callback():
+    app = Dash(__name__)
+    footer = static(_footer())
+    app.layout = lambda: html.Div([html.Div(id="out"), footer])
+
+    app.callback(Output("out", "children"), Input("out", "id"))(lambda _: footer)
+
+    client = app.server.test_client()
+    layout = client.get("/_dash-layout").get_json()
+    assert layout["props"]["children"][1]["props"]["id"] == "footer"
+
+    response = app.callback_map["out.children"]["callback"](
+        "out", outputs_list={"id": "out", "property": "children"}
+    )
+    children = json.loads(response)["response"]["out"]["children"]
+    assert children["props"]["id"] == "footer"
+
+
+def test_static_requires_component():
+    with pytest.raises(TypeError):
+        static({"props": {}})
@@ -0,0 +1,113 @@
+"""Unit tests for the streamed callback responses, `stream_response=True`."""
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from dash import Input, Output, ctx, dcc, html, static
+from dash._streaming import CHUNK_SIZE, JSONStream
+from dash._utils import to_json
+from dash.exceptions import InvalidCallbackReturnValue
+
+ROWS = [{"id": i, "name": f"row <{i}>"} for i in range(CHUNK_SIZE * 2 + 5)]
+
+
+def test_json_stream_encoding():
+    value = {
+        "rows": ROWS,
+        "tuple": tuple(range(CHUNK_SIZE + 1)),
+        "array": np.arange(CHUNK_SIZE * 3, dtype="float64").reshape(-1, 3),
+        "empty": [],
+        1: "int key",
+        "layout": html.Div(
+            [dcc.Graph(figure={"data": [{"y": np.arange(5)}]}), "text"],
+            id="div",
+        ),
+        "static": static(html.Footer("footer")),
+    }
+    chunks = list(JSONStream(value))
+    assert len(chunks) > 1
+    assert "".join(chunks) == str(JSONStream(value))
+    assert json.loads(str(JSONStream(value))) == json.loads(to_json(value))
+
+    typed = {"array": np.arange(CHUNK_SIZE * 2, dtype="float32"), "rows": ROWS[:3]}
+    assert json.loads(str(JSONStream(typed, typed_arrays=True))) == json.loads(
+        to_json(typed, typed_arrays=True)
+    )
+
+
+@pytest.fixture
+def body(callback_body):
+    return callback_body("table.data", {"export.n_clicks": 1})
+
+
+@pytest.fixture
+def export_app(empty_app):
+    def make(**kwargs):
+        app = empty_app(**kwargs)
+
+        @app.callback(
+            Output("table", "data"), Input("export", "n_clicks"), stream_response=True
+        )
+        def export(_):
+            ctx.response.set_cookie("exported", "1")
+            return ROWS
+
+        return app
+
+    return make
+
+
+def test_stream_response_flask(body, export_app, post_callback):
+    response = post_callback(export_app(), body)
+    assert response.is_streamed
+    assert "exported=1" in response.headers["Set-Cookie"]
+    assert response.get_json() == {"multi": True, "response": {"table": {"data": ROWS}}}
+
+
+def test_stream_response_invalid_value(caplog, body, empty_app, post_callback):
+    app = empty_app()
+
+    @app.callback(
+        Output("table", "data"), Input("export", "n_clicks"), stream_response=True
+    )
+    def export(_):
+        return [*ROWS, {"cell": object()}]
+
+    # Failed before the response is sent.
+    response = post_callback(app, body)
+    assert response.status_code == 500
+    assert InvalidCallbackReturnValue.__name__ in caplog.text
+
+    with pytest.raises(TypeError):
+        JSONStream({object(): 1})
+
+
+def test_stream_response_chained(body, export_app, post_callback):
+    app = export_app(chain_callbacks=True)
+
+    @app.callback(Output("count", "children"), Input("table", "data"))
+    def count(data):
+        return len(data)
+
+    assert post_callback(app, body).get_json()["response"] == {
+        "table": {"data": ROWS},
+        "count": {"children": len(ROWS)},
+    }
+
+
+def test_stream_response_quart(body, export_app, post_callback_async):
+    pytest.importorskip("quart")
+    from quart.wrappers.response import IterableBody
+
+    from dash.backends._quart import QuartResponseAdapter
+
+    app = export_app(backend="quart")
+    assert asyncio.run(post_callback_async(app, body)) == {
+        "multi": True,
+        "response": {"table": {"data": ROWS}},
+    }
+    response = QuartResponseAdapter().set_response(data=JSONStream(ROWS))
+    assert isinstance(response.response, IterableBody)
+    assert "Content-Length" not in response.headers
@@ -0,0 +1,156 @@
+"""Unit tests for dropping the callback requests superseded by a newer one."""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dash import MATCH, Input, Output, ctx
+
+
+@pytest.fixture
+def body(callback_body):
+    def make(value, generation=None, session="page"):
+        extra = {} if generation is None else {"generation": [session, generation]}
+        return callback_body("out.children", {"slider.value": value}, **extra)
+
+    return make
+
+
+@pytest.fixture
+def sync_app(empty_app):
+    def make(calls):
+        app = empty_app()
+        started = threading.Event()
+
+        @app.callback(Output("out", "children"), Input("slider", "value"))
+        def compute(value):
+            calls.append(value)
+            started.set()
+            for _ in range(50):
+                if ctx.cancelled:
+                    return "stale"
+                time.sleep(0.02)
+            return value
+
+        return app, started
+
+    return make
+
+
+def test_superseded_sync_callback(body, sync_app, post_callback):
+    calls = []
+    app, started = sync_app(calls)
+
+    with ThreadPoolExecutor(1) as pool:
+        first = pool.submit(post_callback, app, body(1, 1))
+        started.wait(5)
+        start = time.perf_counter()
+        assert post_callback(app, body(2, 2)).get_json() == {
+            "multi": True,
+            "response": {"out": {"children": 2}},
+        }
+        # The first request stopped once superseded, without a response.
+        assert first.result().status_code == 204
+        assert time.perf_counter() - start < 1.5
+
+    # A request arriving after a newer one doesn't run.
+    app._generations.begin("page", "out.children", 5)
+    assert post_callback(app, body(3, 4)).status_code == 204
+    assert calls == [1, 2]
+
+
+def test_generations_are_per_page(body, sync_app, post_callback):
+    calls = []
+    app, started = sync_app(calls)
+
+    with ThreadPoolExecutor(1) as pool:
+        first = pool.submit(post_callback, app, body(1, 1, session="a"))
+        started.wait(5)
+        assert post_callback(app, body(2, 1, session="b")).status_code == 200
+        assert post_callback(app, body(3)).status_code == 200
+        assert first.result().status_code == 200
+    assert not app._generations._latest
+
+
+def test_generations_are_per_match_instance(empty_app, post_callback):
+    app = empty_app()
+    started = threading.Barrier(2)
+
+    @app.callback(
+        Output({"type": "out", "index": MATCH}, "children"),
+        Input({"type": "slider", "index": MATCH}, "value"),
+    )
+    def compute(value):
+        started.wait(5)
+        time.sleep(0.1)
+        return "stale" if ctx.cancelled else value
+
+    def body(index):
+        return {
+            "output": '{"index":["MATCH"],"type":"out"}.children',
+            "outputs": {"id": {"type": "out", "index": index}, "property": "children"},
+            "inputs": [
+                {
+                    "id": {"type": "slider", "index": index},
+                    "property": "value",
+                    "value": index * 10,
+                }
+            ],
+            "changedPropIds": [f'{{"index":{index},"type":"slider"}}.value'],
+            "generation": ["page", 1],
+        }
+
+    with ThreadPoolExecutor(2) as pool:
+        responses = list(
+            pool.map(lambda index: post_callback(app, body(index)), [1, 2])
+        )
+
+    assert [response.status_code for response in responses] == [200, 200]
+    assert [
+        list(response.get_json()["response"].values()) for response in responses
+    ] == [
+        [{"children": 10}],
+        [{"children": 20}],
+    ]
+    assert not app._generations._latest
+
+
+def test_superseded_async_callback(body, empty_app, post_callback_async):
+    pytest.importorskip("quart")
+    app = empty_app(backend="quart")
+    finished = []
+
+    @app.callback(Output("out", "children"), Input("slider", "value"))
+    async def compute(value):
+        await asyncio.sleep(0.5 if value == 1 else 0)
+        finished.append(value)
+        return value
+
+    async def run():
+        first = asyncio.ensure_future(post_callback_async(app, body(1, 1)))
+        await asyncio.sleep(0.1)
+        return await asyncio.gather(first, post_callback_async(app, body(2, 2)))
+
+    # The first request was superseded, without a response.
+    assert asyncio.run(run()) == [
+        None,
+        {"multi": True, "response": {"out": {"children": 2}}},
+    ]
+    # The first callback was cancelled.
+    assert finished == [2]
+    assert not app._generations._latest
+
+
+def test_generation_ended_on_error(monkeypatch, body, sync_app, post_callback):
+    calls = []
+    app, _ = sync_app(calls)
+
+    def fail(inputs):
+        raise ValueError(f"invalid inputs {inputs}")
+
+    monkeypatch.setattr(app, "_inputs_to_vals", fail)
+    assert post_callback(app, body(1, 1)).status_code == 500
+    assert not calls
+    assert not app._generations._latest
@@ -0,0 +1,97 @@
+"""Unit tests for the binary encoding of numeric arrays, `binary_arrays=True`."""
+import base64
+import json
+
+import numpy as np
+import pandas as pd
+
+from dash import Dash, Input, Output, State, dcc, html
+from dash._typed_arrays import decode
+from dash._utils import to_json
+
+
+def _spec(array, dtype):
+    return {"dtype": dtype, "bdata": base64.b64encode(array.tobytes()).decode()}
+
+
+def test_to_json_typed_arrays():
+    floats = np.linspace(0, 1, 5)
+    value = {
+        "floats": floats,
+        "ints": np.array([1, 2, 300]),
+        "matrix": np.arange(6, dtype="float32").reshape(2, 3),
+        "series": pd.Series([1.5, 2.5]),
+        "bools": np.array([True, False]),
+        "dates": pd.Series(pd.to_datetime(["2024-01-01"])),
+        "graph": dcc.Graph(figure={"data": [{"y": floats}]}),
+        "scalar": np.float64(1.5),
+    }
+    encoded = json.loads(to_json(value, typed_arrays=True))
+
+    assert encoded["floats"] == _spec(floats, "f8")
+    assert encoded["ints"] == _spec(np.array([1, 2, 300], dtype="int16"), "i2")
+    assert encoded["matrix"] == dict(
+        _spec(np.arange(6, dtype="float32"), "f4"), shape="2, 3"
+    )
+    assert encoded["series"] == _spec(np.array([1.5, 2.5]), "f8")
+    assert encoded["bools"] == [True, False]
+    assert encoded["dates"] == ["2024-01-01T00:00:00"]
+    assert encoded["graph"]["props"]["figure"]["data"][0]["y"] == encoded["floats"]
+    assert encoded["scalar"] == 1.5
+
+    # Same output as the default encoding without arrays.
+    assert to_json({"a": [1, None]}, typed_arrays=True) == to_json({"a": [1, None]})
+    assert json.loads(to_json({"nan": float("nan")}, typed_arrays=True)) == {
+        "nan": None
+    }
+
+
+def test_decode_typed_arrays():
+    matrix = np.arange(6, dtype="int32").reshape(2, 3)
+    value = decode(
+        {
+            "a": [{"x": dict(_spec(matrix, "i4"), shape="2, 3")}, 1],
+            "b": [1, 2],
+            "c": {"dtype": "f8", "bdata": "AA==", "other": 1, "extra": 2},
+        }
+    )
+    np.testing.assert_array_equal(value["a"][0]["x"], matrix)
+    value["a"][0]["x"][0, 0] = 10
+    assert value["b"] == [1, 2]
+    assert value["c"] == {"dtype": "f8", "bdata": "AA==", "other": 1, "extra": 2}
+
+
+def test_binary_arrays_callback():
+    app = Dash(__name__, binary_arrays=True)
+    app.layout = html.Div()
+    seen = {}
+
+    @app.callback(
+        Output("graph", "figure"),
+        Input("store", "data"),
+        State("other", "data"),
+    )
+    def update(data, other):
+        seen["args"] = data, other
+        return {"data": [{"y": data["y"] * 2}]}
+
+    y = np.array([1.0, 2.0, 3.0])
+    response = app.server.test_client().post(
+        "/_dash-update-component",
+        json={
+            "output": "graph.figure",
+            "outputs": {"id": "graph", "property": "figure"},
+            "inputs": [
+                {"id": "store", "property": "data", "value": {"y": _spec(y, "f8")}}
+            ],
+            "state": [{"id": "other", "property": "data", "value": [1, 2]}],
+            "changedPropIds": ["store.data"],
+        },
+    )
+    data, other = seen["args"]
+    np.testing.assert_array_equal(data["y"], y)
+    assert other == [1, 2]
+    assert response.get_json()["response"] == {
+        "graph": {"figure": {"data": [{"y": _spec(y * 2, "f8")}]}}
+    }
+    assert app._config()["binary_arrays"] is True
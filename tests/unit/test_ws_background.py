@@ -0,0 +1,137 @@
+"""Unit tests for the WebSocket push of background callback updates."""
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import janus
+import pytest
+
+from dash import Input, Output
+from dash.background_callback.managers import BaseBackgroundCallbackManager
+from dash.backends.ws import FLUSH_SIGNAL, watch_background_job
+
+
+class FakeManager(BaseBackgroundCallbackManager):
+    """Job state set by the test, notifies the subscribers if `push`."""
+
+    def __init__(self, push):
+        super().__init__(None)
+        self.push = push
+        self.progress = None
+        self.props = {}
+        self.done = False
+        self.notify = None
+
+    def register(self, key, fn, progress):
+        pass
+
+    def publish(self, progress=None, props=None, done=False):
+        self.progress = progress or self.progress
+        self.props = props or self.props
+        self.done = done
+        if self.notify:
+            self.notify()
+
+    def subscribe(self, key, notify):
+        if not self.push:
+            return None
+        self.notify = notify
+        return lambda: setattr(self, "notify", None)
+
+    def get_progress(self, key):
+        progress, self.progress = self.progress, None
+        return progress
+
+    def get_updated_props(self, key):
+        props, self.props = self.props, {}
+        return props
+
+    def result_ready(self, key):
+        return self.done
+
+    def job_running(self, job):
+        return True
+
+
+@pytest.fixture
+def job_app(empty_app):
+    def make(manager):
+        app = empty_app(background_callback_manager=manager)
+
+        @app.callback(
+            Output("result", "children"),
+            Input("start", "n_clicks"),
+            background=True,
+            progress=Output({"type": "bar"}, "value"),
+            interval=50,
+        )
+        def job(set_progress, _):
+            return "done"
+
+        return app
+
+    return make
+
+
+def _watch(app, manager, output="result.children"):
+    async def run():
+        outbound = janus.Queue()
+        task = asyncio.create_task(
+            watch_background_job(
+                app,
+                {"output": output, "cacheKey": "key", "job": "1"},
+                "renderer",
+                "request",
+                outbound,
+                threading.Event(),
+                ThreadPoolExecutor(1),
+            )
+        )
+        await asyncio.sleep(0.02)
+        manager.publish(progress=[10], props={"other": {"children": "hi"}})
+        await asyncio.sleep(0.02)
+        manager.publish(done=True)
+        await asyncio.wait_for(task, 5)
+
+        messages = []
+        while not outbound.async_q.empty():
+            message = outbound.async_q.get_nowait()
+            if message != FLUSH_SIGNAL:
+                messages.append(json.loads(message))
+        return messages
+
+    return asyncio.run(run())
+
+
+def test_watch_background_job_pushes_updates(job_app):
+    for push in (True, False):
+        manager = FakeManager(push)
+        messages = _watch(job_app(manager), manager)
+        assert messages == [
+            {
+                "type": "set_props",
+                "rendererId": "renderer",
+                "payload": {
+                    "componentId": '{"type":"bar"}',
+                    "props": {"value": 10},
+                },
+            },
+            {
+                "type": "set_props",
+                "rendererId": "renderer",
+                "payload": {"componentId": "other", "props": {"children": "hi"}},
+            },
+            {
+                "type": "background_done",
+                "rendererId": "renderer",
+                "requestId": "request",
+            },
+        ]
+        assert manager.notify is None
+
+
+def test_watch_background_job_unknown_callback(job_app):
+    manager = FakeManager(True)
+    messages = _watch(job_app(manager), manager, output="missing.children")
+    assert [m["type"] for m in messages] == ["background_done"]